@@ -0,0 +1,176 @@
+"""
+越界检测模式基准测试
+
+在所有参与者每个 tick 都在移动的情况下，比较三种越界检测模式每个 tick 的耗时：
+- polling: 按到边缘距离安排的轮询（boundary_schedule.py + bounds.py）
+- event:   每个移动事件与竞技区域包围盒比较，非参与者的移动事件直接返回
+- hybrid:  移动事件检测 + 每 maxInterval 个 tick 一次的兜底轮询
+
+读取玩家位置用构造一个新的位置对象来模拟；每个 tick 另有与参与者同样多的
+大厅玩家产生移动事件，用来体现快速过滤的开销。
+
+用法: python benchmarks/bench_boundary_modes.py
+"""
+import importlib.util
+import os
+import random
+import time
+
+# 直接按文件加载模块，避免包的 __init__ 导入 endstone
+_SRC = os.path.join(os.path.dirname(__file__), "..", "src", "endstone_easyhotpotato")
+
+
+def _load(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_SRC, name + ".py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bounds = _load("bounds")
+boundary_schedule = _load("boundary_schedule")
+spatial = _load("spatial")
+
+ARENA_COUNT = 4
+HALF_SIZE = 30
+TOLERANCE = 2.0
+SPEED = 0.35
+SIZES = (50, 200, 1000)
+TICKS = 200
+
+
+class _Location:
+    __slots__ = ("dimension", "x", "y", "z")
+
+    def __init__(self, x, z):
+        self.dimension = 0
+        self.x = x
+        self.y = 64.0
+        self.z = z
+
+
+class _Player:
+    __slots__ = ("id", "x", "z", "vx", "vz", "cx")
+
+    def __init__(self, player_id, cx, rng):
+        self.id = player_id
+        self.cx = cx
+        self.x = cx + rng.uniform(-HALF_SIZE, HALF_SIZE)
+        self.z = rng.uniform(-HALF_SIZE, HALF_SIZE)
+        self.vx = rng.uniform(-SPEED, SPEED)
+        self.vz = rng.uniform(-SPEED, SPEED)
+
+    @property
+    def location(self):
+        # 模拟读取位置的接口调用
+        return _Location(self.x, self.z)
+
+    def move(self):
+        # 在竞技区域内来回移动，不产生越界
+        self.x += self.vx
+        self.z += self.vz
+        if abs(self.x - self.cx) > HALF_SIZE:
+            self.vx = -self.vx
+        if abs(self.z) > HALF_SIZE:
+            self.vz = -self.vz
+
+
+class _Arena:
+    def __init__(self, index):
+        self.key = (spatial.REGION_ARENA, index)
+        self.game_active = True
+
+
+def _build(n):
+    rng = random.Random(n)
+    index = spatial.SpatialGrid()
+    arenas = []
+    for i in range(ARENA_COUNT):
+        arena = _Arena(i)
+        cx = i * 200
+        index.set_region(spatial.Region(
+            arena.key, spatial.REGION_ARENA, 0,
+            cx - HALF_SIZE - TOLERANCE, -HALF_SIZE - TOLERANCE,
+            cx + HALF_SIZE + TOLERANCE, HALF_SIZE + TOLERANCE, owner=arena
+        ))
+        arenas.append(arena)
+
+    participants = []
+    player_arena = {}
+    for i in range(n):
+        arena = arenas[i % ARENA_COUNT]
+        player = _Player(i, (i % ARENA_COUNT) * 200, rng)
+        participants.append(player)
+        player_arena[player.id] = arena
+    # 同样数量的大厅玩家，只产生会被快速过滤的移动事件
+    lobby = [_Player(n + i, -1000, rng) for i in range(n)]
+    # 与插件一样缓存所有竞技区域的包围盒
+    slots = {arena.key: i for i, arena in enumerate(arenas)}
+    arena_bounds = bounds.ArenaBounds([index.get_region(arena.key) for arena in arenas])
+    return index, arena_bounds, slots, participants, player_arena, lobby
+
+
+def _polling_tick(schedule, arena_bounds, slots, participants_by_id, player_arena, now):
+    due = schedule.pop_due(now)
+    if not due:
+        return
+    batch = bounds.BoundsBatch()
+    for player_id in due:
+        player = participants_by_id[player_id]
+        loc = player.location
+        batch.add(player, slots[player_arena[player_id].key], 0, loc.x, loc.z)
+    for i, distance in enumerate(bounds.edge_distances(batch, arena_bounds)):
+        schedule.reschedule(batch.players[i].id, now, distance)
+
+
+def _move_event(index, player_arena, player):
+    arena = player_arena.get(player.id)
+    if arena is None or not arena.game_active:
+        return
+    to = player.location
+    region = index.get_region(arena.key)
+    if region is not None and not region.contains(0, to.x, to.z):
+        raise AssertionError("benchmark players should stay in bounds")
+
+
+def _run(n, mode):
+    index, arena_bounds, slots, participants, player_arena, lobby = _build(n)
+    participants_by_id = {player.id: player for player in participants}
+    schedule = boundary_schedule.BoundarySchedule()
+    schedule.mode = mode
+    for player in participants:
+        schedule.add(player.id, 0)
+
+    movers = participants + lobby
+    elapsed = 0.0
+    for now in range(1, TICKS + 1):
+        for player in movers:
+            player.move()
+
+        start = time.perf_counter()
+        if schedule.listens:
+            for player in movers:
+                _move_event(index, player_arena, player)
+        if schedule.polls:
+            _polling_tick(schedule, arena_bounds, slots, participants_by_id, player_arena, now)
+        elapsed += time.perf_counter() - start
+    return elapsed / TICKS * 1e6, schedule.checks
+
+
+def main():
+    modes = boundary_schedule.BOUNDARY_MODES
+    print(f"NumPy 可用: {bounds.HAS_NUMPY}，每个 tick 所有参与者都在移动，另有同样数量的大厅玩家")
+    print(f"{'参与者':>6} " + " ".join(f"{mode:>10}" for mode in modes) + "  (us/tick)    轮询检查次数/tick")
+    for n in SIZES:
+        costs = []
+        checks = []
+        for mode in modes:
+            cost, polled = min(_run(n, mode) for _ in range(3))
+            costs.append(cost)
+            checks.append(polled / TICKS)
+        print(f"{n:>6} " + " ".join(f"{cost:10.1f}" for cost in costs)
+              + "              " + " / ".join(f"{c:.1f}" for c in checks))
+
+
+if __name__ == "__main__":
+    main()
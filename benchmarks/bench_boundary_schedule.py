@@ -0,0 +1,161 @@
+"""
+越界检查时间表基准测试
+
+在所有参与者每个 tick 都在移动的情况下，比较每个 tick 的越界检测耗时：
+- legacy:  原先每个 tick 逐个玩家读取位置、读取配置字典并计算 abs 的实现
+- python:  插件当前的实现，只检查时间表中到期的玩家（boundary_schedule.py），
+           用 bounds.edge_distances 的纯 Python 回退实现计算到边缘的距离并重新安排
+- numpy:   同上，到期人数达到 bounds.NUMPY_MIN_BATCH 时使用 edge_distances 的向量化实现
+
+读取玩家位置用构造一个新的位置对象来模拟；耗时包含读取位置与构造批次的开销，
+包围盒与插件一样只生成一次。
+
+用法: python benchmarks/bench_boundary_schedule.py
+"""
+import importlib.util
+import os
+import random
+import time
+
+# 直接按文件加载模块，避免包的 __init__ 导入 endstone
+_SRC = os.path.join(os.path.dirname(__file__), "..", "src", "endstone_easyhotpotato")
+
+
+def _load(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_SRC, name + ".py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bounds = _load("bounds")
+boundary_schedule = _load("boundary_schedule")
+
+ARENA_COUNT = 4
+HALF_SIZE = 30
+TOLERANCE = 2.0
+SPEED = 0.35
+SIZES = (50, 200, 1000)
+TICKS = 200
+
+
+class _Region:
+    def __init__(self, dim, cx, cz, half):
+        self.dim = dim
+        self.min_x = cx - half - TOLERANCE
+        self.min_z = cz - half - TOLERANCE
+        self.max_x = cx + half + TOLERANCE
+        self.max_z = cz + half + TOLERANCE
+
+
+class _Location:
+    __slots__ = ("dimension", "x", "z")
+
+    def __init__(self, x, z):
+        self.dimension = 0
+        self.x = x
+        self.z = z
+
+
+class _Player:
+    __slots__ = ("id", "index", "cx", "x", "z", "vx", "vz")
+
+    def __init__(self, player_id, index, rng):
+        self.id = player_id
+        self.index = index
+        self.cx = index * 200
+        self.x = self.cx + rng.uniform(-HALF_SIZE, HALF_SIZE)
+        self.z = rng.uniform(-HALF_SIZE, HALF_SIZE)
+        self.vx = rng.uniform(-SPEED, SPEED)
+        self.vz = rng.uniform(-SPEED, SPEED)
+
+    @property
+    def location(self):
+        # 模拟读取位置的接口调用
+        return _Location(self.x, self.z)
+
+    def move(self):
+        # 在竞技区域内来回移动，不产生越界
+        self.x += self.vx
+        self.z += self.vz
+        if abs(self.x - self.cx) > HALF_SIZE:
+            self.vx = -self.vx
+        if abs(self.z) > HALF_SIZE:
+            self.vz = -self.vz
+
+
+def _build(n):
+    rng = random.Random(n)
+    arenas = [{"gamePos": {"x": i * 200, "z": 0, "dimid": 0}, "areaSize": {"x": HALF_SIZE, "z": HALF_SIZE}}
+              for i in range(ARENA_COUNT)]
+    regions = [_Region(0, i * 200, 0, HALF_SIZE) for i in range(ARENA_COUNT)]
+    players = [_Player(i, i % ARENA_COUNT, rng) for i in range(n)]
+    return arenas, regions, players
+
+
+def _legacy_tick(arenas, players):
+    result = []
+    for player in players:
+        loc = player.location
+        game_pos = arenas[player.index]["gamePos"]
+        area_size = arenas[player.index]["areaSize"]
+        if (loc.dimension != game_pos.get("dimid", 0)
+                or abs(loc.x - game_pos["x"]) > area_size["x"] + TOLERANCE
+                or abs(loc.z - game_pos["z"]) > area_size["z"] + TOLERANCE):
+            result.append(player)
+    return result
+
+
+def _scheduled_tick(schedule, arena_bounds, players_by_id, now, use_numpy):
+    due = schedule.pop_due(now)
+    if not due:
+        return []
+    batch = bounds.BoundsBatch()
+    for player_id in due:
+        player = players_by_id[player_id]
+        loc = player.location
+        batch.add(player, player.index, loc.dimension, loc.x, loc.z)
+    result = []
+    for i, distance in enumerate(bounds.edge_distances(batch, arena_bounds, use_numpy=use_numpy)):
+        if distance < 0:
+            result.append(batch.players[i])
+        else:
+            schedule.reschedule(batch.players[i].id, now, distance)
+    return result
+
+
+def _run(n, mode):
+    arenas, regions, players = _build(n)
+    arena_bounds = bounds.ArenaBounds(regions)
+    players_by_id = {player.id: player for player in players}
+    schedule = boundary_schedule.BoundarySchedule()
+    for player in players:
+        schedule.add(player.id, 0)
+
+    elapsed = 0.0
+    for now in range(1, TICKS + 1):
+        for player in players:
+            player.move()
+        start = time.perf_counter()
+        if mode == "legacy":
+            out = _legacy_tick(arenas, players)
+        else:
+            out = _scheduled_tick(schedule, arena_bounds, players_by_id, now, mode == "numpy")
+        elapsed += time.perf_counter() - start
+        assert not out, "benchmark players should stay in bounds"
+    checks = n * TICKS if mode == "legacy" else schedule.checks
+    return elapsed / TICKS * 1e6, checks / TICKS
+
+
+def main():
+    modes = ["legacy", "python"] + (["numpy"] if bounds.HAS_NUMPY else [])
+    print(f"NumPy 可用: {bounds.HAS_NUMPY}，每个 tick 所有参与者都在移动")
+    print(f"{'参与者':>6} " + " ".join(f"{mode:>10}" for mode in modes) + "  (us/tick)    检查次数/tick")
+    for n in SIZES:
+        results = [min(_run(n, mode) for _ in range(3)) for mode in modes]
+        print(f"{n:>6} " + " ".join(f"{cost:10.1f}" for cost, _ in results)
+              + "              " + " / ".join(f"{checks:.1f}" for _, checks in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+越界检测基准测试
+
+对同一批参与者计算是否越界，比较一次检测的耗时：
+- numpy:   bounds.edge_distances 的向量化实现
+- python:  bounds.edge_distances 的纯 Python 回退实现
+- legacy:  原先逐个玩家读取配置字典并计算 abs 的实现
+
+"收集+检测" 包含构造批次与包围盒的开销；"仅检测" 只计算批次构造完成后的比较。
+
+用法: python benchmarks/bench_bounds.py
+"""
+import importlib.util
+import os
+import random
+import timeit
+
+# 直接按文件加载 bounds.py，避免包的 __init__ 导入 endstone
+_SRC = os.path.join(os.path.dirname(__file__), "..", "src", "endstone_easyhotpotato")
+
+
+def _load(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_SRC, name + ".py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bounds = _load("bounds")
+
+ARENA_COUNT = 4
+TOLERANCE = 2.0
+SIZES = (50, 200, 1000)
+
+
+class _Region:
+    def __init__(self, dim, cx, cz, half):
+        self.dim = dim
+        self.min_x = cx - half - TOLERANCE
+        self.min_z = cz - half - TOLERANCE
+        self.max_x = cx + half + TOLERANCE
+        self.max_z = cz + half + TOLERANCE
+
+
+def _build(n):
+    rng = random.Random(n)
+    arenas = []
+    for i in range(ARENA_COUNT):
+        arenas.append({"gamePos": {"x": i * 200, "z": 0, "dimid": 0}, "areaSize": {"x": 30, "z": 30}})
+    regions = [_Region(0, a["gamePos"]["x"], 0, 30) for a in arenas]
+
+    players = []
+    for i in range(n):
+        index = i % ARENA_COUNT
+        # 约 5% 的玩家在区域外
+        spread = 40 if rng.random() < 0.05 else 28
+        x = arenas[index]["gamePos"]["x"] + rng.uniform(-spread, spread)
+        z = rng.uniform(-spread, spread)
+        players.append((index, 0, x, z))
+    return arenas, regions, players
+
+
+def _legacy(arenas, players):
+    result = []
+    for i, (index, dim, x, z) in enumerate(players):
+        game_pos = arenas[index]["gamePos"]
+        area_size = arenas[index]["areaSize"]
+        if (dim != game_pos.get("dimid", 0)
+                or abs(x - game_pos["x"]) > area_size["x"] + TOLERANCE
+                or abs(z - game_pos["z"]) > area_size["z"] + TOLERANCE):
+            result.append(i)
+    return result
+
+
+def _out_of_bounds(batch, arena_bounds, use_numpy):
+    distances = bounds.edge_distances(batch, arena_bounds, use_numpy=use_numpy)
+    return [batch.players[i] for i, distance in enumerate(distances) if distance < 0]
+
+
+def _batched(regions, players, use_numpy):
+    batch = bounds.BoundsBatch()
+    for player, (index, dim, x, z) in enumerate(players):
+        batch.add(player, index, dim, x, z)
+    return _out_of_bounds(batch, bounds.ArenaBounds(regions), use_numpy)
+
+
+def _prepare(regions, players):
+    batch = bounds.BoundsBatch()
+    for player, (index, dim, x, z) in enumerate(players):
+        batch.add(player, index, dim, x, z)
+    return batch, bounds.ArenaBounds(regions)
+
+
+def _time(func, number=2000):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    print(f"NumPy 可用: {bounds.HAS_NUMPY}")
+    print(f"{'参与者':>6} {'legacy':>9} | {'收集+检测 python':>14} {'numpy':>9} | {'仅检测 python':>12} {'numpy':>9}  (us/tick)")
+    for n in SIZES:
+        arenas, regions, players = _build(n)
+        expected = _legacy(arenas, players)
+        assert _batched(regions, players, False) == expected
+        batch, arena_bounds = _prepare(regions, players)
+
+        legacy = _time(lambda: _legacy(arenas, players))
+        python = _time(lambda: _batched(regions, players, False))
+        python_check = _time(lambda: _out_of_bounds(batch, arena_bounds, False))
+        if bounds.HAS_NUMPY:
+            assert _batched(regions, players, True) == expected
+            numpy = f"{_time(lambda: _batched(regions, players, True)):9.1f}"
+            numpy_check = f"{_time(lambda: _out_of_bounds(batch, arena_bounds, True)):9.1f}"
+        else:
+            numpy = numpy_check = f"{'-':>9}"
+        print(f"{n:>6} {legacy:9.1f} | {python:14.1f} {numpy} | {python_check:12.1f} {numpy_check}")
+
+
+if __name__ == "__main__":
+    main()
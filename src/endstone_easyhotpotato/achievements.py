@@ -0,0 +1,209 @@
+"""
+成就与连胜
+
+成就进度保存在每位玩家的战绩字典中（progress 与 achievements 字段），
+由山芋转移、玩家淘汰和游戏结束事件增量更新：每个事件只修改相关玩家的进度，
+并只检查与该进度相关的成就，不需要回头扫描战局记录。
+"""
+import time
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+# 进度字段
+PROGRESS_WIN_STREAK = "win_streak"  # 当前连胜
+PROGRESS_BEST_WIN_STREAK = "best_win_streak"  # 最高连胜
+PROGRESS_EXPLOSIONS_SURVIVED = "explosions_survived"  # 在场时躲过的爆炸次数
+PROGRESS_FASTEST_PASS = "fastest_pass"  # 拿到山芋到击中传出的最短时间（秒）
+PROGRESS_UNTOUCHED_GAMES = "untouched_games"  # 从未持有山芋并坚持到结束的对局数
+
+DEFAULT_PROGRESS = {
+    PROGRESS_WIN_STREAK: 0,
+    PROGRESS_BEST_WIN_STREAK: 0,
+    PROGRESS_EXPLOSIONS_SURVIVED: 0,
+    PROGRESS_FASTEST_PASS: None,
+    PROGRESS_UNTOUCHED_GAMES: 0,
+}
+
+
+class Achievement:
+    """达到某项进度阈值时解锁的成就"""
+
+    __slots__ = ("id", "name", "description", "progress", "threshold", "lower_is_better")
+
+    def __init__(self, achievement_id: str, name: str, description: str, progress: str, threshold: float,
+                 lower_is_better: bool = False):
+        """
+        初始化成就
+
+        Args:
+            achievement_id: 成就ID
+            name: 显示名称
+            description: 描述
+            progress: 对应的进度字段
+            threshold: 解锁阈值
+            lower_is_better: 进度不高于阈值时解锁（例如最短时间）
+        """
+        self.id = achievement_id
+        self.name = name
+        self.description = description
+        self.progress = progress
+        self.threshold = threshold
+        self.lower_is_better = lower_is_better
+
+    def reached(self, value) -> bool:
+        """判断进度是否达到阈值"""
+        if value is None:
+            return False
+        return value <= self.threshold if self.lower_is_better else value >= self.threshold
+
+
+ACHIEVEMENTS = (
+    Achievement("win_streak_3", "三连胜", "连续赢下 3 局游戏", PROGRESS_BEST_WIN_STREAK, 3),
+    Achievement("win_streak_5", "五连胜", "连续赢下 5 局游戏", PROGRESS_BEST_WIN_STREAK, 5),
+    Achievement("survivor_10", "幸存者", "在场时躲过 10 次山芋爆炸", PROGRESS_EXPLOSIONS_SURVIVED, 10),
+    Achievement("survivor_50", "不死之身", "在场时躲过 50 次山芋爆炸", PROGRESS_EXPLOSIONS_SURVIVED, 50),
+    Achievement("quick_hands", "烫手", "拿到山芋后 1 秒内传给别人", PROGRESS_FASTEST_PASS, 1.0, lower_is_better=True),
+    Achievement("untouched", "片叶不沾身", "从未持有山芋并坚持到游戏结束", PROGRESS_UNTOUCHED_GAMES, 1),
+)
+
+# 进度字段 -> 相关的成就，进度变化时只检查这些成就
+ACHIEVEMENTS_BY_PROGRESS: Dict[str, List[Achievement]] = {}
+for _achievement in ACHIEVEMENTS:
+    ACHIEVEMENTS_BY_PROGRESS.setdefault(_achievement.progress, []).append(_achievement)
+
+
+class AchievementTracker:
+    """根据游戏事件增量更新成就进度"""
+
+    def __init__(self, stats_for: Callable[[str], Dict],
+                 on_unlock: Optional[Callable[[object, Achievement], None]] = None):
+        """
+        初始化成就追踪器
+
+        Args:
+            stats_for: 获取（必要时创建）玩家战绩字典的函数，签名为 stats_for(玩家名称)
+            on_unlock: 解锁成就时的回调，签名为 on_unlock(玩家, 成就)
+        """
+        self._stats_for = stats_for
+        self._on_unlock = on_unlock
+        self._received_at: Dict[Hashable, float] = {}  # 当前持有者ID -> 拿到山芋的时间
+        self._held = set()  # 本局持有过山芋的玩家ID
+        self.unlocked = 0  # 累计解锁的成就数量
+
+    def progress(self, player_name: str) -> Dict:
+        """
+        获取玩家的成就进度（缺少的字段补上默认值）
+
+        Args:
+            player_name: 玩家名称
+
+        Returns:
+            Dict: 进度字典
+        """
+        stats = self._stats_for(player_name)
+        progress = stats.setdefault("progress", {})
+        for key, value in DEFAULT_PROGRESS.items():
+            progress.setdefault(key, value)
+        stats.setdefault("achievements", {})
+        return progress
+
+    def game_started(self, players: Iterable, holder, now: float):
+        """
+        新的一局开始
+
+        Args:
+            players: 参赛玩家
+            holder: 初始山芋持有者
+            now: 时间戳
+        """
+        for player in players:
+            self._held.discard(player.id)
+            self._received_at.pop(player.id, None)
+        self.potato_received(holder, now)
+
+    def potato_received(self, player, now: float):
+        """
+        玩家拿到山芋（开局、击中传递或重新分配）
+
+        Args:
+            player: 新的持有者
+            now: 时间戳
+        """
+        self._received_at[player.id] = now
+        self._held.add(player.id)
+
+    def potato_passed(self, player, now: float):
+        """
+        持有者击中其他玩家，把山芋传了出去
+
+        Args:
+            player: 原持有者
+            now: 时间戳
+        """
+        received_at = self._received_at.pop(player.id, None)
+        if received_at is None:
+            return
+        elapsed = round(now - received_at, 2)
+        progress = self.progress(player.name)
+        best = progress[PROGRESS_FASTEST_PASS]
+        if best is None or elapsed < best:
+            self._set(player, progress, PROGRESS_FASTEST_PASS, elapsed)
+
+    def explosion_survived(self, players: Iterable):
+        """
+        山芋爆炸，在场的其他玩家躲过一次
+
+        Args:
+            players: 爆炸后仍在游戏中的玩家
+        """
+        for player in players:
+            progress = self.progress(player.name)
+            self._set(player, progress, PROGRESS_EXPLOSIONS_SURVIVED, progress[PROGRESS_EXPLOSIONS_SURVIVED] + 1)
+
+    def game_ended(self, players: Iterable, survivors: Iterable, winner):
+        """
+        一局结束：更新连胜，以及坚持到最后却从未持有山芋的玩家
+
+        Args:
+            players: 结束时仍在竞技场中的参赛玩家（包括被淘汰的玩家）
+            survivors: 坚持到结束的玩家
+            winner: 获胜者，没有时为None
+        """
+        for player in players:
+            progress = self.progress(player.name)
+            if winner is not None and player.id == winner.id:
+                streak = progress[PROGRESS_WIN_STREAK] + 1
+                progress[PROGRESS_WIN_STREAK] = streak
+                if streak > progress[PROGRESS_BEST_WIN_STREAK]:
+                    self._set(player, progress, PROGRESS_BEST_WIN_STREAK, streak)
+            else:
+                progress[PROGRESS_WIN_STREAK] = 0
+
+        for player in survivors:
+            if player.id not in self._held:
+                progress = self.progress(player.name)
+                self._set(player, progress, PROGRESS_UNTOUCHED_GAMES, progress[PROGRESS_UNTOUCHED_GAMES] + 1)
+
+        for player in players:
+            self._held.discard(player.id)
+            self._received_at.pop(player.id, None)
+
+    def reset_streak(self, player):
+        """
+        中途离开游戏视为输掉本局，连胜清零
+
+        Args:
+            player: 玩家
+        """
+        self.progress(player.name)[PROGRESS_WIN_STREAK] = 0
+        self._held.discard(player.id)
+        self._received_at.pop(player.id, None)
+
+    def _set(self, player, progress: Dict, key: str, value):
+        progress[key] = value
+        unlocked = self._stats_for(player.name)["achievements"]
+        for achievement in ACHIEVEMENTS_BY_PROGRESS.get(key, ()):
+            if achievement.id not in unlocked and achievement.reached(value):
+                unlocked[achievement.id] = time.time()
+                self.unlocked += 1
+                if self._on_unlock is not None:
+                    self._on_unlock(player, achievement)
@@ -0,0 +1,178 @@
+"""
+烫手山芋竞技场
+"""
+from typing import Callable, Dict, Optional
+
+from .audience import ArenaAudience, Channel
+from .game_state import GameStateMachine, GAME_STATE_RUNNING
+from .participants import ParticipantSet
+from .spawn import SpawnSlots, DEFAULT_SPAWN_SPACING
+from .spatial import Region, REGION_ARENA
+from .timeline import GameTimeline
+
+# 竞技场默认配置
+DEFAULT_ARENA_NAME = "default"
+DEFAULT_WAIT_POS = {"x": 0, "y": 0, "z": 0, "dimid": 0}
+DEFAULT_GAME_POS = {"x": 100, "y": 64, "z": 100, "dimid": 0}
+DEFAULT_AREA_SIZE = {"x": 10, "z": 10}
+
+# 越界判定的容差，防止在边界上误判
+BOUNDARY_TOLERANCE = 2.0
+
+
+class Arena:
+    """竞技场类，持有一局游戏的配置、状态、计时器和参与者"""
+
+    def __init__(self, name: str, run_task: Callable):
+        """
+        初始化竞技场
+
+        Args:
+            name: 竞技场名称
+            run_task: 调度函数，签名为 run_task(callback, delay, period)，由共享的 tick 管线提供
+        """
+        self.name = name
+
+        # 地理信息
+        self.wait_pos = dict(DEFAULT_WAIT_POS)  # 等待中心
+        self.game_pos = dict(DEFAULT_GAME_POS)  # 竞技中心
+        self.area_size = dict(DEFAULT_AREA_SIZE)  # 活动半径
+        self.spawn_spacing = DEFAULT_SPAWN_SPACING  # 出生点之间的最小间距
+        self._spawn_slots = None  # 缓存的出生点，活动半径或配置变化时重新生成
+
+        # 游戏参数
+        self.wait_time = 120  # 满人后的预备等待
+        self.pre_time = 10  # 正式开赛前的热身倒计时
+        self.game_time = 180  # 游戏时长（秒）
+        self.min_players = 2  # 触发自动开赛的最低人数
+        self.max_players = 0  # 最大参与人数，0表示无上限
+
+        # 游戏状态
+        self.state_machine = GameStateMachine(run_task)
+        self.game_id = 0  # 当前对局的游戏ID
+        self.game_start_time = 0
+        self.game_start_timestamp = 0  # 游戏开始的时间戳
+        self.potato_holder = None  # 当前持有山芋的玩家
+        self.participants = ParticipantSet()  # 参与游戏的玩家（分为仍在游戏中的与本局已被淘汰的）
+        self.departed_players = {}  # 本局中途断线的玩家ID -> 名称，只用于战局记录
+        self.timeline = GameTimeline()  # 本局的持有、传递与淘汰时间线
+
+        # 消息受众：参赛玩家、观战者
+        self.audience = ArenaAudience()
+        self.wait_remaining = 0  # 等待倒计时剩余时间（秒）
+        self.pre_game_timer = 0  # 赛前倒计时剩余时间（秒）
+        self.last_announced_time = None  # 上一次播报的剩余时间
+        self.teleport_batch = None  # 开赛或散场时正在进行的分批传送
+
+        # 竞技场专属BossBar，在离开空闲状态时创建
+        self.bossbar = None
+        self.hud_state = None  # 上一次推送到BossBar的 (标题, 进度, 颜色)，每 tick 只推送变化
+        self.hud_hold_until = 0  # 淘汰信息等临时标题保留到的 tick，期间不推送游戏状态
+
+    @property
+    def state(self) -> int:
+        """当前状态"""
+        return self.state_machine.state
+
+    @property
+    def spectators(self) -> Channel:
+        """正在观战的玩家"""
+        return self.audience.spectators
+
+    @property
+    def game_active(self) -> bool:
+        """游戏是否正在进行中"""
+        return self.state_machine.state == GAME_STATE_RUNNING
+
+    def is_full(self) -> bool:
+        """是否达到最大人数限制"""
+        return self.max_players > 0 and len(self.participants.alive) >= self.max_players
+
+    @property
+    def arena_region_key(self):
+        """竞技区域在空间索引中的键"""
+        return (REGION_ARENA, self.name)
+
+    def get_spawn_slots(self, players: int) -> SpawnSlots:
+        """
+        获取出生点（首次使用、失效后或参赛人数超过已生成的数量时重新生成）
+
+        Args:
+            players: 参赛人数
+
+        Returns:
+            SpawnSlots: 出生点
+        """
+        if self._spawn_slots is None or players > self._spawn_slots.players:
+            self._spawn_slots = SpawnSlots(self.area_size["x"], self.area_size["z"], self.spawn_spacing, players)
+        return self._spawn_slots
+
+    def invalidate_spawn_slots(self):
+        """使缓存的出生点失效（活动半径变化后调用）"""
+        self._spawn_slots = None
+
+    def arena_region(self) -> Region:
+        """竞技区域（已包含越界容差）"""
+        half_x = self.area_size["x"] + BOUNDARY_TOLERANCE
+        half_z = self.area_size["z"] + BOUNDARY_TOLERANCE
+        return Region(
+            self.arena_region_key, REGION_ARENA, self.game_pos.get("dimid", 0),
+            self.game_pos["x"] - half_x, self.game_pos["z"] - half_z,
+            self.game_pos["x"] + half_x, self.game_pos["z"] + half_z,
+            owner=self
+        )
+
+    def load_config(self, config: Dict):
+        """
+        从配置字典加载竞技场参数
+
+        Args:
+            config: 配置字典，字段名与 config.json 保持一致
+        """
+        self.wait_pos = config.get("waitPos", dict(DEFAULT_WAIT_POS))
+        self.game_pos = config.get("gamePos", dict(DEFAULT_GAME_POS))
+        self.area_size = config.get("areaSize", dict(DEFAULT_AREA_SIZE))
+        self.spawn_spacing = config.get("spawnSpacing", DEFAULT_SPAWN_SPACING)
+        self.invalidate_spawn_slots()
+        self.wait_time = config.get("waitTime", 120)
+        self.pre_time = config.get("preTime", 10)
+        self.game_time = config.get("gameTime", 180)
+        self.min_players = config.get("minPlayers", 2)
+        self.max_players = config.get("maxPlayers", 0)  # 0表示无上限
+
+    def to_config(self) -> Dict:
+        """
+        导出竞技场配置
+
+        Returns:
+            Dict: 配置字典
+        """
+        return {
+            "name": self.name,
+            "waitPos": self.wait_pos,
+            "gamePos": self.game_pos,
+            "areaSize": self.area_size,
+            "spawnSpacing": self.spawn_spacing,
+            "waitTime": self.wait_time,
+            "preTime": self.pre_time,
+            "gameTime": self.game_time,
+            "minPlayers": self.min_players,
+            "maxPlayers": self.max_players
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict, run_task: Callable, name: Optional[str] = None) -> "Arena":
+        """
+        根据配置字典创建竞技场
+
+        Args:
+            config: 配置字典
+            run_task: 调度函数
+            name: 竞技场名称，默认使用配置中的 name 字段
+
+        Returns:
+            Arena: 竞技场实例
+        """
+        arena = cls(name or config.get("name", DEFAULT_ARENA_NAME), run_task)
+        arena.load_config(config)
+        return arena
@@ -0,0 +1,144 @@
+"""
+消息受众频道
+
+每个频道增量维护成员，发送时只遍历预先生成的收件人元组，
+不再对全服玩家调用 broadcast_message。
+"""
+from typing import Dict, Hashable, Iterator, Optional, Tuple
+
+# 频道
+CHANNEL_PARTICIPANTS = "participants"  # 竞技场的参赛玩家（包括本局已被淘汰的玩家）
+CHANNEL_SPECTATORS = "spectators"  # 竞技场的观战者
+CHANNEL_ARENA = "arena"  # 竞技场的参赛玩家与观战者
+CHANNEL_LOBBY = "lobby"  # 不在任何竞技场中的在线玩家
+CHANNEL_ALL = "all"  # 所有在线玩家
+
+CHANNELS = (CHANNEL_PARTICIPANTS, CHANNEL_SPECTATORS, CHANNEL_ARENA, CHANNEL_LOBBY, CHANNEL_ALL)
+
+# 消息类型
+MESSAGE_JOIN = "join"  # 玩家加入/离开竞技场
+MESSAGE_READY = "ready"  # 开赛倒计时开始、取消、人数不足等
+MESSAGE_COUNTDOWN = "countdown"  # 赛前与爆炸倒计时
+MESSAGE_GAME_START = "gameStart"  # 游戏开始公告
+MESSAGE_GAME_INFO = "gameInfo"  # 游戏开始时的持有者、时长等信息
+MESSAGE_TRANSFER = "transfer"  # 山芋转移
+MESSAGE_ELIMINATION = "elimination"  # 玩家被淘汰
+MESSAGE_GAME_END = "gameEnd"  # 游戏结束与胜利者
+
+# 各类消息默认发送到的频道
+DEFAULT_MESSAGE_CHANNELS = {
+    MESSAGE_JOIN: CHANNEL_ARENA,
+    MESSAGE_READY: CHANNEL_ARENA,
+    MESSAGE_COUNTDOWN: CHANNEL_ARENA,
+    MESSAGE_GAME_START: CHANNEL_ALL,
+    MESSAGE_GAME_INFO: CHANNEL_ARENA,
+    MESSAGE_TRANSFER: CHANNEL_ARENA,
+    MESSAGE_ELIMINATION: CHANNEL_ARENA,
+    MESSAGE_GAME_END: CHANNEL_ALL,
+}
+
+
+class Channel:
+    """一个消息频道，按玩家ID维护成员"""
+
+    __slots__ = ("_members", "_recipients")
+
+    def __init__(self):
+        self._members: Dict[Hashable, object] = {}
+        self._recipients: Optional[Tuple] = ()
+
+    def add(self, player):
+        """加入频道"""
+        if player.id not in self._members:
+            self._members[player.id] = player
+            self._recipients = None
+
+    def discard(self, player):
+        """离开频道"""
+        if self._members.pop(player.id, None) is not None:
+            self._recipients = None
+
+    def clear(self):
+        """清空频道"""
+        self._members.clear()
+        self._recipients = ()
+
+    @property
+    def recipients(self) -> Tuple:
+        """收件人元组，成员变化后首次访问时重新生成"""
+        if self._recipients is None:
+            self._recipients = tuple(self._members.values())
+        return self._recipients
+
+    def send(self, message: str):
+        """
+        向频道内所有成员发送消息
+
+        Args:
+            message: 消息内容
+        """
+        for player in self.recipients:
+            player.send_message(message)
+
+    def __contains__(self, player) -> bool:
+        return player.id in self._members
+
+    def __iter__(self) -> Iterator:
+        return iter(self.recipients)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+
+class ArenaAudience:
+    """竞技场的参赛玩家、观战者与两者合集频道"""
+
+    __slots__ = ("participants", "spectators", "members")
+
+    def __init__(self):
+        self.participants = Channel()
+        self.spectators = Channel()
+        self.members = Channel()
+
+    def add_participant(self, player):
+        """加入参赛玩家频道"""
+        self.participants.add(player)
+        self.members.add(player)
+
+    def add_spectator(self, player):
+        """加入观战者频道"""
+        self.spectators.add(player)
+        self.members.add(player)
+
+    def discard(self, player):
+        """从所有频道中移除玩家"""
+        self.participants.discard(player)
+        self.spectators.discard(player)
+        self.members.discard(player)
+
+    def channel(self, name: str) -> Optional[Channel]:
+        """按名称获取竞技场频道"""
+        if name == CHANNEL_PARTICIPANTS:
+            return self.participants
+        if name == CHANNEL_SPECTATORS:
+            return self.spectators
+        if name == CHANNEL_ARENA:
+            return self.members
+        return None
+
+
+def load_message_channels(config: Dict) -> Dict[str, str]:
+    """
+    读取各类消息的频道配置，未配置或配置无效的类型使用默认频道
+
+    Args:
+        config: config.json 中的 messageChannels 字段
+
+    Returns:
+        Dict[str, str]: 消息类型 -> 频道
+    """
+    channels = dict(DEFAULT_MESSAGE_CHANNELS)
+    for message_type, channel in config.items():
+        if message_type in channels and channel in CHANNELS:
+            channels[message_type] = channel
+    return channels
@@ -0,0 +1,164 @@
+"""
+自适应越界检查时间表
+
+每位参与者的下一次检查时间取决于其到竞技区域边缘的距离除以最大移动速度：
+靠近边缘的玩家每个 tick 都检查，站在中央的玩家很久才检查一次。
+待检查的玩家按到期 tick 放进时间轮，每个 tick 只取出到期的玩家。
+
+越界检测有三种模式：
+- polling: 按上述时间表轮询玩家位置
+- event:   只在玩家移动事件中检测，不轮询
+- hybrid:  以移动事件检测为主，另外每 maxInterval 个 tick 轮询一次作为兜底
+"""
+from typing import Dict, Hashable, List
+
+# 玩家每 tick 的最大水平移动距离（方块）：疾跑跳跃约 0.35，加上速度效果与被击中的击退
+# 可以超过 0.8，这里留出余量。末影珍珠等瞬移无法用速度上限覆盖，需要及时检测时使用 hybrid 模式
+DEFAULT_MAX_SPEED = 1.0
+# 两次检查之间的最大间隔（ticks）
+DEFAULT_MAX_INTERVAL = 40
+
+# 越界检测模式
+BOUNDARY_MODE_POLLING = "polling"
+BOUNDARY_MODE_EVENT = "event"
+BOUNDARY_MODE_HYBRID = "hybrid"
+BOUNDARY_MODES = (BOUNDARY_MODE_POLLING, BOUNDARY_MODE_EVENT, BOUNDARY_MODE_HYBRID)
+
+
+class BoundarySchedule:
+    """按到期 tick 分桶的越界检查时间轮"""
+
+    def __init__(self, max_speed: float = DEFAULT_MAX_SPEED, max_interval: int = DEFAULT_MAX_INTERVAL):
+        """
+        初始化时间表
+
+        Args:
+            max_speed: 每 tick 最大移动距离
+            max_interval: 最大检查间隔
+        """
+        self.mode = BOUNDARY_MODE_POLLING
+        self.max_speed = max_speed
+        self.max_interval = max_interval
+        self._wheel: Dict[int, List[Hashable]] = {}  # 到期 tick -> 玩家ID列表
+        self._due: Dict[Hashable, int] = {}  # 玩家ID -> 到期 tick，重新安排后旧桶里的记录作废
+        self._cursor = None  # 上一次取出到期玩家的 tick
+        self.checks = 0  # 累计取出检查的玩家次数
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    @property
+    def polls(self) -> bool:
+        """当前模式是否需要轮询"""
+        return self.mode != BOUNDARY_MODE_EVENT
+
+    @property
+    def listens(self) -> bool:
+        """当前模式是否在移动事件中检测"""
+        return self.mode != BOUNDARY_MODE_POLLING
+
+    def interval_for(self, distance: float) -> int:
+        """
+        根据到边缘的距离计算检查间隔
+
+        Args:
+            distance: 到最近边缘的距离
+
+        Returns:
+            int: 间隔 tick 数，范围为 [1, max_interval]
+        """
+        if self.mode == BOUNDARY_MODE_HYBRID:
+            # 移动事件负责及时检测，轮询只作兜底
+            return self.max_interval
+        if self.max_speed <= 0:
+            return 1
+        return max(1, min(int(distance / self.max_speed), self.max_interval))
+
+    def add(self, player_id: Hashable, now: int):
+        """
+        加入玩家，下一个 tick 立即检查
+
+        Args:
+            player_id: 玩家ID
+            now: 当前 tick
+        """
+        self._push(player_id, now + 1)
+
+    def reschedule(self, player_id: Hashable, now: int, distance: float):
+        """
+        按到边缘的距离安排玩家的下一次检查
+
+        Args:
+            player_id: 玩家ID
+            now: 当前 tick
+            distance: 到最近边缘的距离
+        """
+        self._push(player_id, now + self.interval_for(distance))
+
+    def discard(self, player_id: Hashable):
+        """移除玩家（旧桶中的记录在到期时丢弃）"""
+        self._due.pop(player_id, None)
+
+    def clear(self):
+        """清空时间表"""
+        self._wheel.clear()
+        self._due.clear()
+        self._cursor = None
+
+    def pop_due(self, now: int) -> List[Hashable]:
+        """
+        取出所有到期的玩家，取出后需要重新安排才会再次检查
+
+        Args:
+            now: 当前 tick
+
+        Returns:
+            List[Hashable]: 到期的玩家ID
+        """
+        if self._cursor is None or now - self._cursor > self.max_interval + 1:
+            # 首次运行或中断过较长时间，扫描所有桶
+            ticks = sorted(tick for tick in self._wheel if tick <= now)
+        else:
+            ticks = range(self._cursor + 1, now + 1)
+        self._cursor = now
+
+        due = []
+        for tick in ticks:
+            bucket = self._wheel.pop(tick, None)
+            if not bucket:
+                continue
+            for player_id in bucket:
+                if self._due.get(player_id) == tick:
+                    del self._due[player_id]
+                    due.append(player_id)
+        self.checks += len(due)
+        return due
+
+    def load_config(self, config: Dict):
+        """
+        读取 config.json 中的 boundaryCheck 字段
+
+        Args:
+            config: 配置字典
+        """
+        mode = config.get("mode", BOUNDARY_MODE_POLLING)
+        self.mode = mode if mode in BOUNDARY_MODES else BOUNDARY_MODE_POLLING
+        self.max_speed = float(config.get("maxSpeed", DEFAULT_MAX_SPEED))
+        self.max_interval = max(1, int(config.get("maxInterval", DEFAULT_MAX_INTERVAL)))
+
+    def to_config(self) -> Dict:
+        """
+        导出配置
+
+        Returns:
+            Dict: boundaryCheck 字段
+        """
+        return {"mode": self.mode, "maxSpeed": self.max_speed, "maxInterval": self.max_interval}
+
+    def _push(self, player_id: Hashable, tick: int):
+        self._due[player_id] = tick
+        bucket = self._wheel.get(tick)
+        if bucket is None:
+            self._wheel[tick] = [player_id]
+        else:
+            bucket.append(player_id)
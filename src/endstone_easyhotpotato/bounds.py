@@ -0,0 +1,128 @@
+"""
+批量越界检测
+
+每个 tick 把越界检查时间表中到期的参与者位置收集到连续数组中，一次性计算
+到所属竞技区域边缘的距离：负数表示越界，非负数用于安排下一次检查。
+竞技区域的包围盒在区域变化前一直复用。批次较大且安装了 NumPy 时使用向量化运算，
+否则使用纯 Python 实现：NumPy 每次调用有几微秒的固定开销，
+benchmarks/bench_bounds.py 中约 24 人以上的批次才比纯 Python 快。
+"""
+from array import array
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 是可选依赖
+    np = None
+
+HAS_NUMPY = np is not None
+
+# 批次人数达到该值时才使用 NumPy
+NUMPY_MIN_BATCH = 32
+
+
+class BoundsBatch:
+    """一个 tick 内收集到的参与者位置"""
+
+    __slots__ = ("players", "arena_index", "dims", "xs", "zs")
+
+    def __init__(self):
+        # 坐标保存在连续的 array 中，NumPy 可以零拷贝地直接读取
+        self.players = []  # 玩家对象
+        self.arena_index = array("q")  # 玩家所属包围盒的下标
+        self.dims = array("q")
+        self.xs = array("d")
+        self.zs = array("d")
+
+    def add(self, player, arena_index: int, dim: int, x: float, z: float):
+        """
+        加入一个参与者的位置
+
+        Args:
+            player: 玩家对象
+            arena_index: 玩家所属包围盒在 ArenaBounds 中的下标
+            dim: 维度ID
+            x: X坐标
+            z: Z坐标
+        """
+        self.players.append(player)
+        self.arena_index.append(arena_index)
+        self.dims.append(dim)
+        self.xs.append(x)
+        self.zs.append(z)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+
+class ArenaBounds:
+    """所有竞技区域的包围盒数组，区域变化前可以跨 tick 复用"""
+
+    __slots__ = ("dims", "min_x", "min_z", "max_x", "max_z", "arrays")
+
+    def __init__(self, regions: Sequence):
+        """
+        Args:
+            regions: 区域序列，每个区域需要 dim/min_x/min_z/max_x/max_z 属性
+        """
+        self.dims = [region.dim for region in regions]
+        self.min_x = [region.min_x for region in regions]
+        self.min_z = [region.min_z for region in regions]
+        self.max_x = [region.max_x for region in regions]
+        self.max_z = [region.max_z for region in regions]
+
+        # NumPy 可用时额外保存一份连续数组
+        self.arrays = None
+        if HAS_NUMPY:
+            self.arrays = (
+                np.asarray(self.dims, dtype=np.int64),
+                np.asarray(self.min_x, dtype=np.float64),
+                np.asarray(self.min_z, dtype=np.float64),
+                np.asarray(self.max_x, dtype=np.float64),
+                np.asarray(self.max_z, dtype=np.float64),
+            )
+
+
+def edge_distances(batch: BoundsBatch, bounds: ArenaBounds, use_numpy: bool = True) -> List[float]:
+    """
+    计算每位参与者到所属竞技区域最近边缘的距离
+
+    Args:
+        batch: 参与者位置批次
+        bounds: 竞技区域包围盒
+        use_numpy: 是否允许在批次达到 NUMPY_MIN_BATCH 人且 NumPy 可用时使用 NumPy
+
+    Returns:
+        List[float]: 与批次一一对应的距离，在区域内为非负数，越界为负数（维度不同时为负无穷）
+    """
+    if not len(batch):
+        return []
+    if use_numpy and HAS_NUMPY and len(batch) >= NUMPY_MIN_BATCH:
+        return _edge_distances_numpy(batch, bounds)
+    return _edge_distances_python(batch, bounds)
+
+
+def _edge_distances_numpy(batch: BoundsBatch, bounds: ArenaBounds) -> List[float]:
+    index = np.frombuffer(batch.arena_index, dtype=np.int64)
+    dims = np.frombuffer(batch.dims, dtype=np.int64)
+    xs = np.frombuffer(batch.xs, dtype=np.float64)
+    zs = np.frombuffer(batch.zs, dtype=np.float64)
+
+    b_dims, b_min_x, b_min_z, b_max_x, b_max_z = bounds.arrays
+    distance = np.minimum(
+        np.minimum(xs - b_min_x[index], b_max_x[index] - xs),
+        np.minimum(zs - b_min_z[index], b_max_z[index] - zs),
+    )
+    distance[dims != b_dims[index]] = -np.inf
+    return distance.tolist()
+
+
+def _edge_distances_python(batch: BoundsBatch, bounds: ArenaBounds) -> List[float]:
+    b_dims, b_min_x, b_min_z, b_max_x, b_max_z = bounds.dims, bounds.min_x, bounds.min_z, bounds.max_x, bounds.max_z
+    result = []
+    for index, dim, x, z in zip(batch.arena_index, batch.dims, batch.xs, batch.zs):
+        if dim != b_dims[index]:
+            result.append(float("-inf"))
+        else:
+            result.append(min(x - b_min_x[index], b_max_x[index] - x, z - b_min_z[index], b_max_z[index] - z))
+    return result
@@ -19,12 +19,86 @@ from endstone.boss import BarColor, BarStyle
 # Easy系列插件的 BStats 遥测模块
 from .bstats import BStats
 
-# 游戏状态常量
-GAME_STATE_IDLE = 0      # 游戏空闲
-GAME_STATE_WAITING = 1   # 等待玩家
-GAME_STATE_PREPARING = 2 # 准备阶段
-GAME_STATE_RUNNING = 3   # 游戏进行中
-GAME_STATE_ENDING = 4    # 游戏结束
+# 游戏状态机
+from .game_state import (
+    GAME_STATE_IDLE,
+    GAME_STATE_WAITING,
+    GAME_STATE_PREPARING,
+    GAME_STATE_RUNNING,
+    GAME_STATE_ENDING,
+)
+
+# 竞技场与共享 tick 管线
+from .arena import Arena, DEFAULT_ARENA_NAME
+from .tick_pipeline import TickPipeline
+
+# 空间索引
+from .spatial import SpatialGrid, REGION_ARENA
+
+# 批量越界检测（可选使用 NumPy）
+from .bounds import BoundsBatch, ArenaBounds, edge_distances
+
+# 自适应越界检查时间表
+from .boundary_schedule import BoundarySchedule
+
+# 每 tick 的玩家位置快照
+from .location_cache import LocationCache, get_dimension_id, find_dimension
+
+# 消息受众频道
+from .audience import (
+    Channel,
+    CHANNEL_ALL,
+    CHANNEL_LOBBY,
+    MESSAGE_JOIN,
+    MESSAGE_READY,
+    MESSAGE_COUNTDOWN,
+    MESSAGE_GAME_START,
+    MESSAGE_GAME_INFO,
+    MESSAGE_TRANSFER,
+    MESSAGE_ELIMINATION,
+    MESSAGE_GAME_END,
+    DEFAULT_MESSAGE_CHANNELS,
+    load_message_channels,
+)
+
+# 每 tick 合并发送的聊天消息
+from .outbox import Outbox, PRIORITY_NORMAL
+
+# 分批传送队列
+from .teleport_queue import TeleportQueue, DEFAULT_TELEPORTS_PER_TICK
+
+# 山芋物品与快捷栏同步
+from .potato_item import PotatoHotbar
+
+# 粒子效果
+from .effects import ParticleEmitter, SoundEmitter, EffectsQuality, FLAME_SHAPE, EXPLOSION_SHAPE
+
+# 竞技场参与者
+from .participants import ParticipantSet
+
+# tick 预算看门狗
+from .watchdog import (
+    Watchdog, timed, DEGRADE_LABELS, DEGRADE_NONE, DEGRADE_EFFECTS, DEGRADE_MARQUEE, DEGRADE_TAUNTS, DEGRADE_ADMISSION
+)
+
+# 每局游戏的时间线
+from .timeline import CAUSE_DEPARTED
+
+# 游戏内部事件总线
+from .events import (
+    EventBus, PotatoTransferred, PlayerEliminated, GameEnded,
+    TRANSFER_HIT, TRANSFER_REASSIGN, ELIMINATED_EXPLOSION, ELIMINATED_OUT_OF_BOUNDS
+)
+
+# 山芋传递限流
+from .transfer_limit import TransferLimiter
+
+# 成就与连胜
+from .achievements import (
+    AchievementTracker, Achievement, ACHIEVEMENTS,
+    PROGRESS_WIN_STREAK, PROGRESS_BEST_WIN_STREAK, PROGRESS_EXPLOSIONS_SURVIVED,
+    PROGRESS_FASTEST_PASS, PROGRESS_UNTOUCHED_GAMES
+)
 
 # 默认配置常量
 DEFAULT_MIN_PLAYERS = 2      # 最低玩家数
@@ -36,15 +110,28 @@ DEFAULT_AREA_SIZE_Z = 10     # 默认活动区域Z轴半径
 
 # 物品ID常量
 POTATO_ITEM_ID = "minecraft:potato"
+POTATO_REFILL_PERIOD = 10    # 给持有者补充山芋的周期（ticks），不受效果质量影响
 
 # 音效常量
 SOUND_TRANSFER = "mob.blaze.shoot"    # 传递音效
 SOUND_EXPLODE = "random.explode"      # 爆炸音效
 SOUND_XP = "random.orb"                # 经验音效
 
-# 粒子效果常量
-PARTICLE_FLAME = "minecraft:basic_flame_particle"      # 火焰粒子
-PARTICLE_EXPLODE = "minecraft:explode_particle"        # 爆炸粒子
+# 竞技场状态显示文本
+ARENA_STATE_LABELS = {
+    GAME_STATE_IDLE: "§7空闲",
+    GAME_STATE_WAITING: "§a等待中",
+    GAME_STATE_PREPARING: "§e准备中",
+    GAME_STATE_RUNNING: "§c进行中",
+    GAME_STATE_ENDING: "§6结算中",
+}
+
+# 战局记录中的淘汰原因显示文本
+TIMELINE_CAUSE_LABELS = {
+    ELIMINATED_EXPLOSION: "爆炸",
+    ELIMINATED_OUT_OF_BOUNDS: "越界",
+    CAUSE_DEPARTED: "离开",
+}
 
 # 颜色代码常量
 COLOR_RED = "§c"
@@ -283,15 +370,16 @@ class DataManager:
             玩家战绩字典，如果不存在则返回None
         """
         return self.player_stats.get(player_name)
-    
-    def update_player_stats(self, player_name: str, wins: int = 0, games: int = 0):
+
+    def ensure_player_stats(self, player_name: str) -> Dict:
         """
-        更新玩家战绩
-        
+        获取玩家战绩，不存在时创建
+
         Args:
             player_name: 玩家名称
-            wins: 增加的胜场数
-            games: 增加的总场次
+
+        Returns:
+            玩家战绩字典
         """
         if player_name not in self.player_stats:
             self.player_stats[player_name] = {
@@ -299,8 +387,18 @@ class DataManager:
                 "games": 0,
                 "win_rate": 0.0
             }
+        return self.player_stats[player_name]
+    
+    def update_player_stats(self, player_name: str, wins: int = 0, games: int = 0):
+        """
+        更新玩家战绩
         
-        stats = self.player_stats[player_name]
+        Args:
+            player_name: 玩家名称
+            wins: 增加的胜场数
+            games: 增加的总场次
+        """
+        stats = self.ensure_player_stats(player_name)
         stats["wins"] += wins
         stats["games"] += games
         
@@ -403,6 +501,7 @@ class DataManager:
                 - winner: 获胜者
                 - duration: 游戏时长（秒）
                 - reason: 游戏结束原因
+                - timeline: 时间线汇总（持有时间、传递次数、淘汰顺序、存活时间）
         """
         self.game_history.append(game_record)
         self.save_game_history()
@@ -463,6 +562,7 @@ class EasyHotPotatoPlugin(Plugin):
                 "/easyhotpotato",
                 "/easyhotpotato status",
                 "/easyhotpotato stats [target: player]",
+                "/easyhotpotato perf",
                 "/easyhotpotato help"
             ],
             "permissions": ["easyhotpotato.command.use"],
@@ -485,36 +585,105 @@ class EasyHotPotatoPlugin(Plugin):
     def __init__(self):
         super().__init__()
         # 游戏状态
-        self.game_active = False
-        self.game_start_time = 0
-        self.game_time = 180  # 默认游戏时长（秒）
-        self.game_start_timestamp = 0  # 游戏开始的时间戳
-        self.game_id = 0  # 游戏ID
-        self.potato_holder = None  # 当前持有山芋的玩家
+        self.game_id = 0  # 游戏ID（所有竞技场共用递增）
         self.potato_item_id = "minecraft:potato"  # 山芋物品ID
-        self.game_task = None  # 游戏计时器任务
-        self.countdown_task = None  # 倒计时任务
-        self.pre_game_task = None  # 赛前倒计时任务
-        self.players_in_game = set()  # 参与游戏的玩家集合（当前还在游戏中）
-        self.all_players_in_game = set()  # 所有参与游戏的玩家集合（包括被淘汰的）
-        self.min_players = 2  # 触发自动开赛的最低人数
-        self.max_players = 0  # 最大参与人数，0表示无上限
-        self.pre_time = 10  # 正式开赛前的热身倒计时
-        self.wait_time = 120  # 满人后的预备等待
-        self.particle_task = None  # 粒子效果任务
-        self.position_check_task = None  # 位置检查任务
-        self.stop_game_task = None
-        
+        self.potato_hotbar = PotatoHotbar(self.potato_item_id, "§c烫手山芋")  # 持有者快捷栏中的山芋
+
+        # 共享的 tick 管线，所有竞技场的定时任务都在这里执行
+        self.pipeline = TickPipeline(
+            lambda callback, delay, period: self.server.scheduler.run_task(self, callback, delay=delay, period=period),
+            on_error=lambda e: plugin_print(f"执行定时任务失败: {e}", "ERROR")
+        )
+
+        # tick 预算看门狗：统计管线任务与事件处理函数的耗时，持续超出预算时逐级降级
+        self.watchdog = Watchdog(on_level_change=self.on_watchdog_level_change)
+        self.watchdog_task = None  # 降级期间保持管线运行，以便持续观察耗时并恢复
+        self.pipeline.on_tick_end = self.watchdog.observe
+
+        # 竞技场
+        self.arenas: Dict[str, Arena] = {}  # 竞技场名称 -> 竞技场
+        self.player_arena: Dict[int, Arena] = {}  # 玩家ID -> 所在竞技场（包括被淘汰但对局未结束的玩家）
+        self.kicked_players = set()  # 已确定被踢出、等待退出事件的玩家ID
+        self.spectator_arena: Dict[int, Arena] = {}  # 观战者ID -> 观看的竞技场（不计入 player_arena，不参与击中与越界处理）
+        self.spatial_index = SpatialGrid()  # 竞技区域的空间索引
+        self.arena_bounds = None  # 所有竞技区域的包围盒数组，区域登记或移除时失效
+        self.arena_bounds_slots: Dict[str, int] = {}  # 竞技场名称 -> 在包围盒数组中的下标
+        self.arena_bounds_arenas: List[Arena] = []  # 包围盒数组下标 -> 竞技场
+        self.boundary_task = None  # 所有竞技场共用的越界检测任务
+        self.boundary_schedule = BoundarySchedule()  # 按到边缘距离安排的每位玩家检查时间
+        self.boundary_pending = set()  # 移动事件中发现越界、等待下一个 tick 淘汰的玩家ID
+
+        # 事件快速过滤计数，用于确认过滤效果（/easyhotpotato perf）
+        self.event_counters = {
+            "damage_filtered": 0,
+            "damage_accepted": 0,
+            "drop_filtered": 0,
+            "drop_accepted": 0,
+            "move_filtered": 0,
+            "move_checked": 0,
+        }
+
+        # 玩家位置快照，管线运行时每 tick 每位玩家只读取一次位置
+        self.location_cache = LocationCache(
+            lambda: self.pipeline.current_tick if self.pipeline.running else None
+        )
+
+        # 消息频道：所有在线玩家、大厅玩家，以及各类消息发送到的频道
+        self.online_channel = Channel()
+        self.lobby_channel = Channel()
+        self.message_channels = dict(DEFAULT_MESSAGE_CHANNELS)
+        self.outbox = Outbox(
+            lambda callback: self.pipeline.schedule(callback),
+            on_error=lambda e: plugin_print(f"发送消息失败: {e}", "ERROR")
+        )
+
+        # 游戏事件总线：音效、粒子、消息、BossBar、战绩和日志订阅游戏事件
+        self.events = EventBus(
+            lambda callback: self.pipeline.schedule(callback),
+            on_error=lambda e: plugin_print(f"处理游戏事件失败: {e}", "ERROR")
+        )
+        self.register_event_subscribers()
+
+        # 分批传送队列，开赛与散场时每个 tick 只传送固定数量的玩家
+        self.teleport_queue = TeleportQueue(
+            lambda callback, delay, period: self.pipeline.schedule(callback, delay=delay, period=period),
+            self.teleport_player,
+            on_error=lambda e: plugin_print(f"传送玩家失败: {e}", "WARNING")
+        )
+
+        # 山芋传递限流：持有者接手后的冷却与每 tick 传递上限
+        self.transfer_limiter = TransferLimiter(
+            lambda: self.pipeline.current_tick if self.pipeline.running else None
+        )
+
+        # 成就与连胜，进度保存在玩家战绩中
+        self.achievements = AchievementTracker(
+            lambda name: self.data_manager.ensure_player_stats(name),
+            on_unlock=self.on_achievement_unlocked
+        )
+
+        # 粒子与音效发射器、效果质量控制
+        self.particle_emitter = ParticleEmitter()
+        self.sound_emitter = SoundEmitter()
+        self.effects_quality = EffectsQuality()
+
         # BossBar相关
-        self.bossbar = None  # BossBar对象
-        self.bossbar_task = None  # BossBar更新任务
-        self.wait_countdown_task = None  # 等待倒计时BossBar任务
-        
-        # 地理信息
-        self.wait_pos = {"x": 0, "y": 0, "z": 0, "dimid": 0}  # 等待中心
-        self.game_pos = {"x": 100, "y": 64, "z": 100, "dimid": 0}  # 竞技中心
-        self.area_size = {"x": 10, "z": 10}  # 活动半径
-        
+        self.bossbar = None  # 大厅BossBar对象（显示给不在竞技场中的玩家）
+
+        # 彩虹跑马灯
+        self.marquee_task = None
+        self.marquee_text = "欢迎使用 EasyHotPotato 烫手山芋插件！ "
+        self.marquee_position = 0
+        self.rainbow_colors = [
+            "§c",  # 红色
+            "§6",  # 金色
+            "§e",  # 黄色
+            "§a",  # 绿色
+            "§b",  # 青色
+            "§d",  # 紫色
+        ]
+        self.rainbow_color_index = 0
+
         # 数据管理
         self.data_manager = None  # 数据管理器实例，在on_load中初始化
         self.config_file = None  # 配置文件路径，在on_load中初始化
@@ -571,7 +740,13 @@ class EasyHotPotatoPlugin(Plugin):
         plugin_print(f"{self.full_name} 正在启用...")
         plugin_print(f"{self.full_name} 已启用!")
         self.register_events(self)
-        
+
+        # 已在线的玩家（例如重载插件时）加入消息频道
+        for player in self.server.online_players:
+            self.online_channel.add(player)
+            if player.id not in self.player_arena:
+                self.lobby_channel.add(player)
+
         # 初始化默认BossBar
         self.init_default_bossbar()
 
@@ -579,15 +754,152 @@ class EasyHotPotatoPlugin(Plugin):
         """插件禁用时调用"""
         self._metrics.shutdown() # 关闭bStats统计
         plugin_print(f"{self.full_name} 正在禁用...")
+
+        # 立即完成排队中的传送（散场时需要把玩家送回等待中心）
+        self.teleport_queue.drain()
+
+        # 取消所有竞技场拥有的任务，处理完延迟的游戏事件后再保存战绩，避免事件中的战绩更新丢失
+        for arena in self.arenas.values():
+            arena.state_machine.cancel_all_tasks()
+            self.cleanup_arena_bossbar(arena)
+        self.stop_boundary_task()
+        self.events.flush()
+        self.outbox.flush()
+
         if self.data_manager:
             self.data_manager.save_player_stats()
         self.save_config()
-        
+
+        # 停止 tick 管线
+        self.pipeline.shutdown()
+
         # 清理BossBar
         self.cleanup_bossbar()
-        
+
         plugin_print(f"{self.full_name} 已禁用!")
 
+    def create_arena(self, name: str, config: Optional[Dict] = None) -> Arena:
+        """创建竞技场并注册状态回调
+
+        Args:
+            name: 竞技场名称
+            config: 竞技场配置字典
+
+        Returns:
+            Arena: 新建的竞技场
+        """
+        arena = Arena.from_config(config or {}, self.pipeline.schedule, name=name)
+        arena.state_machine.on_enter(GAME_STATE_IDLE, lambda previous: self._on_enter_idle(arena, previous))
+        arena.state_machine.on_enter(GAME_STATE_WAITING, lambda previous: self._on_enter_waiting(arena, previous))
+        arena.state_machine.on_enter(GAME_STATE_PREPARING, lambda previous: self._on_enter_preparing(arena, previous))
+        arena.state_machine.on_enter(GAME_STATE_RUNNING, lambda previous: self._on_enter_running(arena, previous))
+        self.arenas[name] = arena
+        self.register_arena_regions(arena)
+        return arena
+
+    def register_arena_regions(self, arena: Arena):
+        """在空间索引中登记（或更新）竞技场的竞技区域
+
+        Args:
+            arena: 竞技场
+        """
+        self.spatial_index.set_region(arena.arena_region())
+        self.arena_bounds = None
+
+    def unregister_arena_regions(self, arena: Arena):
+        """从空间索引中移除竞技场的区域
+
+        Args:
+            arena: 竞技场
+        """
+        self.spatial_index.remove_region(arena.arena_region_key)
+        self.arena_bounds = None
+
+    def get_arena_bounds(self) -> ArenaBounds:
+        """获取所有竞技区域的包围盒数组（区域变化后重新生成）
+
+        Returns:
+            ArenaBounds: 包围盒数组，下标见 arena_bounds_slots
+        """
+        if self.arena_bounds is None:
+            self.arena_bounds_slots = {}
+            self.arena_bounds_arenas = []
+            regions = []
+            for arena in self.arenas.values():
+                region = self.spatial_index.get_region(arena.arena_region_key)
+                if region is None:
+                    continue
+                self.arena_bounds_slots[arena.name] = len(regions)
+                self.arena_bounds_arenas.append(arena)
+                regions.append(region)
+            self.arena_bounds = ArenaBounds(regions)
+        return self.arena_bounds
+
+    def is_in_arena_region(self, arena: Arena, dim: int, x: float, z: float) -> bool:
+        """判断坐标是否位于竞技场的竞技区域内（已包含越界容差）
+
+        Args:
+            arena: 竞技场
+            dim: 维度ID
+            x: X坐标
+            z: Z坐标
+
+        Returns:
+            bool: 是否在竞技区域内
+        """
+        for region in self.spatial_index.regions_at(dim, x, z):
+            if region.kind == REGION_ARENA and region.owner is arena:
+                return True
+        return False
+
+    def apply_arena_configs(self, arena_configs: List[Dict]):
+        """应用竞技场配置列表，已存在的竞技场保留运行状态
+
+        Args:
+            arena_configs: 竞技场配置列表
+        """
+        names = []
+        for index, arena_config in enumerate(arena_configs):
+            name = str(arena_config.get("name") or f"arena{index + 1}")
+            names.append(name)
+            if name in self.arenas:
+                self.arenas[name].load_config(arena_config)
+                self.register_arena_regions(self.arenas[name])
+            else:
+                self.create_arena(name, arena_config)
+
+        # 移除配置中已删除的空闲竞技场
+        for name in list(self.arenas):
+            if name in names:
+                continue
+            if self.arenas[name].state == GAME_STATE_IDLE:
+                self.release_spectators(self.arenas[name])
+                self.unregister_arena_regions(self.arenas.pop(name))
+            else:
+                plugin_print(f"竞技场 {name} 正在使用中，暂不移除", "WARNING")
+
+    def get_player_arena(self, player: Player) -> Optional[Arena]:
+        """获取玩家所在的竞技场
+
+        Args:
+            player: 玩家对象
+
+        Returns:
+            Optional[Arena]: 玩家所在竞技场，不在任何竞技场时返回None
+        """
+        return self.player_arena.get(player.id)
+
+    def get_spectator_arena(self, player: Player) -> Optional[Arena]:
+        """获取玩家正在观战的竞技场
+
+        Args:
+            player: 玩家对象
+
+        Returns:
+            Optional[Arena]: 正在观战的竞技场，没有观战时返回None
+        """
+        return self.spectator_arena.get(player.id)
+
     def load_config(self):
         """加载配置文件"""
         try:
@@ -595,47 +907,58 @@ class EasyHotPotatoPlugin(Plugin):
                 # 检查文件是否为空
                 if self.config_file.stat().st_size == 0:
                     plugin_print("配置文件为空，将创建默认配置", "WARNING")
+                    self.ensure_default_arena()
                     self.save_config()
                     return
 
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    import json
                     content = f.read()
                     if not content.strip():
                         plugin_print("配置文件内容为空，将创建默认配置", "WARNING")
+                        self.ensure_default_arena()
                         self.save_config()
                         return
 
                     config = json.loads(content)
-                    self.wait_pos = config.get("waitPos", {"x": 0, "y": 0, "z": 0, "dimid": 0})
-                    self.game_pos = config.get("gamePos", {"x": 100, "y": 64, "z": 100, "dimid": 0})
-                    self.area_size = config.get("areaSize", {"x": 10, "z": 10})
-                    self.wait_time = config.get("waitTime", 120)
-                    self.pre_time = config.get("preTime", 10)
-                    self.game_time = config.get("gameTime", 180)
-                    self.min_players = config.get("minPlayers", 2)
-                    self.max_players = config.get("maxPlayers", 0)  # 0表示无上限
-                    plugin_print("配置文件加载成功", "SUCCESS")
+                    self.effects_quality.load_config(config.get("effects", {}))
+                    self.message_channels = load_message_channels(config.get("messageChannels", {}))
+                    self.teleport_queue.per_tick = max(1, int(config.get("teleportsPerTick", DEFAULT_TELEPORTS_PER_TICK)))
+                    self.transfer_limiter.load_config(config.get("transferLimit", {}))
+                    self.boundary_schedule.load_config(config.get("boundaryCheck", {}))
+                    self.watchdog.load_config(config.get("watchdog", {}))
+                    arena_configs = config.get("arenas")
+                    if not arena_configs:
+                        # 兼容旧版的单竞技场配置
+                        arena_configs = [dict(config, name=DEFAULT_ARENA_NAME)]
+                    self.apply_arena_configs(arena_configs)
+                    self.ensure_default_arena()
+                    plugin_print(f"配置文件加载成功，共 {len(self.arenas)} 个竞技场", "SUCCESS")
             else:
                 # 创建默认配置
+                self.ensure_default_arena()
                 self.save_config()
                 plugin_print("未找到配置文件，已创建默认配置", "WARNING")
         except Exception as e:
             plugin_print(f"加载配置文件失败: {e}，将使用默认配置", "ERROR")
+            self.ensure_default_arena()
             self.save_config()
 
+    def ensure_default_arena(self):
+        """确保至少存在一个竞技场"""
+        if not self.arenas:
+            self.create_arena(DEFAULT_ARENA_NAME)
+
     def save_config(self):
         """保存配置文件"""
         try:
             config = {
-                "waitPos": self.wait_pos,
-                "gamePos": self.game_pos,
-                "areaSize": self.area_size,
-                "waitTime": self.wait_time,
-                "preTime": self.pre_time,
-                "gameTime": self.game_time,
-                "minPlayers": self.min_players,
-                "maxPlayers": self.max_players
+                "arenas": [arena.to_config() for arena in self.arenas.values()],
+                "effects": self.effects_quality.to_config(),
+                "messageChannels": self.message_channels,
+                "teleportsPerTick": self.teleport_queue.per_tick,
+                "transferLimit": self.transfer_limiter.to_config(),
+                "boundaryCheck": self.boundary_schedule.to_config(),
+                "watchdog": self.watchdog.to_config()
             }
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_file, 'w', encoding='utf-8') as f:
@@ -646,7 +969,7 @@ class EasyHotPotatoPlugin(Plugin):
 
     def reload_config(self, player: Optional[Player] = None):
         """重新加载配置文件
-        
+
         Args:
             player: 操作的管理员玩家
         """
@@ -664,58 +987,163 @@ class EasyHotPotatoPlugin(Plugin):
             self.show_admin_menu(player)
 
     @event_handler
-    def on_player_drop_item(self, event: PlayerDropItemEvent):
-        """玩家丢弃物品事件 - 阻止丢弃山芋"""
+    @timed
+    def on_player_join(self, event: PlayerJoinEvent):
+        """玩家进入服务器事件 - 显示大厅BossBar"""
         try:
-            if not self.game_active:
-                return
+            self.online_channel.add(event.player)
+            self.lobby_channel.add(event.player)
 
-            # 检查是否是玩家
-            if not hasattr(event, 'player') or not isinstance(event.player, Player):
-                return
+            if self.bossbar:
+                self.bossbar.add_player(event.player)
+
+            # 大厅有玩家可见时才运行跑马灯
+            self.refresh_rainbow_marquee()
+        except Exception as e:
+            plugin_print(f"处理玩家进入事件失败: {e}", "ERROR")
 
+    @event_handler
+    @timed
+    def on_player_quit(self, event: PlayerQuitEvent):
+        """玩家退出服务器事件 - 离开竞技场和所有消息频道，大厅无人时停止跑马灯"""
+        try:
             player = event.player
+            self.online_channel.discard(player)
+            self.lobby_channel.discard(player)
+
+            # 离开所在竞技场，被踢出的玩家在广播中显示踢出原因
+            kicked = player.id in self.kicked_players
+            self.kicked_players.discard(player.id)
+            self.handle_player_disconnect(player, "被踢出了服务器" if kicked else "断开了连接")
+
+            self.outbox.discard(player)
+            self.location_cache.invalidate(player)
+            self.boundary_pending.discard(player.id)
+            if self.bossbar:
+                self.bossbar.remove_player(player)
+
+            self.refresh_rainbow_marquee(exclude=player)
+        except Exception as e:
+            plugin_print(f"处理玩家退出事件失败: {e}", "ERROR")
+
+    @event_handler(priority=EventPriority.MONITOR, ignore_cancelled=True)
+    @timed
+    def on_player_kick(self, event: PlayerKickEvent):
+        """玩家被踢出事件 - 只记录踢出，离开竞技场由随后的退出事件处理
+
+        在 MONITOR 优先级监听且忽略已取消的事件，其他插件取消踢出时玩家不受影响。
+        """
+        self.kicked_players.add(event.player.id)
+
+    @event_handler
+    @timed
+    def on_player_teleport(self, event: PlayerTeleportEvent):
+        """玩家传送事件 - 使位置快照失效（包括其他插件或命令触发的传送）"""
+        self.location_cache.invalidate(event.player)
+
+    @event_handler
+    @timed
+    def on_player_move(self, event: PlayerMoveEvent):
+        """玩家移动事件 - 事件驱动或混合模式下的越界检测"""
+        if not self.boundary_schedule.listens:
+            return
+
+        # 快速过滤：不在进行中游戏里的玩家直接返回
+        player = event.player
+        arena = self.player_arena.get(player.id)
+        if arena is None or not arena.game_active or player.id in self.boundary_pending:
+            self.event_counters["move_filtered"] += 1
+            return
+        self.event_counters["move_checked"] += 1
+
+        try:
+            if player not in arena.participants.alive:
+                return
+
+            to = event.to_location
+            dim = get_dimension_id(to.dimension)
+            # 与竞技区域的包围盒比较（已包含越界容差）
+            region = self.spatial_index.get_region(arena.arena_region_key)
+            if region is not None and not region.contains(dim, to.x, to.z):
+                # 不在移动事件中传送玩家，下一个 tick 再淘汰
+                self.boundary_pending.add(player.id)
+                self.pipeline.schedule(lambda: self.eliminate_pending_out_of_bounds(arena, player))
+        except Exception as e:
+            plugin_print(f"处理玩家移动事件失败: {e}", "ERROR")
+
+    @event_handler
+    @timed
+    def on_player_drop_item(self, event: PlayerDropItemEvent):
+        """玩家丢弃物品事件 - 阻止丢弃山芋"""
+        # 快速过滤：不在竞技场中的玩家直接返回
+        player = event.player
+        arena = self.player_arena.get(player.id)
+        if arena is None or arena.potato_holder is None:
+            self.event_counters["drop_filtered"] += 1
+            return
+        self.event_counters["drop_accepted"] += 1
 
-            # 如果玩家不在游戏中，不阻止
-            if player not in self.players_in_game:
+        try:
+            # 只阻止进行中游戏里的山芋持有者
+            if not arena.game_active or arena.potato_holder != player:
                 return
 
-            # 检查是否是山芋持有者
-            if self.potato_holder == player:
-                # 取消丢弃事件
-                event.is_cancelled = True
-                player.send_message("§c你不能丢弃烫手山芋！")
-                plugin_print(f"阻止玩家 {player.name} 丢弃山芋", "INFO")
+            # 取消丢弃事件，并在下次填充时重新核对快捷栏
+            event.is_cancelled = True
+            self.potato_hotbar.mark_dirty(player)
+            player.send_message("§c你不能丢弃烫手山芋！")
+            plugin_print(f"阻止玩家 {player.name} 丢弃山芋", "INFO")
         except Exception as e:
             plugin_print(f"处理玩家丢弃物品事件失败: {e}", "ERROR")
 
     @event_handler
+    @timed
+    def on_player_item_consume(self, event: PlayerItemConsumeEvent):
+        """玩家食用物品事件 - 持有者吃掉山芋后在下次填充时补回"""
+        try:
+            player = event.player
+            inventory = player.inventory
+            if inventory is not None:
+                self.potato_hotbar.mark_dirty(player, inventory.held_item_slot)
+        except Exception as e:
+            plugin_print(f"处理玩家食用物品事件失败: {e}", "ERROR")
+
+    @event_handler
+    @timed
     def on_actor_damage(self, event: ActorDamageEvent):
         """实体受伤事件 - 实现绝对传递机制"""
+        # 快速过滤：受害者不在进行中的游戏里时直接返回（实体ID与玩家ID同属一个命名空间）
+        arena = self.player_arena.get(event.actor.id)
+        if arena is None or arena.potato_holder is None:
+            self.event_counters["damage_filtered"] += 1
+            return
+
         try:
-            if not self.game_active:
+            # 伤害来源必须是同一竞技场中的玩家
+            attacker = event.damage_source.actor
+            if attacker is None or self.player_arena.get(attacker.id) is not arena:
+                self.event_counters["damage_filtered"] += 1
                 return
+            self.event_counters["damage_accepted"] += 1
 
-            # 检查伤害来源和受害者是否都是玩家
-            damage_source = event.damage_source
-            if not hasattr(damage_source, 'actor') or not isinstance(damage_source.actor, Player):
+            if not arena.game_active:
                 return
 
-            if not isinstance(event.actor, Player):
+            # 持有者冷却中或本 tick 传递次数已满时直接拒绝，不做任何背包或网络操作
+            if attacker.id != arena.potato_holder.id or not self.transfer_limiter.allow(attacker.id):
                 return
 
-            attacker = damage_source.actor
             victim = event.actor
-
             plugin_print(f"玩家 {attacker.name} 攻击了玩家 {victim.name}", "INFO")
 
-            # 只有持有山芋的玩家攻击未持有山芋的玩家时才传递
-            if self.potato_holder == attacker and victim in self.players_in_game and victim != self.potato_holder:
+            # 只有持有山芋的玩家攻击同一竞技场中未持有山芋的玩家时才传递
+            if arena.potato_holder == attacker and victim in arena.participants.alive and victim != arena.potato_holder:
                 plugin_print(f"山芋将从 {attacker.name} 传递到 {victim.name}", "INFO")
-                self.transfer_potato_to(attacker, victim)
+                self.transfer_potato_to(arena, attacker, victim)
         except Exception as e:
             self.logger.error(f"处理实体受伤事件失败: {e}")
 
+    @timed
     def on_command(self, sender: CommandSenderWrapper, command: Command, args: list[str]) -> bool:
         """处理命令"""
         # 处理烫手山芋命令
@@ -759,6 +1187,13 @@ class EasyHotPotatoPlugin(Plugin):
                 target_name = sender.name
             self.show_player_stats_form(sender, target_name)
 
+        elif subcommand == "perf":
+            # 查看性能计数（管理员）
+            if not sender.has_permission("easyhotpotato.admin"):
+                sender.send_message("§c你没有权限使用此命令！")
+                return
+            sender.send_message(self.get_perf_status())
+
         elif subcommand == "help":
             # 显示帮助
             self.show_easyhotpotato_help(sender)
@@ -769,7 +1204,7 @@ class EasyHotPotatoPlugin(Plugin):
 
     def show_main_menu(self, player: Player):
         """显示主菜单
-        
+
         Args:
             player: 玩家对象
         """
@@ -779,154 +1214,319 @@ class EasyHotPotatoPlugin(Plugin):
             on_close=lambda p: p.send_message("§c你关闭了菜单")
         )
 
-        form.add_label(f"§6当前状态: {'§a游戏进行中' if self.game_active else '§c游戏未开始'}")
-        form.add_label(f"§e参与玩家: §f{len(self.players_in_game)}人")
-        if self.game_active and self.potato_holder:
-            form.add_label(f"§e当前持有者: §c{self.potato_holder.name}")
-        
+        arena = self.get_player_arena(player)
+        if arena:
+            form.add_label(f"§6所在竞技场: §f{arena.name}")
+            form.add_label(f"§6当前状态: {'§a游戏进行中' if arena.game_active else '§c游戏未开始'}")
+            form.add_label(f"§e参与玩家: §f{len(arena.participants.alive)}人")
+            if arena.game_active and arena.potato_holder:
+                form.add_label(f"§e当前持有者: §c{arena.potato_holder.name}")
+        else:
+            running = sum(1 for a in self.arenas.values() if a.game_active)
+            form.add_label(f"§6竞技场: §f{len(self.arenas)}个 §7| §a进行中: §f{running}个")
+            watching = self.get_spectator_arena(player)
+            if watching:
+                form.add_label(f"§b正在观战: §f{watching.name}")
+
         form.add_divider()
 
         # 核心功能按钮
-        if player in self.players_in_game:
+        if arena:
             form.add_button(text="§c离开战场", icon="textures/ui/icon_import", on_click=lambda p: self.leave_game(p))
         else:
-            form.add_button(text="§a进入战场", icon="textures/ui/color_plus", on_click=lambda p: self.join_game(p))
+            form.add_button(text="§a进入战场", icon="textures/ui/color_plus", on_click=lambda p: self.show_join_arena_form(p))
+            if self.get_spectator_arena(player):
+                form.add_button(text="§c停止观战", icon="textures/ui/cancel", on_click=lambda p: self.stop_spectating(p))
+            else:
+                form.add_button(text="§b观战", icon="textures/ui/spyglass_flat", on_click=lambda p: self.show_spectate_arena_form(p))
         form.add_button(text="§e查看排行", icon="textures/ui/icon_steve", on_click=lambda p: self.show_rankings_form(p))
         form.add_button(text="§b战局记录", icon="textures/ui/icon_bookshelf", on_click=lambda p: self.show_game_history_form(p))
-        
+
         # 管理员功能
         if player.is_op:
             form.add_button(text="§c后台管理", icon="textures/ui/icon_setting", on_click=lambda p: self.show_admin_menu(p))
 
         player.send_form(form)
 
-    def show_admin_menu(self, player: Player):
-        """显示管理员菜单
-        
+    def show_arena_select_form(self, player: Player, title: str, on_select, on_close=None):
+        """显示竞技场选择表单，只有一个竞技场时直接选择
+
         Args:
             player: 玩家对象
+            title: 表单标题
+            on_select: 选择回调，参数为 (玩家, 竞技场)
+            on_close: 关闭回调，参数为玩家
         """
+        arenas = list(self.arenas.values())
+        if len(arenas) == 1:
+            on_select(player, arenas[0])
+            return
+
         form = ActionForm(
-            title="§6后台管理",
-            content="§e请选择管理操作:",
-            on_close=lambda p: self.show_main_menu(p)
+            title=title,
+            content="§e请选择竞技场:",
+            on_close=on_close or (lambda p: self.show_main_menu(p))
         )
 
-        form.add_button(text="§a地理信息设置", icon="textures/ui/paste", on_click=lambda p: self.show_geo_settings_form(p))
-        form.add_button(text="§e参数调优", icon="textures/ui/pencil_edit_icon", on_click=lambda p: self.show_param_settings_form(p))
-        form.add_button(text="§c停止游戏", icon="textures/ui/cancel", on_click=lambda p: self.show_stop_game_confirm_form(p))
-        form.add_button(text="§b重新加载配置", icon="textures/ui/refresh", on_click=lambda p: self.reload_config(p))
-        form.add_button(text="§e返回主菜单", icon="textures/ui/arrow_left", on_click=lambda p: self.show_main_menu(p))
+        for arena in arenas:
+            state_label = ARENA_STATE_LABELS.get(arena.state, "§7未知")
+            form.add_button(
+                text=f"§e{arena.name} §7- {state_label} §f{len(arena.participants.alive)}人",
+                on_click=lambda p, a=arena: on_select(p, a)
+            )
+
         player.send_form(form)
 
-    def show_geo_settings_form(self, player: Player):
-        """显示地理信息设置菜单
-        
+    def show_join_arena_form(self, player: Player):
+        """显示加入竞技场表单
+
         Args:
             player: 玩家对象
         """
-        form = ActionForm(
-            title="§6地理信息设置",
-            content="§e请选择要设置的位置:",
-            on_close=lambda p: self.show_admin_menu(p)
-        )
+        self.show_arena_select_form(player, "§6选择竞技场", lambda p, arena: self.join_game(p, arena))
 
-        form.add_button(text="§a设置等待中心", icon="textures/ui/pencil_edit_icon", on_click=lambda p: self.set_wait_pos(p))
-        form.add_button(text="§b设置竞技中心", icon="textures/ui/pencil_edit_icon", on_click=lambda p: self.set_game_pos(p))
-        form.add_button(text="§e设置活动半径", icon="textures/ui/pencil_edit_icon", on_click=lambda p: self.show_area_size_form(p))
-        form.add_button(text="§e返回管理菜单", icon="textures/ui/arrow_left", on_click=lambda p: self.show_admin_menu(p))
-        player.send_form(form)
+    def show_spectate_arena_form(self, player: Player):
+        """显示观战竞技场选择表单
 
-    def set_wait_pos(self, player: Player):
-        """设置等待中心
-        
         Args:
             player: 玩家对象
         """
-        loc = player.location
-        self.wait_pos = {
-            "x": int(loc.x),
-            "y": int(loc.y),
-            "z": int(loc.z),
-            "dimid": 0  # 简化处理，默认维度
-        }
-        self.save_config()
-        player.send_message(f"§a等待中心已设置为当前位置: X={loc.x}, Y={loc.y}, Z={loc.z}")
-        self.show_geo_settings_form(player)
+        self.show_arena_select_form(player, "§6选择观战的竞技场", lambda p, arena: self.spectate_arena(p, arena))
+
+    def show_admin_menu(self, player: Player):
+        """显示管理员菜单
 
-    def set_game_pos(self, player: Player):
-        """设置竞技中心
-        
         Args:
             player: 玩家对象
         """
-        loc = player.location
-        self.game_pos = {
-            "x": int(loc.x),
-            "y": int(loc.y),
-            "z": int(loc.z),
-            "dimid": 0  # 简化处理，默认维度
-        }
-        self.save_config()
-        player.send_message(f"§a竞技中心已设置为当前位置: X={loc.x}, Y={loc.y}, Z={loc.z}")
-        self.show_geo_settings_form(player)
+        form = ActionForm(
+            title="§6后台管理",
+            content="§e请选择管理操作:",
+            on_close=lambda p: self.show_main_menu(p)
+        )
+
+        back = lambda p: self.show_admin_menu(p)
+        form.add_button(text="§a地理信息设置", icon="textures/ui/paste", on_click=lambda p: self.show_arena_select_form(p, "§6地理信息设置", self.show_geo_settings_form, back))
+        form.add_button(text="§e参数调优", icon="textures/ui/pencil_edit_icon", on_click=lambda p: self.show_arena_select_form(p, "§6参数调优", self.show_param_settings_form, back))
+        form.add_button(text="§c停止游戏", icon="textures/ui/cancel", on_click=lambda p: self.show_arena_select_form(p, "§6停止游戏", self.show_stop_game_confirm_form, back))
+        form.add_button(text="§a新建竞技场", icon="textures/ui/color_plus", on_click=lambda p: self.show_create_arena_form(p))
+        form.add_button(text="§c删除竞技场", icon="textures/ui/trash", on_click=lambda p: self.show_arena_select_form(p, "§6删除竞技场", self.show_delete_arena_confirm_form, back))
+        form.add_button(text="§b重新加载配置", icon="textures/ui/refresh", on_click=lambda p: self.reload_config(p))
+        form.add_button(text="§e返回主菜单", icon="textures/ui/arrow_left", on_click=lambda p: self.show_main_menu(p))
+        player.send_form(form)
+
+    def show_create_arena_form(self, player: Player):
+        """显示新建竞技场表单
 
-    def show_area_size_form(self, player: Player):
-        """显示活动半径设置表单
-        
         Args:
             player: 玩家对象
         """
         form = ModalForm(
-            title="§6设置活动半径",
+            title="§6新建竞技场",
             submit_button="§a确认",
-            on_submit=lambda p, data: self.handle_area_size_form(p, data),
-            on_close=lambda p: self.show_geo_settings_form(p)
+            on_submit=lambda p, data: self.handle_create_arena_form(p, data),
+            on_close=lambda p: self.show_admin_menu(p)
         )
 
-        form.add_control(TextInput(label="§eX轴半径", default_value=str(self.area_size["x"]), placeholder="输入X轴最大活动范围"))
-        form.add_control(TextInput(label="§eZ轴半径", default_value=str(self.area_size["z"]), placeholder="输入Z轴最大活动范围"))
+        form.add_control(TextInput(label="§e竞技场名称", default_value=f"arena{len(self.arenas) + 1}", placeholder="输入竞技场名称"))
         player.send_form(form)
 
-    def handle_area_size_form(self, player: Player, data):
-        """处理活动半径设置表单
-        
+    def handle_create_arena_form(self, player: Player, data):
+        """处理新建竞技场表单，新竞技场以管理员当前位置为竞技中心
+
         Args:
             player: 玩家对象
             data: 表单数据
         """
         try:
-            # 检查数据是否有效
-            if data is None:
-                player.send_message("§c表单数据不完整，请重新填写！")
-                self.show_geo_settings_form(player)
-                return
-            
-            # 检查data是否是字符串，如果是，尝试解析为JSON
             if isinstance(data, str):
-                import json
                 try:
                     data = json.loads(data)
                 except json.JSONDecodeError:
                     player.send_message("§c数据格式错误，请重试！")
-                    self.show_geo_settings_form(player)
                     return
-            
-            # 确保data是列表
-            if not isinstance(data, list) or len(data) < 2:
-                player.send_message("§c表单数据不完整，请重新填写！")
-                self.show_geo_settings_form(player)
+
+            if not isinstance(data, list) or not data or not isinstance(data[0], str) or not data[0].strip():
+                player.send_message("§c请输入有效的竞技场名称！")
                 return
-            
-            # 处理元素，转换为整数
-            x_size = None
+
+            name = data[0].strip()
+            if name in self.arenas:
+                player.send_message(f"§c竞技场 {name} 已存在！")
+                return
+
+            # 服务器负载过高时暂停创建新竞技场
+            if not self.watchdog.allows(DEGRADE_ADMISSION):
+                player.send_message("§c服务器负载过高，暂时无法创建新竞技场，请稍后再试！")
+                return
+
+            arena = self.create_arena(name)
+            loc = player.location
+            arena.game_pos = {"x": int(loc.x), "y": int(loc.y), "z": int(loc.z), "dimid": get_dimension_id(loc.dimension)}
+            self.register_arena_regions(arena)
+            self.save_config()
+            player.send_message(f"§a竞技场 §e{name} §a已创建，竞技中心为当前位置")
+            plugin_print(f"管理员 {player.name} 创建了竞技场 {name}", "SUCCESS")
+        except Exception as e:
+            plugin_print(f"处理新建竞技场表单失败: {e}", "ERROR")
+            player.send_message("§c处理表单时发生错误，请重试！")
+        finally:
+            self.show_admin_menu(player)
+
+    def show_delete_arena_confirm_form(self, player: Player, arena: Arena):
+        """显示删除竞技场确认表单
+
+        Args:
+            player: 玩家对象
+            arena: 要删除的竞技场
+        """
+        form = MessageForm(
+            title="§6删除竞技场确认",
+            content=f"§c你确定要删除竞技场 §e{arena.name} §c吗？",
+            button1="§a确认删除",
+            button2="§c取消",
+            on_submit=lambda p, choice: self.handle_delete_arena_confirm(p, arena, choice)
+        )
+        player.send_form(form)
+
+    def handle_delete_arena_confirm(self, player: Player, arena: Arena, choice: int):
+        """处理删除竞技场确认
+
+        Args:
+            player: 玩家对象
+            arena: 要删除的竞技场
+            choice: 选择的按钮 (0=确认, 1=取消)
+        """
+        if choice == 0:
+            if len(self.arenas) <= 1:
+                player.send_message("§c至少需要保留一个竞技场！")
+            elif arena.state != GAME_STATE_IDLE:
+                player.send_message("§c竞技场中还有玩家，无法删除！")
+            else:
+                self.release_spectators(arena)
+                self.arenas.pop(arena.name, None)
+                self.unregister_arena_regions(arena)
+                self.save_config()
+                player.send_message(f"§a竞技场 §e{arena.name} §a已删除")
+        else:
+            player.send_message("§e已取消删除竞技场操作")
+
+        self.show_admin_menu(player)
+
+    def show_geo_settings_form(self, player: Player, arena: Arena):
+        """显示地理信息设置菜单
+
+        Args:
+            player: 玩家对象
+            arena: 要设置的竞技场
+        """
+        form = ActionForm(
+            title=f"§6地理信息设置 - {arena.name}",
+            content="§e请选择要设置的位置:",
+            on_close=lambda p: self.show_admin_menu(p)
+        )
+
+        form.add_button(text="§a设置等待中心", icon="textures/ui/pencil_edit_icon", on_click=lambda p: self.set_wait_pos(p, arena))
+        form.add_button(text="§b设置竞技中心", icon="textures/ui/pencil_edit_icon", on_click=lambda p: self.set_game_pos(p, arena))
+        form.add_button(text="§e设置活动半径", icon="textures/ui/pencil_edit_icon", on_click=lambda p: self.show_area_size_form(p, arena))
+        form.add_button(text="§e返回管理菜单", icon="textures/ui/arrow_left", on_click=lambda p: self.show_admin_menu(p))
+        player.send_form(form)
+
+    def set_wait_pos(self, player: Player, arena: Arena):
+        """设置等待中心
+
+        Args:
+            player: 玩家对象
+            arena: 要设置的竞技场
+        """
+        loc = player.location
+        arena.wait_pos = {
+            "x": int(loc.x),
+            "y": int(loc.y),
+            "z": int(loc.z),
+            "dimid": get_dimension_id(loc.dimension)
+        }
+        self.register_arena_regions(arena)
+        self.save_config()
+        player.send_message(f"§a等待中心已设置为当前位置: X={loc.x}, Y={loc.y}, Z={loc.z}")
+        self.show_geo_settings_form(player, arena)
+
+    def set_game_pos(self, player: Player, arena: Arena):
+        """设置竞技中心
+
+        Args:
+            player: 玩家对象
+            arena: 要设置的竞技场
+        """
+        loc = player.location
+        arena.game_pos = {
+            "x": int(loc.x),
+            "y": int(loc.y),
+            "z": int(loc.z),
+            "dimid": get_dimension_id(loc.dimension)
+        }
+        self.register_arena_regions(arena)
+        self.save_config()
+        player.send_message(f"§a竞技中心已设置为当前位置: X={loc.x}, Y={loc.y}, Z={loc.z}")
+        self.show_geo_settings_form(player, arena)
+
+    def show_area_size_form(self, player: Player, arena: Arena):
+        """显示活动半径设置表单
+
+        Args:
+            player: 玩家对象
+            arena: 要设置的竞技场
+        """
+        form = ModalForm(
+            title=f"§6设置活动半径 - {arena.name}",
+            submit_button="§a确认",
+            on_submit=lambda p, data: self.handle_area_size_form(p, arena, data),
+            on_close=lambda p: self.show_geo_settings_form(p, arena)
+        )
+
+        form.add_control(TextInput(label="§eX轴半径", default_value=str(arena.area_size["x"]), placeholder="输入X轴最大活动范围"))
+        form.add_control(TextInput(label="§eZ轴半径", default_value=str(arena.area_size["z"]), placeholder="输入Z轴最大活动范围"))
+        player.send_form(form)
+
+    def handle_area_size_form(self, player: Player, arena: Arena, data):
+        """处理活动半径设置表单
+        
+        Args:
+            player: 玩家对象
+            arena: 要设置的竞技场
+            data: 表单数据
+        """
+        try:
+            # 检查数据是否有效
+            if data is None:
+                player.send_message("§c表单数据不完整，请重新填写！")
+                self.show_geo_settings_form(player, arena)
+                return
+            
+            # 检查data是否是字符串，如果是，尝试解析为JSON
+            if isinstance(data, str):
+                try:
+                    data = json.loads(data)
+                except json.JSONDecodeError:
+                    player.send_message("§c数据格式错误，请重试！")
+                    self.show_geo_settings_form(player, arena)
+                    return
+            
+            # 确保data是列表
+            if not isinstance(data, list) or len(data) < 2:
+                player.send_message("§c表单数据不完整，请重新填写！")
+                self.show_geo_settings_form(player, arena)
+                return
+            
+            # 处理元素，转换为整数
+            x_size = None
             z_size = None
             
             for i, item in enumerate(data[:2]):
                 # 处理None值
                 if item is None:
                     player.send_message("§c请输入有效的数字！")
-                    self.show_geo_settings_form(player)
+                    self.show_geo_settings_form(player, arena)
                     return
                 
                 # 处理字符串，去除空格
@@ -934,7 +1534,7 @@ class EasyHotPotatoPlugin(Plugin):
                     item = item.strip()
                     if not item:
                         player.send_message("§c请输入有效的数字！")
-                        self.show_geo_settings_form(player)
+                        self.show_geo_settings_form(player, arena)
                         return
                 
                 # 转换为整数并验证
@@ -943,7 +1543,7 @@ class EasyHotPotatoPlugin(Plugin):
                     if int_value <= 0:
                         field_name = "X轴半径" if i == 0 else "Z轴半径"
                         player.send_message(f"§c{field_name}必须大于0！")
-                        self.show_geo_settings_form(player)
+                        self.show_geo_settings_form(player, arena)
                         return
                     if i == 0:
                         x_size = int_value
@@ -952,49 +1552,53 @@ class EasyHotPotatoPlugin(Plugin):
                 except (ValueError, TypeError):
                     field_name = "X轴半径" if i == 0 else "Z轴半径"
                     player.send_message(f"§c{field_name}必须是有效的数字！")
-                    self.show_geo_settings_form(player)
+                    self.show_geo_settings_form(player, arena)
                     return
             
             # 检查是否成功获取值
             if x_size is None or z_size is None:
                 player.send_message("§c表单数据不完整，请重新填写！")
-                self.show_geo_settings_form(player)
+                self.show_geo_settings_form(player, arena)
                 return
             
             # 更新活动半径并保存
-            self.area_size = {"x": x_size, "z": z_size}
+            arena.area_size = {"x": x_size, "z": z_size}
+            arena.invalidate_spawn_slots()
+            self.register_arena_regions(arena)
             self.save_config()
             player.send_message(f"§a活动半径已设置为: X={x_size}, Z={z_size}")
         except Exception as e:
             plugin_print(f"处理活动半径设置表单失败: {e}", "ERROR")
             player.send_message("§c处理表单时发生错误，请重试！")
         finally:
-            self.show_geo_settings_form(player)
+            self.show_geo_settings_form(player, arena)
 
-    def show_param_settings_form(self, player: Player):
+    def show_param_settings_form(self, player: Player, arena: Arena):
         """显示参数调优表单
-        
+
         Args:
             player: 玩家对象
+            arena: 要设置的竞技场
         """
         form = ModalForm(
-            title="§6参数调优",
+            title=f"§6参数调优 - {arena.name}",
             submit_button="§a确认",
-            on_submit=lambda p, data: self.handle_param_settings_form(p, data),
+            on_submit=lambda p, data: self.handle_param_settings_form(p, arena, data),
             on_close=lambda p: self.show_admin_menu(p)
         )
 
-        form.add_control(TextInput(label="§e最低人数", default_value=str(self.min_players), placeholder="触发自动开赛的最低人数"))
-        form.add_control(TextInput(label="§e游戏时长", default_value=str(self.game_time), placeholder="游戏时长（秒）"))
-        form.add_control(TextInput(label="§e热身时间", default_value=str(self.pre_time), placeholder="正式开赛前的热身倒计时（秒）"))
-        form.add_control(TextInput(label="§e等待时间", default_value=str(self.wait_time), placeholder="满人后的预备等待（秒）"))
+        form.add_control(TextInput(label="§e最低人数", default_value=str(arena.min_players), placeholder="触发自动开赛的最低人数"))
+        form.add_control(TextInput(label="§e游戏时长", default_value=str(arena.game_time), placeholder="游戏时长（秒）"))
+        form.add_control(TextInput(label="§e热身时间", default_value=str(arena.pre_time), placeholder="正式开赛前的热身倒计时（秒）"))
+        form.add_control(TextInput(label="§e等待时间", default_value=str(arena.wait_time), placeholder="满人后的预备等待（秒）"))
         player.send_form(form)
 
-    def handle_param_settings_form(self, player: Player, data):
+    def handle_param_settings_form(self, player: Player, arena: Arena, data):
         """处理参数调优表单
         
         Args:
             player: 玩家对象
+            arena: 要设置的竞技场
             data: 表单数据
         """
         try:
@@ -1010,7 +1614,6 @@ class EasyHotPotatoPlugin(Plugin):
             try:
                 # 检查data是否是字符串，如果是，尝试解析为JSON
                 if isinstance(data, str):
-                    import json
                     try:
                         data = json.loads(data)
                     except json.JSONDecodeError:
@@ -1068,34 +1671,35 @@ class EasyHotPotatoPlugin(Plugin):
                     return
             
             # 更新参数
-            self.min_players = data[0]
-            self.game_time = data[1]
-            self.pre_time = data[2]
-            self.wait_time = data[3]
+            arena.min_players = data[0]
+            arena.game_time = data[1]
+            arena.pre_time = data[2]
+            arena.wait_time = data[3]
             
             # 保存配置
             self.save_config()
             
             player.send_message("§a参数设置成功！")
-            plugin_print(f"参数已更新: 最低人数={self.min_players}, 游戏时长={self.game_time}, 热身时间={self.pre_time}, 等待时间={self.wait_time}", "SUCCESS")
+            plugin_print(f"竞技场 {arena.name} 参数已更新: 最低人数={arena.min_players}, 游戏时长={arena.game_time}, 热身时间={arena.pre_time}, 等待时间={arena.wait_time}", "SUCCESS")
         except Exception as e:
             plugin_print(f"处理参数设置表单失败: {e}", "ERROR")
             player.send_message("§c处理表单时发生错误，请重试！")
         finally:
             self.show_admin_menu(player)
 
-    def show_stop_game_confirm_form(self, player: Player):
+    def show_stop_game_confirm_form(self, player: Player, arena: Arena):
         """显示停止游戏确认表单
-        
+
         Args:
             player: 玩家对象
+            arena: 要停止游戏的竞技场
         """
         form = MessageForm(
             title="§6停止游戏确认",
-            content="§c你确定要停止当前游戏吗？\n§e这将结束正在进行的游戏并清空所有玩家状态。",
+            content=f"§c你确定要停止竞技场 §e{arena.name} §c的当前游戏吗？\n§e这将结束正在进行的游戏并清空所有玩家状态。",
             button1="§a确认停止",
             button2="§c取消",
-            on_submit=lambda p, choice: self.handle_stop_game_confirm(p, choice)
+            on_submit=lambda p, choice: self.handle_stop_game_confirm(p, arena, choice)
         )
         player.send_form(form)
 
@@ -1105,9 +1709,14 @@ class EasyHotPotatoPlugin(Plugin):
         Args:
             player: 玩家对象
         """
+        arena = self.get_player_arena(player)
+        if arena is None:
+            player.send_message("§c你不在游戏中！")
+            return
+
         form = ActionForm(
             title="§6选择准备时间",
-            content=f"§e当前参与人数: §f{len(self.players_in_game)}人\n§e最低要求人数: §f{self.min_players}人\n§e最大人数限制: §f{'无限制' if self.max_players == 0 else str(self.max_players) + '人'}\n\n§e请选择游戏开始前的准备时间:",
+            content=f"§e当前参与人数: §f{len(arena.participants.alive)}人\n§e最低要求人数: §f{arena.min_players}人\n§e最大人数限制: §f{'无限制' if arena.max_players == 0 else str(arena.max_players) + '人'}\n\n§e请选择游戏开始前的准备时间:",
             on_close=lambda p: p.send_message("§c你取消了准备时间选择")
         )
 
@@ -1138,36 +1747,38 @@ class EasyHotPotatoPlugin(Plugin):
             player: 选择准备时间的玩家
             wait_time: 准备时间（秒）
         """
+        arena = self.get_player_arena(player)
+        if arena is None or arena.state != GAME_STATE_WAITING:
+            player.send_message("§c当前无法开始游戏！")
+            return
+
         if wait_time == 0:
             player.send_message("§a游戏即将开始！")
-            self.server.broadcast_message(f"§e{player.name} §a选择了立即开始游戏！")
-            self.start_pre_game_countdown()
+            self.announce(arena, MESSAGE_READY, f"§e{player.name} §a选择了立即开始游戏！")
+            self.start_pre_game_countdown(arena)
         else:
             player.send_message(f"§a游戏将在 §e{wait_time} §a秒后开始！")
-            self.server.broadcast_message(f"§e{player.name} §a选择了等待 §e{wait_time} §a秒后开始游戏！")
-            # 延迟指定时间后开始预热倒计时
-            self.server.scheduler.run_task(
-                self,
-                lambda: self.start_pre_game_countdown(),
-                delay=wait_time * 20  # 转换为ticks（1秒=20ticks）
-            )
+            self.announce(arena, MESSAGE_READY, f"§e{player.name} §a选择了等待 §e{wait_time} §a秒后开始游戏！")
+            # 重新开始等待倒计时，结束后进入预热倒计时
+            self.start_wait_countdown_bossbar(arena, wait_time)
 
-    def handle_stop_game_confirm(self, player: Player, choice: int):
+    def handle_stop_game_confirm(self, player: Player, arena: Arena, choice: int):
         """处理停止游戏确认
-        
+
         Args:
             player: 玩家对象
+            arena: 要停止游戏的竞技场
             choice: 选择的按钮 (0=确认, 1=取消)
         """
         if choice == 0:  # 确认停止
-            if self.game_active:
-                self.stop_game("管理员强制停止")
+            if arena.state_machine.is_in(GAME_STATE_RUNNING, GAME_STATE_ENDING):
+                self.stop_game(arena, "管理员强制停止")
                 player.send_message("§a游戏已停止！")
             else:
                 player.send_message("§c当前没有正在进行的游戏！")
         else:  # 取消
             player.send_message("§e已取消停止游戏操作")
-        
+
         # 返回管理员菜单
         self.show_admin_menu(player)
 
@@ -1228,6 +1839,20 @@ class EasyHotPotatoPlugin(Plugin):
             form.add_label(f"§a胜场数: §f{stats['wins']}")
             form.add_label(f"§e总场次: §f{stats['games']}")
             form.add_label(f"§b胜率: §f{stats['win_rate']}%")
+            progress = stats.get("progress")
+            if progress:
+                fastest = progress.get(PROGRESS_FASTEST_PASS)
+                form.add_label(f"§e当前连胜: §f{progress.get(PROGRESS_WIN_STREAK, 0)} §7| §e最高连胜: §f{progress.get(PROGRESS_BEST_WIN_STREAK, 0)}")
+                form.add_label(f"§e躲过爆炸: §f{progress.get(PROGRESS_EXPLOSIONS_SURVIVED, 0)}次")
+                form.add_label(f"§e最快传递: §f{f'{fastest}秒' if fastest is not None else '无'}")
+                form.add_label(f"§e未碰山芋坚持到最后: §f{progress.get(PROGRESS_UNTOUCHED_GAMES, 0)}局")
+            unlocked = stats.get("achievements", {})
+            form.add_label(f"§6成就 ({len(unlocked)}/{len(ACHIEVEMENTS)}):")
+            for achievement in ACHIEVEMENTS:
+                if achievement.id in unlocked:
+                    form.add_label(f"§a✔ {achievement.name} §7- {achievement.description}")
+                else:
+                    form.add_label(f"§8✘ {achievement.name} §7- {achievement.description}")
         else:
             form.add_label(f"§c玩家 {target_name} 还没有战绩记录")
         
@@ -1235,304 +1860,464 @@ class EasyHotPotatoPlugin(Plugin):
         form.add_button(text="§e返回主菜单", icon="textures/ui/arrow_left", on_click=lambda p: self.show_main_menu(p))
         player.send_form(form)
 
-    def start_game(self) -> bool:
-        """开始游戏
-        
+    def start_game(self, arena: Arena) -> bool:
+        """开始游戏：分批把玩家传送到竞技区域，全部到达后正式开赛
+
+        Args:
+            arena: 竞技场
+
         Returns:
-            bool: 是否成功开始游戏
+            bool: 是否开始传送玩家
         """
-        if self.game_active:
+        if not arena.state_machine.can_transition(GAME_STATE_RUNNING) or arena.teleport_batch is not None:
             return False
-            
-        if len(self.players_in_game) < self.min_players:
-            self.server.broadcast_message(f"§c玩家数量不足，至少需要 {self.min_players} 人！")
+
+        if len(arena.participants.alive) < arena.min_players:
+            self.announce(arena, MESSAGE_READY, f"§c[{arena.name}] 玩家数量不足，至少需要 {arena.min_players} 人！")
+            # 退回等待状态
+            arena.state_machine.transition(GAME_STATE_WAITING if arena.participants.alive else GAME_STATE_IDLE)
             return False
-            
-        self.game_active = True
-        self.game_start_time = time.time()
-        self.game_start_timestamp = time.time()  # 记录游戏开始的时间戳
+
+        # 从缓存的出生点中为玩家分配位置，出生点之间保持间距，避免开局扎堆
+        spawn_slots = arena.get_spawn_slots(len(arena.participants.alive))
+        spawn_slots.begin()
+        jobs = []
+        for player in arena.participants.alive:
+            x_offset, z_offset = spawn_slots.next()
+
+            # 计算新位置（基于游戏中心坐标）
+            new_x = arena.game_pos["x"] + x_offset
+            new_z = arena.game_pos["z"] + z_offset
+            new_y = arena.game_pos["y"]
+
+            location = Location(dimension=self.get_arena_dimension(player, arena.game_pos), x=new_x, y=new_y, z=new_z)
+            message = f"§a你已被传送到游戏区域: X={new_x:.2f}, Y={new_y:.2f}, Z={new_z:.2f}"
+            jobs.append((player, location, lambda p, message=message: p.send_message(message)))
+
+        # 按顺序分批传送，所有玩家到达后正式开赛；传送前已离开的玩家会被跳过
+        arena.teleport_batch = self.teleport_queue.submit(
+            jobs,
+            on_complete=lambda: self.launch_game(arena),
+            should_run=lambda p: p in arena.participants.alive
+        )
+        return True
+
+    def launch_game(self, arena: Arena):
+        """所有玩家到达竞技区域后正式开始游戏
+
+        Args:
+            arena: 竞技场
+        """
+        arena.teleport_batch = None
+
+        # 传送期间玩家离开导致人数不足时，把剩余玩家送回等待中心
+        if arena.state != GAME_STATE_PREPARING or len(arena.participants.alive) < arena.min_players:
+            self.announce(arena, MESSAGE_READY, f"§c[{arena.name}] 玩家数量不足，至少需要 {arena.min_players} 人！")
+            self.teleport_queue.submit(
+                [(player, self.get_wait_location(arena, player), None) for player in arena.participants.alive],
+                should_run=lambda p: self.player_arena.get(p.id) is arena
+            )
+            if arena.state == GAME_STATE_PREPARING:
+                arena.state_machine.transition(GAME_STATE_WAITING if arena.participants.alive else GAME_STATE_IDLE)
+            return
+
+        arena.game_start_time = time.time()
+        arena.game_start_timestamp = time.time()  # 记录游戏开始的时间戳
+        arena.departed_players.clear()
+        arena.timeline.begin(arena.participants.alive, arena.game_start_timestamp)
         self.game_id += 1  # 递增游戏ID
-        
-        # 停止彩虹跑马灯
-        self.stop_rainbow_marquee()
-        
+        arena.game_id = self.game_id
+
         # 随机选择一个玩家作为初始山芋持有者
-        self.potato_holder = random.choice(list(self.players_in_game))
-        
-        # 随机分配玩家位置
-        for player in self.players_in_game:
-            # 在游戏区域内随机生成位置（基于游戏中心坐标）
-            # 确保玩家不会出界，使用浮点数计算
-            x_offset = random.uniform(-self.area_size["x"] + 0.5, self.area_size["x"] - 0.5)
-            z_offset = random.uniform(-self.area_size["z"] + 0.5, self.area_size["z"] - 0.5)
-            
-            # 计算新位置（基于游戏中心坐标）
-            new_x = self.game_pos["x"] + x_offset
-            new_z = self.game_pos["z"] + z_offset
-            new_y = self.game_pos["y"]
-            
-            # 使用Location对象传送玩家
-            try:
-                location = Location(dimension=player.dimension, x=new_x, y=new_y, z=new_z)
-                player.teleport(location)
-                player.send_message(f"§a你已被传送到游戏区域: X={new_x:.2f}, Y={new_y:.2f}, Z={new_z:.2f}")
-            except Exception as e:
-                plugin_print(f"传送玩家失败: {e}", "WARNING")
+        arena.potato_holder = arena.participants.alive.random_choice()
+        arena.timeline.hold(arena.potato_holder, arena.game_start_timestamp)
+        self.achievements.game_started(arena.participants.alive, arena.potato_holder, arena.game_start_timestamp)
 
         # 给持有者填充山芋
-        self.give_potato_to_player(self.potato_holder)
-        
+        self.give_potato_to_player(arena.potato_holder)
+
         # 广播游戏开始
-        self.server.broadcast_message("§6===== 烫手山芋游戏开始 =====")
-        self.server.broadcast_message(f"§e初始持有者: §c{self.potato_holder.name}")
-        self.server.broadcast_message(f"§e游戏时长: §f{self.game_time}秒")
-        
+        self.announce(arena, MESSAGE_GAME_START, f"§6===== 烫手山芋游戏开始 [{arena.name}] =====")
+        self.announce(arena, MESSAGE_GAME_INFO, f"§e初始持有者: §c{arena.potato_holder.name}")
+        self.announce(arena, MESSAGE_GAME_INFO, f"§e游戏时长: §f{arena.game_time}秒")
+
         # 通知持有者
-        self.potato_holder.send_message("§c你是初始的山芋持有者！快传给别人！")
-        
-        # 启动游戏计时器
-        self.start_countdown()
-        
-        # 启动粒子效果任务
-        self.start_particle_task()
-        
-        # 启动位置检查任务
-        self.start_position_check_task()
-        
-        plugin_print("游戏已开始", "SUCCESS")
-        return True
-        
-    def stop_game(self, reason: str = "游戏结束") -> bool:
+        arena.potato_holder.send_message("§c你是初始的山芋持有者！快传给别人！")
+
+        # 进入游戏状态，启动计时器、粒子效果和位置检查任务
+        arena.state_machine.transition(GAME_STATE_RUNNING)
+
+        plugin_print(f"竞技场 {arena.name} 游戏已开始", "SUCCESS")
+
+    def stop_game(self, arena: Arena, reason: str = "游戏结束") -> bool:
         """停止游戏
-        
+
         Args:
+            arena: 竞技场
             reason: 停止原因
-            
+
         Returns:
             bool: 是否成功停止游戏
         """
-        if self.stop_game_task:
-            self.stop_game_task.cancel()
-        if not self.game_active:
+        # 进入结束状态时会自动取消游戏进行中的所有任务
+        if arena.state == GAME_STATE_RUNNING:
+            arena.state_machine.transition(GAME_STATE_ENDING)
+        elif arena.state != GAME_STATE_ENDING or arena.teleport_batch is not None:
+            # 不在游戏中，或者已经在散场
             return False
-            
-        self.game_active = False
-        
-        # 停止所有任务
-        if self.countdown_task:
-            self.countdown_task.cancel()
-            self.countdown_task = None
-            
-        if self.pre_game_task:
-            self.pre_game_task.cancel()
-            self.pre_game_task = None
-            
-        # 停止粒子效果任务
-        self.stop_particle_task()
-        
-        # 停止位置检查任务
-        self.stop_position_check_task()
-        
-        # 将玩家传送回等待中心
-        # 移除所有参与游戏玩家的山芋（包括被淘汰的玩家）
-        for player in self.all_players_in_game:
-            try:
-                self.remove_potato_from_inventory(player)
-                # 将玩家传送回等待中心
-                self.teleport_to_wait_pos(player)
-            except Exception as e:
-                plugin_print(f"传送玩家 {player.name} 失败: {e}", "WARNING")
-            
-        # 广播游戏结束
-        self.server.broadcast_message("§6===== 烫手山芋游戏结束 =====")
-        self.server.broadcast_message(f"§e原因: §f{reason}")
-        
-        # 如果只剩一个玩家，宣布获胜者
+
+        # 如果只剩一个玩家，该玩家获胜
         winner = None
-        if len(self.players_in_game) == 1:
-            winner = list(self.players_in_game)[0]
-            self.server.broadcast_message(f"§a恭喜 §e{winner.name} §a获得了胜利！")
-            # 更新获胜者的战绩
-            self.data_manager.update_player_stats(winner.name, wins=1, games=1)
-            
-        # 保存玩家战绩数据
-        self.data_manager.save_player_stats()
+        if len(arena.participants.alive) == 1:
+            winner = next(iter(arena.participants.alive))
 
         # 记录战局信息
         end_time = time.time()
-        duration = int(end_time - self.game_start_timestamp)
+        duration = int(end_time - arena.game_start_timestamp)
         # 保存玩家ID和名称
-        players_info = [{"id": str(player.id), "name": player.name} for player in self.all_players_in_game]
+        players_info = [{"id": str(player.id), "name": player.name} for player in arena.participants]
+        players_info += [{"id": str(player_id), "name": name} for player_id, name in arena.departed_players.items()]
         game_record = {
-            "game_id": self.game_id,
-            "start_time": self.game_start_timestamp,
+            "game_id": arena.game_id,
+            "arena": arena.name,
+            "start_time": arena.game_start_timestamp,
             "end_time": end_time,
             "players": players_info,
             "winner": winner.name if winner else None,
             "duration": duration,
-            "reason": reason
+            "reason": reason,
+            "timeline": arena.timeline.summarize(end_time)
         }
-        self.data_manager.add_game_record(game_record)
-
-        # 清空所有玩家集合
-        self.all_players_in_game.clear()
 
-        # 重新启动彩虹跑马灯
-        self.start_rainbow_marquee()
+        # 公告、战绩与战局记录由事件订阅者处理
+        self.events.publish(GameEnded(arena, reason, winner, game_record))
+        arena.potato_holder = None
 
-        plugin_print(f"游戏已停止，原因: {reason}", "INFO")
+        # 分批把所有参与游戏的玩家（包括被淘汰的玩家）送回等待中心并移除山芋，全部完成后再结束对局
+        arena.teleport_batch = self.teleport_queue.submit(
+            [
+                (player, self.get_wait_location(arena, player), self.remove_potato_from_inventory)
+                for player in arena.participants
+            ],
+            on_complete=lambda: self.finish_game(arena, reason),
+            should_run=lambda p: self.player_arena.get(p.id) is arena
+        )
         return True
-        
+
+    def finish_game(self, arena: Arena, reason: str):
+        """散场传送完成后结束对局
+
+        Args:
+            arena: 竞技场
+            reason: 停止原因
+        """
+        arena.teleport_batch = None
+
+        # 被淘汰的玩家离开竞技场，剩余玩家留在竞技场等待下一局
+        for player in arena.participants.clear_eliminated():
+            self.unbind_player_arena(player)
+
+        # 回到等待或空闲状态
+        arena.state_machine.transition(GAME_STATE_WAITING if arena.participants.alive else GAME_STATE_IDLE)
+
+        plugin_print(f"竞技场 {arena.name} 游戏已停止，原因: {reason}", "INFO")
+
     def get_game_status(self) -> str:
-        """获取游戏状态
-        
+        """获取所有竞技场的游戏状态
+
         Returns:
             str: 游戏状态信息
         """
-        if not self.game_active:
-            return "§c游戏未在进行中！"
-            
-        elapsed_time = int(time.time() - self.game_start_time)
-        remaining_time = self.game_time - elapsed_time
-        
-        status = f"§6===== 烫手山芋游戏状态 =====\n"
-        status += f"§e游戏时长: §f{self.game_time}秒\n"
+        status = "§6===== 烫手山芋游戏状态 ====="
+        for arena in self.arenas.values():
+            status += "\n" + self.get_arena_status(arena)
+        return status
+
+    def get_perf_status(self) -> str:
+        """获取性能计数信息
+
+        Returns:
+            str: 性能计数信息
+        """
+        counters = self.event_counters
+        status = "§6===== 烫手山芋性能计数 =====\n"
+        status += f"§e受伤事件: §f过滤 {counters['damage_filtered']} §7| §f处理 {counters['damage_accepted']}\n"
+        status += f"§e丢弃事件: §f过滤 {counters['drop_filtered']} §7| §f处理 {counters['drop_accepted']}\n"
+        status += f"§e移动事件: §f过滤 {counters['move_filtered']} §7| §f检测 {counters['move_checked']}\n"
+        sounds = self.sound_emitter
+        status += f"§e音效: §f播放 {sounds.player_plays} §7| §f跳过重复 {sounds.duplicates}\n"
+        status += f"§e平均 tick 耗时: §f{self.pipeline.tick_cost_ema * 1000:.3f}ms §7| §e效果质量: §f{self.effects_quality.level}\n"
+        watchdog = self.watchdog
+        status += (f"§e看门狗: §f{DEGRADE_LABELS[watchdog.level]} §7| §f含事件处理 {watchdog.cost_ema * 1000:.3f}ms"
+                   f"/{watchdog.tick_budget_ms:g}ms §7| §f超出预算 {watchdog.overrun_ticks} tick\n")
+        status += f"§e位置快照: §f读取 {self.location_cache.reads} §7| §f命中 {self.location_cache.hits}\n"
+        status += f"§e越界检查: §f{self.boundary_schedule.mode} §7| §f轮询 {self.boundary_schedule.checks} 次 §7| §f待检查 {len(self.boundary_schedule)} 人\n"
+        status += f"§e消息: §f发送 {self.outbox.sent} §7| §f合并 {self.outbox.merged} §7| §f取代 {self.outbox.dropped}\n"
+        status += f"§e游戏事件: §f发布 {self.events.published} §7| §f延迟处理 {self.events.deferred}\n"
+        limiter = self.transfer_limiter
+        status += f"§e山芋传递: §f放行 {limiter.allowed} §7| §f冷却拒绝 {limiter.throttled_cooldown} §7| §f超限拒绝 {limiter.throttled_cap}"
+        return status
+
+    def get_arena_status(self, arena: Arena) -> str:
+        """获取单个竞技场的游戏状态
+
+        Args:
+            arena: 竞技场
+
+        Returns:
+            str: 游戏状态信息
+        """
+        state_label = ARENA_STATE_LABELS.get(arena.state, "§7未知")
+        if not arena.game_active:
+            return f"§e[{arena.name}] {state_label} §7| §e玩家: §f{len(arena.participants.alive)}人"
+
+        elapsed_time = int(time.time() - arena.game_start_time)
+        remaining_time = arena.game_time - elapsed_time
+
+        status = f"§e[{arena.name}] {state_label}\n"
+        status += f"§e游戏时长: §f{arena.game_time}秒\n"
         status += f"§e已过时间: §f{elapsed_time}秒\n"
         status += f"§e剩余时间: §f{remaining_time}秒\n"
-        status += f"§e当前持有者: §c{self.potato_holder.name if self.potato_holder else '无'}\n"
-        status += f"§e剩余玩家: §f{len(self.players_in_game)}人"
-        
+        status += f"§e当前持有者: §c{arena.potato_holder.name if arena.potato_holder else '无'}\n"
+        status += f"§e剩余玩家: §f{len(arena.participants.alive)}人\n"
+        status += f"§e观战人数: §f{len(arena.spectators)}人"
+
         return status
-        
-    def start_countdown(self):
-        """开始游戏倒计时"""
-        self.countdown_task = self.server.scheduler.run_task(self, self.game_tick, delay=20, period=20)
-        
-    def game_tick(self):
-        """游戏每秒执行的逻辑"""
-        if not self.game_active:
+
+    def game_tick(self, arena: Arena):
+        """游戏每秒执行的逻辑
+
+        Args:
+            arena: 竞技场
+        """
+        if not arena.game_active:
             return
-            
-        elapsed_time = int(time.time() - self.game_start_time)
-        remaining_time = self.game_time - elapsed_time
-        
-        # 更新BossBar
-        self.update_bossbar_game(remaining_time, self.game_time)
+
+        elapsed_time = int(time.time() - arena.game_start_time)
+        remaining_time = arena.game_time - elapsed_time
+
+        # 播放倒计时音效；BossBar 由 hud_tick 每 tick 推送，淘汰信息保留期间不会被覆盖
+        if 0 < remaining_time <= 5:
+            self.play_countdown_sound(arena, remaining_time)
 
         # 山芋爆炸
         if remaining_time <= 0:
-            self.explode_potato()
+            self.explode_potato(arena)
             return
-            
+
         # 倒计时提示（只在特定时间点发送一次）
         if remaining_time in [60, 30, 10, 5, 4, 3, 2, 1]:
             # 使用一个标志确保每个时间点只发送一次
-            if not hasattr(self, 'last_announced_time') or self.last_announced_time != remaining_time:
-                self.last_announced_time = remaining_time
-                self.server.broadcast_message(f"§e距离山芋爆炸还有 §c{remaining_time} §e秒！")
-            
-    def explode_potato(self):
-        """山芋爆炸，淘汰当前持有者"""
-        if not self.game_active or not self.potato_holder:
+            if arena.last_announced_time != remaining_time:
+                arena.last_announced_time = remaining_time
+                self.announce(arena, MESSAGE_COUNTDOWN, f"§e[{arena.name}] 距离山芋爆炸还有 §c{remaining_time} §e秒！",
+                              key=("countdown", arena.name))
+
+    def explode_potato(self, arena: Arena):
+        """山芋爆炸，淘汰当前持有者
+
+        Args:
+            arena: 竞技场
+        """
+        if not arena.game_active or not arena.potato_holder:
             return
-            
+
         # 立即重置游戏时间，防止重复触发爆炸
-        self.game_start_time = time.time()
+        arena.game_start_time = time.time()
 
         # 淘汰持有者
-        eliminated_player = self.potato_holder
-
-        # 先播放爆炸音效和效果（在淘汰玩家之前）
-        # 为所有玩家（包括被淘汰的玩家）制造爆炸效果
-        all_players = self.players_in_game.copy()
-        all_players.add(eliminated_player)
+        self.eliminate_player(arena, arena.potato_holder, ELIMINATED_EXPLOSION)
 
-        # 播放爆炸音效
-        self.play_explode_sound(all_players, eliminated_player)
+    def eliminate_player(self, arena: Arena, player: Player, cause: str):
+        """淘汰玩家：持有者被淘汰时重新分配山芋，只剩一名玩家时结束游戏
 
-        # 为所有玩家制造爆炸效果
-        self.create_explosion_effect(all_players, eliminated_player)
+        爆炸效果、公告、BossBar 和战绩由 PlayerEliminated 的订阅者处理。
 
-        # 淘汰持有者
-        self.players_in_game.discard(eliminated_player)
+        Args:
+            arena: 竞技场
+            player: 被淘汰的玩家
+            cause: 淘汰原因
+        """
+        was_holder = arena.potato_holder == player
 
-        # 确保被淘汰玩家在 all_players_in_game 集合中
-        self.all_players_in_game.add(eliminated_player)
-        
-        # 更新被淘汰玩家的战绩
-        self.data_manager.update_player_stats(eliminated_player.name, games=1)
+        # 淘汰玩家并清空其山芋
+        arena.participants.eliminate(player)
+        arena.timeline.eliminate(player, time.time(), cause)
+        self.remove_potato_from_inventory(player)
 
-        # 清空被淘汰玩家的山芋
-        self.remove_potato_from_inventory(eliminated_player)
+        # 订阅者在玩家被传送之前播放爆炸效果
+        self.events.publish(PlayerEliminated(arena, player, cause))
 
+        if cause == ELIMINATED_OUT_OF_BOUNDS:
+            # 将玩家传送到等待中心，防止留在竞技场外被反复判定
+            self.teleport_to_wait_pos(player, arena)
 
-        
-        # 广播淘汰信息
-        self.server.broadcast_message(f"§c山芋爆炸了！§e{eliminated_player.name} §c被淘汰！")
-        
-        # 更新BossBar显示淘汰信息
-        self.update_bossbar_eliminated(eliminated_player.name)
-        
         # 检查游戏是否结束
-        if len(self.players_in_game) <= 1:
-            self.server.broadcast_message("§e游戏正在结束，5秒后进行传送...")
+        if len(arena.participants.alive) <= 1:
+            self.announce(arena, MESSAGE_GAME_INFO, "§e游戏正在结束，5秒后进行传送...")
             # 清除所有玩家的山芋
-            for player in self.players_in_game:
-                self.remove_potato_from_inventory(player)
-            # 停止game_tick任务，防止继续更新BossBar
-            if self.countdown_task:
-                self.countdown_task.cancel()
-                self.countdown_task = None
-            self.stop_game_task = self.server.scheduler.run_task(self, lambda: self.stop_game("游戏结束"), delay=100)  # 5秒后停止游戏
+            for remaining in arena.participants.alive:
+                self.remove_potato_from_inventory(remaining)
+            arena.potato_holder = None
+            arena.timeline.hold(None, time.time())
+            # 进入结束状态，停止游戏进行中的所有任务，5秒后停止游戏
+            arena.state_machine.transition(GAME_STATE_ENDING)
+            arena.state_machine.run_task("stop_game", lambda: self.stop_game(arena, "游戏结束"), delay=100)
             return
-            
-        # 选择新的山芋持有者
-        self.potato_holder = random.choice(list(self.players_in_game))
-        
+
+        if was_holder:
+            # 选择新的山芋持有者
+            self.reassign_potato(arena, player)
+
+    def reassign_potato(self, arena: Arena, previous_holder: Player):
+        """持有者被淘汰或离开后，把山芋随机交给仍在游戏中的玩家
+
+        Args:
+            arena: 竞技场
+            previous_holder: 原持有者
+        """
+        arena.potato_holder = arena.participants.alive.random_choice()
+        arena.timeline.hold(arena.potato_holder, time.time())
+
         # 给新的持有者填充山芋
-        self.give_potato_to_player(self.potato_holder)
-        
-        self.potato_holder.send_message("§c你拿到了烫手山芋！快传给别人！")
-        self.server.broadcast_message(f"§e山芋从 §f{eliminated_player.name} §e转移到了 §c{self.potato_holder.name} §e手中！")
+        self.give_potato_to_player(arena.potato_holder)
+        self.events.publish(PotatoTransferred(arena, previous_holder, arena.potato_holder, TRANSFER_REASSIGN))
 
-    def transfer_potato_to(self, from_player: Player, to_player: Player):
+    def transfer_potato_to(self, arena: Arena, from_player: Player, to_player: Player):
         """将山芋从一个玩家转移到指定的玩家
 
         Args:
+            arena: 竞技场
             from_player: 山芋当前持有者
             to_player: 山芋的新持有者
         """
-        if not self.game_active or not self.potato_holder:
+        if not arena.game_active or not arena.potato_holder:
             return
 
-        if from_player != self.potato_holder:
+        if from_player != arena.potato_holder:
             return
 
-        if to_player not in self.players_in_game:
+        if to_player not in arena.participants.alive:
             return
 
         if to_player == from_player:
             return
 
-        self.potato_holder = to_player
+        arena.potato_holder = to_player
+        self.transfer_limiter.record(from_player.id, to_player.id)
+        arena.timeline.transfer(from_player, to_player, time.time())
 
         # 取消原持有者的山芋填充
         self.remove_potato_from_inventory(from_player)
-        
+
         # 给新持有者填充山芋
         self.give_potato_to_player(to_player)
 
-        # 发送嘲讽消息
-        taunt = random.choice(TAUNT_MESSAGES)
-        from_player.send_message(f"§e{taunt}")
-        to_player.send_message(f"§c{from_player.name}: {taunt}")
-        
-        # 广播传递信息
-        self.server.broadcast_message(f"§e山芋从 §f{from_player.name} §e转移到了 §c{to_player.name} §e手中！")
-        plugin_print(f"山芋从 {from_player.name} 转移到了 {to_player.name} 手中！")
+        # 嘲讽、公告和音效由事件订阅者处理
+        self.events.publish(PotatoTransferred(arena, from_player, to_player, TRANSFER_HIT))
+
+    def register_event_subscribers(self):
+        """订阅游戏事件：消息、音效、粒子和BossBar同步处理，日志和战绩持久化延迟到下一个 tick"""
+        events = self.events
+        events.subscribe(PotatoTransferred, self.on_potato_transferred)
+        events.subscribe(PotatoTransferred, self.track_potato_transferred)
+        events.subscribe(PotatoTransferred, self.log_potato_transferred, deferred=True)
+        events.subscribe(PlayerEliminated, self.on_player_eliminated)
+        events.subscribe(PlayerEliminated, self.track_player_eliminated)
+        events.subscribe(PlayerEliminated, self.record_player_eliminated, deferred=True)
+        events.subscribe(GameEnded, self.on_game_ended)
+        events.subscribe(GameEnded, self.track_game_ended)
+        events.subscribe(GameEnded, self.record_game_ended, deferred=True)
+
+    def on_potato_transferred(self, event: PotatoTransferred):
+        """山芋转移：发送嘲讽或提示、广播转移信息、播放传递音效"""
+        arena, from_player, to_player = event.arena, event.from_player, event.to_player
+        if event.cause == TRANSFER_HIT:
+            if self.watchdog.allows(DEGRADE_TAUNTS):
+                # 发送嘲讽消息（同一 tick 内连续传递时只保留最后一条）
+                taunt = random.choice(TAUNT_MESSAGES)
+                self.outbox.send(from_player, f"§e{taunt}", key="taunt")
+                self.outbox.send(to_player, f"§c{from_player.name}: {taunt}", key="taunt")
+        else:
+            to_player.send_message("§c你拿到了烫手山芋！快传给别人！")
+
+        # 广播传递信息，中间经手的持有者变化会被最新一条取代
+        self.announce(arena, MESSAGE_TRANSFER, f"§e山芋从 §f{from_player.name} §e转移到了 §c{to_player.name} §e手中！",
+                      key=("holder", arena.name))
+
+        if event.cause == TRANSFER_HIT:
+            # 播放传递音效
+            self.play_transfer_sound(arena, to_player)
+
+    def log_potato_transferred(self, event: PotatoTransferred):
+        """记录山芋转移日志"""
+        plugin_print(f"山芋从 {event.from_player.name} 转移到了 {event.to_player.name} 手中！")
+
+    def on_player_eliminated(self, event: PlayerEliminated):
+        """玩家被淘汰：播放爆炸效果、广播淘汰信息、更新BossBar"""
+        arena, player = event.arena, event.player
+
+        # 所有参与者（包括被淘汰的玩家）都能看到爆炸
+        self.play_explode_sound(arena, arena.participants, player)
+        self.create_explosion_effect(arena, arena.participants, player)
+
+        if event.cause == ELIMINATED_OUT_OF_BOUNDS:
+            self.announce(arena, MESSAGE_ELIMINATION, f"§c{player.name} §e离开了比赛区域，被淘汰！")
+        else:
+            self.announce(arena, MESSAGE_ELIMINATION, f"§c山芋爆炸了！§e{player.name} §c被淘汰！")
+
+        # 更新BossBar显示淘汰信息
+        self.update_bossbar_eliminated(arena, player.name)
+
+    def record_player_eliminated(self, event: PlayerEliminated):
+        """更新被淘汰玩家的战绩"""
+        self.data_manager.update_player_stats(event.player.name, games=1)
+        plugin_print(f"玩家 {event.player.name} 在竞技场 {event.arena.name} 被淘汰（{event.cause}）", "INFO")
+
+    def on_game_ended(self, event: GameEnded):
+        """游戏结束：广播结束原因与获胜者"""
+        arena = event.arena
+        self.announce(arena, MESSAGE_GAME_END, f"§6===== 烫手山芋游戏结束 [{arena.name}] =====")
+        self.announce(arena, MESSAGE_GAME_END, f"§e原因: §f{event.reason}")
+        if event.winner is not None:
+            self.announce(arena, MESSAGE_GAME_END, f"§a恭喜 §e{event.winner.name} §a获得了胜利！")
+
+    def track_potato_transferred(self, event: PotatoTransferred):
+        """更新传递相关的成就进度"""
+        now = time.time()
+        if event.cause == TRANSFER_HIT:
+            self.achievements.potato_passed(event.from_player, now)
+        self.achievements.potato_received(event.to_player, now)
+
+    def track_player_eliminated(self, event: PlayerEliminated):
+        """山芋爆炸时，仍在游戏中的玩家躲过一次爆炸"""
+        if event.cause == ELIMINATED_EXPLOSION:
+            self.achievements.explosion_survived(event.arena.participants.alive)
+
+    def track_game_ended(self, event: GameEnded):
+        """更新连胜与坚持到结束的成就进度（随战绩一起保存）"""
+        participants = event.arena.participants
+        self.achievements.game_ended(participants, participants.alive, event.winner)
+
+    def on_achievement_unlocked(self, player: Player, achievement: Achievement):
+        """通知玩家解锁了成就
 
-        # 播放传递音效
-        self.play_transfer_sound(to_player)
+        Args:
+            player: 玩家
+            achievement: 成就
+        """
+        self.outbox.send(player, f"§6成就解锁: §e{achievement.name} §7- {achievement.description}")
+        plugin_print(f"玩家 {player.name} 解锁了成就 {achievement.name}", "INFO")
+
+    def record_game_ended(self, event: GameEnded):
+        """保存获胜者战绩与战局记录"""
+        if event.winner is not None:
+            # 更新获胜者的战绩
+            self.data_manager.update_player_stats(event.winner.name, wins=1, games=1)
+
+        # 保存玩家战绩数据
+        self.data_manager.save_player_stats()
+        self.data_manager.add_game_record(event.record)
 
     def give_potato_to_player(self, player: Player):
         """给玩家快捷栏填充山芋
@@ -1541,24 +2326,8 @@ class EasyHotPotatoPlugin(Plugin):
             player: 要填充山芋的玩家
         """
         try:
-            # 获取玩家的背包
-            inventory = player.inventory
-            if inventory is None:
-                return
-                
-            # 创建山芋物品堆
-            from endstone.inventory import ItemStack
-            potato = ItemStack(self.potato_item_id, 64)
-
-            # 设置物品元数据
-            item_meta = potato.item_meta
-            if item_meta is not None:
-                item_meta.display_name = "§c烫手山芋"
-                potato.set_item_meta(item_meta)
-            
-            # 将山芋填充到整个快捷栏（强制覆盖）
-            for slot in range(9):  # 快捷栏有9个槽位
-                inventory.set_item(slot, potato)
+            # 将山芋填充到整个快捷栏，只重写缺失或被改动的槽位
+            self.potato_hotbar.fill(player)
         except Exception as e:
             plugin_print(f"给玩家填充山芋失败: {e}", "ERROR")
 
@@ -1569,6 +2338,9 @@ class EasyHotPotatoPlugin(Plugin):
             player: 要移除山芋的玩家
         """
         try:
+            self.potato_hotbar.forget(player)
+            self.transfer_limiter.forget(player.id)
+
             # 获取玩家的背包
             inventory = player.inventory
             if inventory is None:
@@ -1579,335 +2351,649 @@ class EasyHotPotatoPlugin(Plugin):
         except Exception as e:
             plugin_print(f"从玩家背包移除山芋失败: {e}", "ERROR")
 
-    def play_transfer_sound(self, player: Player):
+    def announce(self, arena: Optional[Arena], message_type: str, message: str,
+                 key=None, priority: int = PRIORITY_NORMAL):
+        """按消息类型配置的频道发送消息，消息在下一个 tick 合并发出
+
+        Args:
+            arena: 消息所属的竞技场，None表示与竞技场无关
+            message_type: 消息类型
+            message: 消息内容
+            key: 合并键，同一 tick 内同 key 的消息只保留最新一条
+            priority: 优先级
+        """
+        channel_name = self.message_channels.get(message_type, CHANNEL_ALL)
+        if channel_name == CHANNEL_ALL:
+            channel = self.online_channel
+        elif channel_name == CHANNEL_LOBBY:
+            channel = self.lobby_channel
+        else:
+            channel = arena.audience.channel(channel_name) if arena is not None else self.online_channel
+
+        self.outbox.send_many(channel.recipients, message, key, priority)
+
+    def get_effect_viewers(self, arena: Arena, source, candidates) -> List[Player]:
+        """获取能看到（听到）效果的玩家：效果源附近的候选玩家，以及正在观战的玩家
+
+        Args:
+            arena: 竞技场
+            source: 效果源的位置快照
+            candidates: 候选玩家集合
+
+        Returns:
+            List[Player]: 观看者列表
+        """
+        radius = self.effects_quality.view_radius
+        if radius <= 0:
+            viewers = list(candidates)
+        else:
+            # 使用本 tick 的位置快照判断距离；空间索引中的玩家位置只在越界检查时刷新，可能已过时
+            radius_sq = radius * radius
+            viewers = []
+            for candidate in candidates:
+                loc = self.location_cache.get(candidate)
+                if (loc is not None and loc.dim == source.dim
+                        and (loc.x - source.x) ** 2 + (loc.z - source.z) ** 2 <= radius_sq):
+                    viewers.append(candidate)
+
+        # 观战者总能看到所观看竞技场的效果
+        for spectator in arena.spectators:
+            if spectator not in candidates:
+                viewers.append(spectator)
+        return viewers
+
+    def play_transfer_sound(self, arena: Arena, player: Player):
         """播放山芋传递音效
 
         Args:
+            arena: 竞技场
             player: 山芋持有者
         """
+        if not self.watchdog.allows(DEGRADE_EFFECTS):
+            return
         try:
-            # 为所有参与游戏的玩家播放传递音效
-            for p in self.players_in_game:
-                p.play_sound(
-                    location=player.location,
-                    sound="mob.blaze.shoot",
-                    volume=1.0,
-                    pitch=1.0
-                )
+            source = self.location_cache.get(player)
+            if source is None:
+                return
+
+            # 在持有者位置播放传递音效，由附近参与游戏的玩家听到
+            viewers = self.get_effect_viewers(arena, source, arena.participants.alive)
+            self.sound_emitter.emit(source.location, SOUND_TRANSFER, viewers)
         except Exception as e:
             plugin_print(f"播放传递音效失败: {e}", "ERROR")
 
-    def play_explode_sound(self, players: set, location_player: Player):
+    def play_explode_sound(self, arena: Arena, players: ParticipantSet, location_player: Player):
         """播放山芋爆炸音效
 
         Args:
+            arena: 竞技场
             players: 要播放音效的玩家集合
             location_player: 播放音效的位置所在的玩家
         """
+        if not self.watchdog.allows(DEGRADE_EFFECTS):
+            return
         try:
-            for p in players:
-                p.play_sound(
-                    location=location_player.location,
-                    sound="random.explode",
-                    volume=1.0,
-                    pitch=1.0
-                )
+            source = self.location_cache.get(location_player)
+            if source is None:
+                return
+
+            viewers = self.get_effect_viewers(arena, source, players)
+            self.sound_emitter.emit(source.location, SOUND_EXPLODE, viewers)
         except Exception as e:
             plugin_print(f"播放爆炸音效失败: {e}", "ERROR")
 
-    def create_explosion_effect(self, players: set, location_player: Player):
-        """为所有玩家制造爆炸效果
+    def play_countdown_sound(self, arena: Arena, remaining_time: int):
+        """在每位仍在游戏中的玩家自己的位置播放倒计时音效
 
         Args:
+            arena: 竞技场
+            remaining_time: 剩余时间（秒）
+        """
+        if not self.watchdog.allows(DEGRADE_EFFECTS):
+            return
+        try:
+            self.sound_emitter.emit_to_each(
+                SOUND_XP, arena.participants.alive, self.location_cache.location,
+                pitch=0.4 + (5 - remaining_time) * 0.2
+            )
+        except Exception as e:
+            plugin_print(f"播放倒计时音效失败: {e}", "ERROR")
+
+    def create_explosion_effect(self, arena: Arena, players: ParticipantSet, location_player: Player):
+        """为爆炸位置附近的玩家制造爆炸效果
+
+        Args:
+            arena: 竞技场
             players: 要显示效果的玩家集合
             location_player: 爆炸效果位置所在的玩家
         """
+        if not self.watchdog.allows(DEGRADE_EFFECTS):
+            return
         try:
             # 获取玩家位置
-            loc = location_player.location
+            loc = self.location_cache.get(location_player)
             if loc is None:
                 plugin_print(f"玩家 {location_player.name} 的位置为空", "WARNING")
                 return
 
-            # 为所有玩家生成爆炸粒子效果
-            import random
-            for p in players:
-                for i in range(50):
-                    offset_x = random.uniform(-2.5, 2.5)
-                    offset_y = random.uniform(0, 3)
-                    offset_z = random.uniform(-2.5, 2.5)
-                    p.spawn_particle(
-                        name="minecraft:explosion_particle",
-                        x=loc.x + offset_x,
-                        y=loc.y + offset_y,
-                        z=loc.z + offset_z
-                    )
+            # 为附近的玩家生成爆炸粒子效果，数量随效果质量缩放
+            viewers = self.get_effect_viewers(arena, loc, players)
+            count = self.effects_quality.particle_count(EXPLOSION_SHAPE, len(viewers))
+            self.particle_emitter.emit(EXPLOSION_SHAPE, viewers, loc.x, loc.y, loc.z, count)
         except Exception as e:
             plugin_print(f"制造爆炸效果失败: {e}", "ERROR")
 
-    def spawn_particle_effect(self, player: Player):
+    def spawn_particle_effect(self, arena: Arena, player: Player):
         """为山芋持有者生成粒子效果
 
         Args:
+            arena: 竞技场
             player: 山芋持有者
         """
         try:
             # 获取玩家位置
-            loc = player.location
+            loc = self.location_cache.get(player)
             if loc is None:
                 plugin_print(f"玩家 {player.name} 的位置为空", "WARNING")
                 return
 
-            # 为所有参与游戏的玩家生成火焰粒子
-            for p in self.players_in_game:
-                for i in range(10):
-                    offset_x = random.uniform(-1, 1)
-                    offset_y = random.uniform(0.5, 1)
-                    offset_z = random.uniform(-1, 1)
-                    p.spawn_particle(
-                        name="minecraft:basic_flame_particle",
-                        x=loc.x + offset_x,
-                        y=loc.y + offset_y,
-                        z=loc.z + offset_z
-                    )
+            # 为持有者附近参与游戏的玩家生成火焰粒子，数量随效果质量缩放
+            viewers = self.get_effect_viewers(arena, loc, arena.participants.alive)
+            count = self.effects_quality.particle_count(FLAME_SHAPE, len(viewers))
+            self.particle_emitter.emit(FLAME_SHAPE, viewers, loc.x, loc.y, loc.z, count)
         except Exception as e:
             plugin_print(f"生成粒子效果失败: {e}", "ERROR")
 
-    def particle_tick(self):
-        """粒子效果每0.5秒执行的逻辑"""
-        if not self.game_active:
+    def particle_tick(self, arena: Arena):
+        """粒子效果任务的逻辑，周期由效果质量决定（满效果时每0.5秒）
+
+        Args:
+            arena: 竞技场
+        """
+        if not arena.game_active:
             return
-        if not self.potato_holder:
+        if not arena.potato_holder:
             return
+        if not self.watchdog.allows(DEGRADE_EFFECTS):
+            return
+
+        # 根据 tick 耗时调整效果质量，并按观看人数调整粒子任务的周期
+        self.update_effects_quality()
+        period = self.effects_quality.particle_period(len(arena.participants.alive))
+        task = arena.state_machine.get_task("particle")
+        if task is not None and task.period != period:
+            # 管线在执行回调前已按旧周期排好下一次，替换任务使新周期立即生效
+            arena.state_machine.run_task("particle", lambda: self.particle_tick(arena), delay=period, period=period)
 
         # 生成粒子效果
-        self.spawn_particle_effect(self.potato_holder)
-
-        # 持续给予山芋持有者山芋
-        self.give_potato_to_player(self.potato_holder)
-
-    def start_particle_task(self):
-        """启动粒子效果任务"""
-        # plugin_print("正在启动粒子效果任务", "INFO")
-        if self.particle_task is not None:
-            self.particle_task.cancel()
-            plugin_print("已取消旧的粒子效果任务", "INFO")
-
-        self.particle_task = self.server.scheduler.run_task(self, self.particle_tick, delay=0, period=10)  # 每0.5秒执行一次（10 ticks）
-        # plugin_print("粒子效果任务已启动", "INFO")
-
-    def stop_particle_task(self):
-        """停止粒子效果任务"""
-        # plugin_print("正在停止粒子效果任务", "INFO")
-        if self.particle_task is not None:
-            self.particle_task.cancel()
-            self.particle_task = None
-            # plugin_print("粒子效果任务已停止", "INFO")
+        self.spawn_particle_effect(arena, arena.potato_holder)
+
+    def potato_refill_tick(self, arena: Arena):
+        """按固定周期给山芋持有者补充山芋
+
+        Args:
+            arena: 竞技场
+        """
+        if not arena.game_active:
+            return
+        if not arena.potato_holder:
+            return
+        self.give_potato_to_player(arena.potato_holder)
+
+    def on_watchdog_level_change(self, previous: int, level: int):
+        """看门狗降级或恢复时调整可选工作
+
+        Args:
+            previous: 原等级
+            level: 新等级
+        """
+        cost_ms = self.watchdog.cost_ema * 1000
+        if level > previous:
+            plugin_print(f"插件 tick 耗时持续超出预算（平均 {cost_ms:.2f}ms），已降级: {DEGRADE_LABELS[level]}", "WARNING")
         else:
-            plugin_print("没有正在运行的粒子效果任务", "INFO")
-    
-    def start_position_check_task(self):
-        """启动位置检查任务，检测玩家是否离开比赛区域"""
-        # plugin_print("正在启动位置检查任务", "INFO")
-        if self.position_check_task is not None:
-            self.position_check_task.cancel()
-            plugin_print("已取消旧的位置检查任务", "INFO")
-
-        self.position_check_task = self.server.scheduler.run_task(self, self.check_player_positions, delay=20, period=20)  # 每秒检查一次（20 ticks）
-        plugin_print("位置检查任务已启动", "INFO")
-
-    def stop_position_check_task(self):
-        """停止位置检查任务"""
-        plugin_print("正在停止位置检查任务", "INFO")
-        if self.position_check_task is not None:
-            self.position_check_task.cancel()
-            self.position_check_task = None
-            plugin_print("位置检查任务已停止", "INFO")
+            plugin_print(f"插件 tick 耗时已回落（平均 {cost_ms:.2f}ms），恢复到: {DEGRADE_LABELS[level]}", "INFO")
+
+        # 降级期间保持管线运行，空闲后也能继续观察耗时并恢复
+        if level > DEGRADE_NONE and self.watchdog_task is None:
+            self.watchdog_task = self.pipeline.schedule(lambda: None, delay=1, period=1)
+        elif level == DEGRADE_NONE and self.watchdog_task is not None:
+            self.watchdog_task.cancel()
+            self.watchdog_task = None
+
+        # 关闭效果后效果质量降到最低，恢复后再逐级回升
+        if not self.watchdog.allows(DEGRADE_EFFECTS):
+            self.effects_quality.suspend(self.pipeline.current_tick)
+
+        if self.watchdog.allows(DEGRADE_MARQUEE):
+            self.refresh_rainbow_marquee()
         else:
-            plugin_print("没有正在运行的位置检查任务", "INFO")
-    
+            self.stop_rainbow_marquee()
+
+    def update_effects_quality(self):
+        """根据看门狗统计的平均 tick 耗时与预算调整效果质量等级"""
+        watchdog = self.watchdog
+        if self.effects_quality.update(watchdog.cost_ema, watchdog.tick_budget_ms, self.pipeline.current_tick):
+            plugin_print(
+                f"效果质量已调整为 {self.effects_quality.level}"
+                f"（平均 tick 耗时 {watchdog.cost_ema * 1000:.2f}ms）",
+                "INFO"
+            )
+
     def check_player_positions(self):
-        """检查玩家位置，检测是否离开比赛区域"""
-        if not self.game_active:
+        """检查到期参与者的位置，检测是否离开比赛区域
+
+        越界检测任务每个 tick 运行，但只检查时间表中到期的玩家：
+        每位玩家检查后按到最近边缘的距离安排下一次检查，靠近边缘的玩家每个 tick 检查，
+        站在中央的玩家最多间隔 maxInterval 个 tick。到期玩家的位置收集到连续数组后
+        与缓存的竞技区域包围盒一次性比较。
+        """
+        if not self.boundary_schedule.polls or not any(arena.game_active for arena in self.arenas.values()):
+            self.stop_boundary_task()
             return
-        
-        # 复制玩家列表，避免在迭代时修改
-        players_copy = list(self.players_in_game)
-        for player in players_copy:
+
+        now = self.pipeline.current_tick
+        due = self.boundary_schedule.pop_due(now)
+        if not due:
+            return
+
+        arena_bounds = self.get_arena_bounds()
+        batch = BoundsBatch()
+        for player_id in due:
+            # 已淘汰、离开或对局已结束的玩家不再安排检查
+            arena = self.player_arena.get(player_id)
+            if arena is None or not arena.game_active:
+                continue
+            player = arena.participants.alive.get(player_id)
+            if player is None:
+                continue
+
+            index = self.arena_bounds_slots.get(arena.name)
+            if index is None:
+                continue
             try:
-                loc = player.location
+                loc = self.location_cache.get(player)
                 if loc is None:
+                    # 暂时读不到位置，下一个 tick 再检查
+                    self.boundary_schedule.add(player_id, now)
                     continue
-                
-                # 检查玩家是否在活动范围内 (增加 2.0 的容差以防误判)
-                distance_x = abs(loc.x - self.game_pos["x"])
-                distance_z = abs(loc.z - self.game_pos["z"])
-                
-                if distance_x > (self.area_size["x"] + 2.0) or distance_z > (self.area_size["z"] + 2.0):
-                    # 玩家离开比赛区域，判负
-                    # 先播放爆炸音效和效果（在淘汰玩家之前）
-                    all_players = self.players_in_game.copy()
-                    all_players.add(player)
-
-                    # 播放爆炸音效
-                    self.play_explode_sound(all_players, player)
-
-                    # 为所有玩家制造爆炸效果
-                    self.create_explosion_effect(all_players, player)
 
-                    # 淘汰玩家
-                    self.players_in_game.discard(player)
+                batch.add(player, index, loc.dim, loc.x, loc.z)
+            except Exception as e:
+                self.boundary_schedule.add(player_id, now)
+                plugin_print(f"检查玩家位置失败: {e}", "ERROR")
 
-                    # 确保被淘汰玩家在 all_players_in_game 集合中
-                    self.all_players_in_game.add(player)
-                    
-                    # 将玩家传送到等待中心，防止留在竞技场外被反复判定
-                    self.teleport_to_wait_pos(player)
-                    
-                    # 移除玩家的山芋
-                    self.remove_potato_from_inventory(player)
-                    
-                    # 如果玩家持有山芋，转移山芋
-                    if self.potato_holder == player:
-                        if self.players_in_game:
-                            self.potato_holder = random.choice(list(self.players_in_game))
-                            self.give_potato_to_player(self.potato_holder)
-                            self.potato_holder.send_message("§c你拿到了烫手山芋！快传给别人！")
-                            self.server.broadcast_message(f"§e山芋从 §f{player.name} §e转移到了 §c{self.potato_holder.name} §e手中！")
-                        else:
-                            self.potato_holder = None
-                    
-                    # 广播淘汰信息
-                    self.server.broadcast_message(f"§c{player.name} §e离开了比赛区域，被淘汰！")
-                    
-                    # 更新被淘汰玩家的战绩
-                    self.data_manager.update_player_stats(player.name, games=1)
-                    
-                    # 检查游戏是否结束
-                    if len(self.players_in_game) <= 1:
-                        self.stop_game("游戏结束")
-                        return
+        # 竞技区域已包含 2.0 的容差以防误判
+        for i, distance in enumerate(edge_distances(batch, arena_bounds)):
+            player = batch.players[i]
+            if distance >= 0:
+                self.boundary_schedule.reschedule(player.id, now, distance)
+                continue
+
+            arena = self.arena_bounds_arenas[batch.arena_index[i]]
+            # 同一轮中游戏可能已经结束
+            if not arena.game_active or player not in arena.participants.alive:
+                continue
+            try:
+                self.eliminate_player(arena, player, ELIMINATED_OUT_OF_BOUNDS)
             except Exception as e:
                 plugin_print(f"检查玩家位置失败: {e}", "ERROR")
 
-    def join_game(self, player: Player) -> bool:
+    def eliminate_pending_out_of_bounds(self, arena: Arena, player: Player):
+        """淘汰在移动事件中发现越界的玩家
+
+        Args:
+            arena: 竞技场
+            player: 越界的玩家
+        """
+        self.boundary_pending.discard(player.id)
+        try:
+            if not arena.game_active or player not in arena.participants.alive:
+                return
+
+            # 期间玩家可能已被传送回竞技区域
+            loc = self.location_cache.get(player)
+            if loc is not None and self.is_in_arena_region(arena, loc.dim, loc.x, loc.z):
+                return
+            self.eliminate_player(arena, player, ELIMINATED_OUT_OF_BOUNDS)
+        except Exception as e:
+            plugin_print(f"检查玩家位置失败: {e}", "ERROR")
+
+    def join_game(self, player: Player, arena: Arena) -> bool:
         """玩家加入游戏
-        
+
         Args:
             player: 加入游戏的玩家
-            
+            arena: 要加入的竞技场
+
         Returns:
             bool: 是否成功加入
         """
-        if player in self.players_in_game:
+        if self.get_player_arena(player) is not None:
             player.send_message("§c你已经在游戏中了！")
             return False
 
+        # 服务器负载过高时暂停接纳新玩家
+        if not self.watchdog.allows(DEGRADE_ADMISSION):
+            player.send_message("§c服务器负载过高，暂时无法加入游戏，请稍后再试！")
+            return False
+
         # 检查是否达到最大人数限制
-        if self.max_players > 0 and len(self.players_in_game) >= self.max_players:
-            player.send_message(f"§c游戏人数已满（{self.max_players}人）！")
+        if arena.is_full():
+            player.send_message(f"§c游戏人数已满（{arena.max_players}人）！")
             return False
-            
+
+        # 观战者加入游戏时先停止观战
+        if self.get_spectator_arena(player) is not None:
+            self.unbind_spectator(player)
+
         # 清空玩家背包
         inventory = player.inventory
         if inventory:
             inventory.clear()
-        
+
         # 传送玩家到准备区域
-        self.teleport_to_wait_pos(player)
-        
-        self.players_in_game.add(player)
-        self.all_players_in_game.add(player)  # 添加到所有玩家集合
-        player.send_message("§a你已加入烫手山芋游戏！")
-        self.server.broadcast_message(f"§e{player.name} §a加入了游戏！")
-        
-        # 停止彩虹跑马灯
-        self.stop_rainbow_marquee()
+        self.teleport_to_wait_pos(player, arena)
+
+        arena.participants.add(player)
+        self.bind_player_arena(player, arena)
+        player.send_message(f"§a你已加入烫手山芋游戏！竞技场: §e{arena.name}")
+        self.announce(arena, MESSAGE_JOIN, f"§e{player.name} §a加入了游戏！§7[{arena.name}]")
+
+        # 第一个玩家加入时从空闲进入等待状态
+        if arena.state == GAME_STATE_IDLE:
+            arena.state_machine.transition(GAME_STATE_WAITING)
+        elif arena.state == GAME_STATE_WAITING and not arena.state_machine.has_task("wait_countdown"):
+            # 更新BossBar
+            self.update_bossbar_waiting(arena)
+
+        # 检查是否达到最低人数，如果是则开始等待倒计时（倒计时只启动一次）
+        if (arena.state == GAME_STATE_WAITING
+                and len(arena.participants.alive) >= arena.min_players
+                and not arena.state_machine.has_task("wait_countdown")):
+            player.send_message(f"§e玩家数量已达到最低要求，留有 §f{arena.wait_time} §e秒来允许剩余玩家的加入！")
+            self.announce(arena, MESSAGE_READY, f"§e[{arena.name}] 玩家数量已达到最低要求，留有 §f{arena.wait_time} §e秒来允许剩余玩家的加入！")
+            # 启动等待倒计时BossBar，结束后开始预热倒计时
+            self.start_wait_countdown_bossbar(arena)
 
-        # 更新BossBar
-        self.update_bossbar_waiting()
-        
-        # 检查是否达到最低人数，如果是则开始游戏
-        if len(self.players_in_game) >= self.min_players and not self.game_active:
-            player.send_message(f"§e玩家数量已达到最低要求，留有 §f{self.wait_time} §e秒来允许剩余玩家的加入！")
-            self.server.broadcast_message(f"§e玩家数量已达到最低要求，留有 §f{self.wait_time} §e秒来允许剩余玩家的加入！")
-            # 启动等待倒计时BossBar
-            self.start_wait_countdown_bossbar()
-            # 延迟指定时间后开始预热倒计时
-            self.server.scheduler.run_task(
-                self,
-                lambda: self.start_pre_game_countdown(),
-                delay=self.wait_time * 20  # 转换为ticks（1秒=20ticks）
-            )
-        
         return True
-        
+
     def leave_game(self, player: Player) -> bool:
         """玩家离开游戏
-        
+
         Args:
             player: 离开游戏的玩家
-            
+
         Returns:
             bool: 是否成功离开
         """
-        if player not in self.players_in_game:
+        arena = self.get_player_arena(player)
+        if arena is None:
             player.send_message("§c你不在游戏中！")
             return False
-            
+
+        if self.remove_player_from_arena(arena, player, f"§e{player.name} §a离开了游戏！§7[{arena.name}]"):
+            player.send_message("§a你已离开烫手山芋游戏！")
+        return True
+
+    def handle_player_disconnect(self, player: Player, reason: str = "断开了连接"):
+        """玩家退出或被踢出服务器时离开所在竞技场
+
+        游戏进行中断线视为淘汰并结算战绩；持有山芋时山芋交给其他玩家。
+        之后不再保留该玩家的任何引用，逐 tick 的任务也不会再处理该玩家。
+
+        Args:
+            player: 断线的玩家
+            reason: 广播中显示的原因
+        """
+        self.unbind_spectator(player)
+
+        arena = self.player_arena.get(player.id)
+        if arena is None:
+            return
+
+        if arena.state in (GAME_STATE_RUNNING, GAME_STATE_ENDING) and player in arena.participants:
+            # 仍在游戏中的玩家结算一局（被淘汰的玩家已在淘汰时结算），并保留在本局战局记录中
+            if player in arena.participants.alive:
+                self.data_manager.update_player_stats(player.name, games=1)
+            arena.departed_players[player.id] = player.name
+
+        self.remove_player_from_arena(arena, player, f"§e{player.name} §c{reason}！§7[{arena.name}]")
+        plugin_print(f"玩家 {player.name} {reason}，已离开竞技场 {arena.name}", "INFO")
+
+    def remove_player_from_arena(self, arena: Arena, player: Player, message: str) -> bool:
+        """把玩家从竞技场中移除，必要时转移山芋、更新等待状态或结束游戏
+
+        Args:
+            arena: 竞技场
+            player: 要移除的玩家
+            message: 发送到竞技场的离开消息
+
+        Returns:
+            bool: 竞技场是否仍在继续（False表示因没有玩家而结束了游戏）
+        """
+        # 游戏中途离开记入时间线
+        if arena.state in (GAME_STATE_RUNNING, GAME_STATE_ENDING) and player in arena.participants.alive:
+            arena.timeline.eliminate(player, time.time(), CAUSE_DEPARTED)
+            self.achievements.reset_streak(player)
+
         # 从游戏中移除玩家
-        self.players_in_game.discard(player)
-        self.all_players_in_game.discard(player)  # 从所有玩家集合中移除
-        
+        arena.participants.remove(player)
+        self.unbind_player_arena(player)
+
         # 移除玩家的山芋
         self.remove_potato_from_inventory(player)
-        
+
         # 如果玩家持有山芋，转移山芋
-        if self.game_active and self.potato_holder == player:
-            if self.players_in_game:
+        if arena.game_active and arena.potato_holder == player:
+            if arena.participants.alive:
                 # 随机选择新的山芋持有者
-                import random
-                self.potato_holder = random.choice(list(self.players_in_game))
-                # 给新持有者填充山芋
-                self.give_potato_to_player(self.potato_holder)
-                # 通知新持有者
-                self.potato_holder.send_message("§c你拿到了烫手山芋！快传给别人！")
-                # 广播山芋转移信息
-                self.server.broadcast_message(f"§e山芋从 §f{player.name} §e转移到了 §c{self.potato_holder.name} §e手中！")
+                self.reassign_potato(arena, player)
             else:
                 # 游戏结束
-                self.potato_holder = None
-                self.stop_game("没有玩家了")
-                return True
-        
-        # 通知玩家和广播
-        player.send_message("§a你已离开烫手山芋游戏！")
-        self.server.broadcast_message(f"§e{player.name} §a离开了游戏！")
-        
-        # 更新BossBar
-        if not self.game_active:
-            self.update_bossbar_waiting()
-        
+                arena.potato_holder = None
+                self.stop_game(arena, "没有玩家了")
+                return False
+
+        # 广播离开信息
+        self.announce(arena, MESSAGE_JOIN, message)
+
+        # 等待阶段人数变化时更新状态和BossBar
+        if arena.state == GAME_STATE_WAITING:
+            if not arena.participants.alive:
+                arena.state_machine.transition(GAME_STATE_IDLE)
+            else:
+                if len(arena.participants.alive) < arena.min_players and arena.state_machine.has_task("wait_countdown"):
+                    arena.state_machine.cancel_task("wait_countdown")
+                    self.announce(arena, MESSAGE_READY, f"§c[{arena.name}] 玩家数量不足，开赛倒计时已取消！")
+                if not arena.state_machine.has_task("wait_countdown"):
+                    self.update_bossbar_waiting(arena)
+
         # 检查游戏是否结束
-        if self.game_active and len(self.players_in_game) <= 1:
-            self.stop_game("游戏结束")
-            
+        if arena.game_active and len(arena.participants.alive) <= 1:
+            self.stop_game(arena, "游戏结束")
+
         return True
-        
-    def teleport_to_wait_pos(self, player: Player):
+
+    def bind_player_arena(self, player: Player, arena: Arena):
+        """记录玩家所在竞技场，并将其BossBar从大厅切换到竞技场
+
+        Args:
+            player: 玩家对象
+            arena: 竞技场
+        """
+        self.player_arena[player.id] = arena
+        self.lobby_channel.discard(player)
+        arena.audience.add_participant(player)
+        try:
+            if self.bossbar:
+                self.bossbar.remove_player(player)
+            self.ensure_arena_bossbar(arena).add_player(player)
+        except Exception as e:
+            plugin_print(f"切换玩家BossBar失败: {e}", "ERROR")
+        self.refresh_rainbow_marquee()
+
+    def unbind_player_arena(self, player: Player):
+        """移除玩家所在竞技场记录，并将其BossBar切换回大厅
+
+        Args:
+            player: 玩家对象
+        """
+        arena = self.player_arena.pop(player.id, None)
+        self.boundary_schedule.discard(player.id)
+        if arena is not None:
+            arena.audience.discard(player)
+        # 已退出服务器的玩家不再回到大厅
+        online = player in self.online_channel
+        if online:
+            self.lobby_channel.add(player)
+        try:
+            if arena is not None and arena.bossbar:
+                arena.bossbar.remove_player(player)
+            if self.bossbar and online:
+                self.bossbar.add_player(player)
+        except Exception as e:
+            plugin_print(f"切换玩家BossBar失败: {e}", "ERROR")
+        self.refresh_rainbow_marquee()
+
+    def spectate_arena(self, player: Player, arena: Arena) -> bool:
+        """玩家开始观战竞技场：接收竞技场的BossBar、消息和效果，但不参与游戏
+
+        Args:
+            player: 玩家
+            arena: 要观战的竞技场
+
+        Returns:
+            bool: 是否开始观战
+        """
+        if self.get_player_arena(player) is not None:
+            player.send_message("§c你正在游戏中，无法观战！")
+            return False
+
+        watching = self.get_spectator_arena(player)
+        if watching is arena:
+            player.send_message(f"§c你已经在观战竞技场 §e{arena.name} §c了！")
+            return False
+        if watching is not None:
+            self.unbind_spectator(player)
+
+        self.spectator_arena[player.id] = arena
+        self.lobby_channel.discard(player)
+        arena.audience.add_spectator(player)
+        try:
+            if self.bossbar:
+                self.bossbar.remove_player(player)
+            self.ensure_arena_bossbar(arena).add_player(player)
+        except Exception as e:
+            plugin_print(f"切换玩家BossBar失败: {e}", "ERROR")
+        self.refresh_rainbow_marquee()
+
+        player.send_message(f"§a你正在观战竞技场 §e{arena.name}§a，可在主菜单中停止观战")
+        return True
+
+    def stop_spectating(self, player: Player) -> bool:
+        """玩家停止观战
+
+        Args:
+            player: 玩家
+
+        Returns:
+            bool: 是否停止了观战
+        """
+        arena = self.unbind_spectator(player)
+        if arena is None:
+            player.send_message("§c你没有在观战！")
+            return False
+        player.send_message(f"§a你已停止观战竞技场 §e{arena.name}")
+        return True
+
+    def unbind_spectator(self, player: Player) -> Optional[Arena]:
+        """移除玩家的观战记录，并将其BossBar切换回大厅
+
+        Args:
+            player: 玩家
+
+        Returns:
+            Optional[Arena]: 原来观战的竞技场，没有观战时返回None
+        """
+        arena = self.spectator_arena.pop(player.id, None)
+        if arena is None:
+            return None
+        arena.audience.discard(player)
+        # 已退出服务器的玩家不再回到大厅
+        online = player in self.online_channel
+        if online:
+            self.lobby_channel.add(player)
+        try:
+            if arena.bossbar:
+                arena.bossbar.remove_player(player)
+            if self.bossbar and online:
+                self.bossbar.add_player(player)
+        except Exception as e:
+            plugin_print(f"切换玩家BossBar失败: {e}", "ERROR")
+        self.refresh_rainbow_marquee()
+        return arena
+
+    def release_spectators(self, arena: Arena):
+        """竞技场被移除时让所有观战者回到大厅
+
+        Args:
+            arena: 竞技场
+        """
+        for spectator in arena.spectators:
+            self.unbind_spectator(spectator)
+            spectator.send_message(f"§c竞技场 §e{arena.name} §c已被移除，观战结束")
+
+    def teleport_player(self, player: Player, location: Location):
+        """传送玩家，使其位置快照失效并更新空间索引
+
+        Args:
+            player: 要传送的玩家
+            location: 目标位置
+        """
+        try:
+            player.teleport(location)
+        finally:
+            self.location_cache.invalidate(player)
+
+    def get_wait_location(self, arena: Arena, player: Player) -> Location:
+        """获取玩家在等待中心的传送目标
+
+        Args:
+            arena: 竞技场
+            player: 玩家
+
+        Returns:
+            Location: 目标位置
+        """
+        dimension = self.get_arena_dimension(player, arena.wait_pos)
+        return Location(dimension=dimension, x=arena.wait_pos['x'], y=arena.wait_pos['y'], z=arena.wait_pos['z'])
+
+    def get_arena_dimension(self, player: Player, pos: Dict):
+        """获取竞技场坐标所记录的维度，找不到时使用玩家当前所在的维度
+
+        Args:
+            player: 玩家（用于获取世界）
+            pos: 记录了 dimid 的坐标字典（等待中心或竞技中心）
+
+        Returns:
+            维度对象
+        """
+        return find_dimension(player.level, pos.get("dimid", 0), player.dimension)
+
+    def teleport_to_wait_pos(self, player: Player, arena: Arena):
         """传送玩家到等待中心
-        
+
         Args:
             player: 要传送的玩家
+            arena: 竞技场
         """
         try:
             # 获取等待中心坐标
-            x, y, z = self.wait_pos['x'], self.wait_pos['y'], self.wait_pos['z']
-            
+            x, y, z = arena.wait_pos['x'], arena.wait_pos['y'], arena.wait_pos['z']
+
             # 使用Location对象传送玩家（与start_game使用相同的方式）
             try:
-                location = Location(dimension=player.dimension, x=x, y=y, z=z)
-                player.teleport(location)
+                self.teleport_player(player, self.get_wait_location(arena, player))
                 try:
                     player.send_message(f"§e已传送到等待中心: X={x}, Y={y}, Z={z}")
                 except:
@@ -1916,76 +3002,88 @@ class EasyHotPotatoPlugin(Plugin):
                 plugin_print(f"传送玩家 {player.name} 失败: {e1}", "WARNING")
         except Exception as e:
             plugin_print(f"传送玩家 {player.name} 到等待中心失败: {e}", "ERROR")
-    
-    def teleport_to_game_pos(self, player: Player):
+
+    def start_pre_game_countdown(self, arena: Arena):
+        """开始赛前预热倒计时
+
+        Args:
+            arena: 竞技场
         """
-        传送玩家到竞技中心
-        
+        # 只有等待状态才能进入预热，重复调用会被状态机拒绝
+        arena.state_machine.transition(GAME_STATE_PREPARING)
+
+    def pre_game_tick(self, arena: Arena):
+        """赛前预热每秒执行的逻辑
+
         Args:
-            player: 要传送的玩家
+            arena: 竞技场
         """
-        try:
-            # 获取竞技中心坐标
-            x, y, z = self.game_pos['x'], self.game_pos['y'], self.game_pos['z']
-            
-            try:
-                cmd = f"tp {player.name} {x} {y} {z}"
-                result = self.server.dispatch_command(player, cmd)
-                if result:
-                    player.send_message(f"§e已传送到等待中心: X={x}, Y={y}, Z={z}")
-                    return
-                elif result == "Unknown player":
-                    player.send_message("§c玩家不存在，请检查玩家名是否正确！")
-                    return
-            except Exception as e1:
-                plugin_print(f"传送失败: {e1}", "WARNING")
+        arena.pre_game_timer -= 1
 
-        except Exception as e:
-            plugin_print(f"传送玩家到竞技中心失败: {e}", "ERROR")
-            player.send_message("§c传送失败，请联系管理员！")
-    
-    def start_pre_game_countdown(self):
-        """开始赛前预热倒计时"""
-        if self.pre_game_task is not None:
-            return
-        
-        # 停止等待倒计时BossBar任务
-        if self.wait_countdown_task:
-            self.wait_countdown_task.cancel()
-            self.wait_countdown_task = None
-
-        self.server.broadcast_message("§6===== 赛前预热 =====")
-        self.server.broadcast_message(f"§e游戏将在 §c{self.pre_time} §e秒后开始！")
-        self.pre_game_timer = self.pre_time
-        
         # 更新BossBar
-        self.update_bossbar_countdown(self.pre_time, self.pre_time)
-        
-        # 预热倒计时
-        def pre_game_tick():
-            if not hasattr(self, 'pre_game_timer'):
-                self.pre_game_timer = self.pre_time
-            
-            self.pre_game_timer -= 1
-            
-            # 更新BossBar
-            self.update_bossbar_countdown(self.pre_game_timer, self.pre_time)
+        self.update_bossbar_countdown(arena, arena.pre_game_timer, arena.pre_time)
+
+        if arena.pre_game_timer <= 0:
+            # 停止预热任务，分批传送玩家，全部到达后开始游戏
+            arena.state_machine.cancel_task("pre_game")
+            self.start_game(arena)
+        elif arena.pre_game_timer in [10, 5, 4, 3, 2, 1]:
+            self.announce(arena, MESSAGE_COUNTDOWN, f"§e[{arena.name}] 游戏将在 §c{arena.pre_game_timer} §e秒后开始！",
+                          key=("countdown", arena.name))
+
+    def _on_enter_idle(self, arena: Arena, previous: int):
+        """竞技场进入空闲状态：不拥有任何任务，释放竞技场BossBar"""
+        self.cleanup_arena_bossbar(arena)
+
+    def _on_enter_waiting(self, arena: Arena, previous: int):
+        """竞技场进入等待状态：等待倒计时任务在人数达标后启动"""
+        self.update_bossbar_waiting(arena)
+
+    def _on_enter_preparing(self, arena: Arena, previous: int):
+        """竞技场进入预热状态：启动赛前倒计时任务"""
+        self.announce(arena, MESSAGE_READY, f"§6===== 赛前预热 [{arena.name}] =====")
+        self.announce(arena, MESSAGE_READY, f"§e游戏将在 §c{arena.pre_time} §e秒后开始！")
+        arena.pre_game_timer = arena.pre_time
+
+        # 更新BossBar
+        self.update_bossbar_countdown(arena, arena.pre_time, arena.pre_time)
+
+        arena.state_machine.run_task("pre_game", lambda: self.pre_game_tick(arena), delay=20, period=20)
+
+    def _on_enter_running(self, arena: Arena, previous: int):
+        """竞技场进入游戏状态：启动计时器、粒子效果和位置检查任务"""
+        arena.last_announced_time = None
+        arena.hud_state = None
+        arena.state_machine.run_task("game_tick", lambda: self.game_tick(arena), delay=20, period=20)  # 每秒执行一次（20 ticks）
+        # 每 tick 比较持有者与剩余时间，有变化时推送到竞技场BossBar（参赛玩家与观战者共用）
+        arena.state_machine.run_task("hud", lambda: self.hud_tick(arena), delay=1, period=1)
+        # 粒子周期由效果质量决定，满效果时每0.5秒执行一次（10 ticks）
+        particle_period = self.effects_quality.particle_period(len(arena.participants.alive))
+        arena.state_machine.run_task("particle", lambda: self.particle_tick(arena), delay=0, period=particle_period)
+        # 持有者的山芋补充使用固定周期，不随效果质量变化
+        arena.state_machine.run_task("potato_refill", lambda: self.potato_refill_tick(arena),
+                                     delay=0, period=POTATO_REFILL_PERIOD)
+
+        # 所有进行中的竞技场共用一个越界检测任务，开赛后立即检查一次所有玩家
+        # 事件驱动模式下只在移动事件中检测，不启动轮询
+        if self.boundary_schedule.polls:
+            for player in arena.participants.alive:
+                self.boundary_schedule.add(player.id, self.pipeline.current_tick)
+            self.start_boundary_task()
+
+    def start_boundary_task(self):
+        """启动越界检测任务（已在运行时不重复启动）"""
+        if self.boundary_task is None:
+            # 每个 tick 运行，只检查到期的玩家
+            self.boundary_task = self.pipeline.schedule(self.check_player_positions, delay=1, period=1)
+
+    def stop_boundary_task(self):
+        """停止越界检测任务"""
+        if self.boundary_task is not None:
+            self.boundary_task.cancel()
+            self.boundary_task = None
+        self.boundary_schedule.clear()
 
-            if self.pre_game_timer <= 0:
-                # 传送所有玩家到竞技中心
-                for player in self.players_in_game:
-                    self.teleport_to_game_pos(player)
-                
-                # 开始游戏
-                self.start_game()
-                self.pre_game_task.cancel()  # 停止任务
-            elif self.pre_game_timer in [10, 5, 4, 3, 2, 1]:
-                self.server.broadcast_message(f"§e游戏将在 §c{self.pre_game_timer} §e秒后开始！")
-            
-            return True  # 继续任务
-        
-        self.pre_game_task = self.server.scheduler.run_task(self, lambda: pre_game_tick(), delay=20, period=20)
-        
     def show_easyhotpotato_help(self, sender: CommandSenderWrapper):
         """显示烫手山芋命令帮助
         
@@ -1997,6 +3095,8 @@ class EasyHotPotatoPlugin(Plugin):
         sender.send_message("§e/easyhotpotato status §f- 查看游戏状态")
         sender.send_message("§e/easyhotpotato stats [玩家] §f- 查看战绩，可指定玩家名称")
         sender.send_message("§e/easyhotpotato help §f- 查看帮助")
+        if sender.has_permission("easyhotpotato.admin"):
+            sender.send_message("§e/easyhotpotato perf §f- 查看性能计数（管理员）")
         sender.send_message("§6===== 游戏规则 =====")
         sender.send_message("§f- 持有土豆者必须通过物理攻击来完成传递")
         sender.send_message("§f- 每一轮都有随机的倒计时，计时器归零将淘汰持有者")
@@ -2014,13 +3114,14 @@ class EasyHotPotatoPlugin(Plugin):
             )
             # 设置进度
             self.bossbar.progress = 1.0
-            # 为所有在线玩家添加BossBar
+            # 为所有不在竞技场中的在线玩家添加BossBar
             for player in self.server.online_players:
-                self.bossbar.add_player(player)
-            
+                if player.id not in self.player_arena:
+                    self.bossbar.add_player(player)
+
             # 启动彩虹循环跑马灯任务
-            self.start_rainbow_marquee()
-            
+            self.refresh_rainbow_marquee()
+
             plugin_print("默认BossBar已初始化", "SUCCESS")
         except Exception as e:
             plugin_print(f"初始化BossBar失败: {e}", "ERROR")
@@ -2030,11 +3131,7 @@ class EasyHotPotatoPlugin(Plugin):
         try:
             # 停止彩虹跑马灯
             self.stop_rainbow_marquee()
-            
-            if self.bossbar_task:
-                self.bossbar_task.cancel()
-                self.bossbar_task = None
-            
+
             if self.bossbar:
                 self.bossbar.remove_all()
                 self.bossbar = None
@@ -2042,179 +3139,250 @@ class EasyHotPotatoPlugin(Plugin):
         except Exception as e:
             plugin_print(f"清理BossBar失败: {e}", "ERROR")
 
-    def update_bossbar_waiting(self):
-        """更新等待阶段的BossBar"""
+    def ensure_arena_bossbar(self, arena: Arena):
+        """获取竞技场BossBar，不存在时创建
+
+        Args:
+            arena: 竞技场
+
+        Returns:
+            竞技场BossBar对象
+        """
+        if arena.bossbar is None:
+            arena.bossbar = self.server.create_boss_bar(
+                title=f"§6烫手山芋 - {arena.name}",
+                color=BarColor.YELLOW,
+                style=BarStyle.SOLID
+            )
+            arena.bossbar.progress = 1.0
+            arena.hud_state = None
+            # 竞技场空闲时释放了BossBar，重新创建后补上仍在观战的玩家
+            for spectator in arena.spectators:
+                arena.bossbar.add_player(spectator)
+        return arena.bossbar
+
+    def cleanup_arena_bossbar(self, arena: Arena):
+        """清理竞技场BossBar
+
+        Args:
+            arena: 竞技场
+        """
         try:
-            if not self.bossbar:
-                return
-            
-            current_players = len(self.players_in_game)
-            needed_players = self.min_players
-            
+            if arena.bossbar:
+                arena.bossbar.remove_all()
+                arena.bossbar = None
+        except Exception as e:
+            plugin_print(f"清理竞技场BossBar失败: {e}", "ERROR")
+
+    def update_bossbar_waiting(self, arena: Arena):
+        """更新等待阶段的BossBar
+
+        Args:
+            arena: 竞技场
+        """
+        try:
+            bossbar = self.ensure_arena_bossbar(arena)
+
+            current_players = len(arena.participants.alive)
+            needed_players = arena.min_players
+
             # 更新BossBar标题
-            self.bossbar.title = f"§e等待玩家中... §a{current_players}§7/§a{needed_players}"
-            
+            bossbar.title = f"§e等待玩家中... §a{current_players}§7/§a{needed_players}"
+
             # 计算进度
             progress = min(current_players / needed_players, 1.0)
-            self.bossbar.progress = progress
-            
-            # 为所有在线玩家添加BossBar
-            for player in self.server.online_players:
-                if player not in self.bossbar.players:
-                    self.bossbar.add_player(player)
+            bossbar.progress = progress
+            bossbar.color = BarColor.YELLOW
         except Exception as e:
             plugin_print(f"更新等待BossBar失败: {e}", "ERROR")
 
-    def update_bossbar_countdown(self, remaining_time: int, total_time: int):
+    def update_bossbar_countdown(self, arena: Arena, remaining_time: int, total_time: int):
         """更新倒计时阶段的BossBar
-        
+
         Args:
+            arena: 竞技场
             remaining_time: 剩余时间（秒）
             total_time: 总时间（秒）
         """
         try:
-            if not self.bossbar:
+            bossbar = arena.bossbar
+            if not bossbar:
                 return
-            
+
             # 更新BossBar标题
-            self.bossbar.title = f"§e游戏将在 §c{remaining_time} §e秒后开始！"
-            
+            bossbar.title = f"§e游戏将在 §c{remaining_time} §e秒后开始！"
+
             # 计算进度
             progress = max(remaining_time / total_time, 0.0)
-            self.bossbar.progress = progress
-            
+            bossbar.progress = progress
+
             # 根据剩余时间改变颜色
             if remaining_time <= 3:
-                self.bossbar.color = BarColor.RED
+                bossbar.color = BarColor.RED
             elif remaining_time <= 5:
-                self.bossbar.color = BarColor.YELLOW
+                bossbar.color = BarColor.YELLOW
             else:
-                self.bossbar.color = BarColor.GREEN
-            
+                bossbar.color = BarColor.GREEN
+
             # 播放经验音效，声调随时间升高
             if remaining_time <= 5:
-                for player in self.players_in_game:
-                    player.play_sound(player.location, SOUND_XP, volume=1.0, pitch=0.4 + (5 - remaining_time) * 0.2)
+                self.play_countdown_sound(arena, remaining_time)
         except Exception as e:
             plugin_print(f"更新倒计时BossBar失败: {e}", "ERROR")
 
-    def update_bossbar_game(self, remaining_time: int, total_time: int):
-        """更新游戏进行中的BossBar
-        
+    def hud_tick(self, arena: Arena):
+        """每 tick 把持有者和剩余时间的变化推送到竞技场BossBar
+
+        Args:
+            arena: 竞技场
+        """
+        if not arena.game_active or self.pipeline.current_tick < arena.hud_hold_until:
+            return
+        remaining_time = max(arena.game_time - int(time.time() - arena.game_start_time), 0)
+        self.update_bossbar_game(arena, remaining_time, arena.game_time)
+
+    def update_bossbar_game(self, arena: Arena, remaining_time: int, total_time: int):
+        """更新游戏进行中的BossBar，只推送与上一次不同的字段
+
+        竞技场BossBar由参赛玩家与观战者共用，每次变化只设置一次，
+        不会因为观战者增多而重复计算。
+
         Args:
+            arena: 竞技场
             remaining_time: 剩余时间（秒）
             total_time: 总时间（秒）
         """
         try:
-            if not self.bossbar:
+            bossbar = arena.bossbar
+            if not bossbar:
                 return
-            
+
             # 获取当前持有者名称
-            holder_name = self.potato_holder.name if self.potato_holder else "无"
-            
-            # 更新BossBar标题
-            self.bossbar.title = f"§e山芋持有者: §c{holder_name} §7| §e剩余时间: §c{remaining_time}§e秒"
-            
+            holder_name = arena.potato_holder.name if arena.potato_holder else "无"
+            title = f"§e山芋持有者: §c{holder_name} §7| §e剩余时间: §c{remaining_time}§e秒"
+
             # 计算进度
             progress = max(remaining_time / total_time, 0.0)
-            self.bossbar.progress = progress
-            
+
             # 根据剩余时间改变颜色
             if remaining_time <= 5:
-                self.bossbar.color = BarColor.RED
+                color = BarColor.RED
             elif remaining_time <= 10:
-                self.bossbar.color = BarColor.YELLOW
+                color = BarColor.YELLOW
             else:
-                self.bossbar.color = BarColor.GREEN
-            
-            # 播放经验音效，声调随时间升高
-            if remaining_time <= 5:
-                for player in self.players_in_game:
-                    player.play_sound(player.location, SOUND_XP, volume=1.0, pitch=0.4 + (5 - remaining_time) * 0.2)
+                color = BarColor.GREEN
+
+            previous = arena.hud_state
+            if previous is None:
+                previous = (None, None, None)
+            if title != previous[0]:
+                bossbar.title = title
+            if progress != previous[1]:
+                bossbar.progress = progress
+            if color != previous[2]:
+                bossbar.color = color
+            arena.hud_state = (title, progress, color)
         except Exception as e:
             plugin_print(f"更新游戏BossBar失败: {e}", "ERROR")
 
-    def update_bossbar_eliminated(self, eliminated_player_name: str):
+    def update_bossbar_eliminated(self, arena: Arena, eliminated_player_name: str):
         """更新BossBar显示淘汰信息
-        
+
         Args:
+            arena: 竞技场
             eliminated_player_name: 被淘汰的玩家名称
         """
         try:
-            if not self.bossbar:
+            bossbar = arena.bossbar
+            if not bossbar:
                 return
-            
+
             # 更新BossBar标题
-            self.bossbar.title = f"§c{eliminated_player_name} §e被淘汰！"
-            
+            title = f"§c{eliminated_player_name} §e被淘汰！"
+            bossbar.title = title
+
             # 设置进度为满
-            self.bossbar.progress = 1.0
-            
+            bossbar.progress = 1.0
+
             # 设置颜色为红色
-            self.bossbar.color = BarColor.RED
+            bossbar.color = BarColor.RED
+
+            # 淘汰信息保留一秒，之后再由每 tick 的状态比较推送游戏状态
+            arena.hud_state = (title, 1.0, BarColor.RED)
+            arena.hud_hold_until = self.pipeline.current_tick + 20
         except Exception as e:
             plugin_print(f"更新淘汰BossBar失败: {e}", "ERROR")
 
-    def start_wait_countdown_bossbar(self):
-        """启动等待倒计时BossBar
+    def start_wait_countdown_bossbar(self, arena: Arena, wait_time: Optional[int] = None):
+        """启动等待倒计时BossBar，倒计时结束后开始赛前预热
+
+        Args:
+            arena: 竞技场
+            wait_time: 等待时间（秒），默认使用竞技场配置的等待时间
         """
-        # 停止之前的等待倒计时任务
-        if hasattr(self, 'wait_countdown_task') and self.wait_countdown_task:
-            self.wait_countdown_task.cancel()
-        
         # 初始化剩余时间
-        remaining_time = self.wait_time
-        
+        arena.wait_remaining = arena.wait_time if wait_time is None else wait_time
+        total_time = max(arena.wait_remaining, 1)
+
         def update_wait_bossbar():
-            nonlocal remaining_time
-            if remaining_time <= 0:
+            if arena.wait_remaining <= 0:
+                self.start_pre_game_countdown(arena)
                 return
-            
-            # 更新BossBar
-            self.bossbar.title = f"§e游戏将在 §c{remaining_time} §e秒后开始！"
-            progress = max(remaining_time / self.wait_time, 0.0)
-            self.bossbar.progress = progress
-            
-            # 根据剩余时间改变颜色
-            if remaining_time <= 3:
-                self.bossbar.color = BarColor.RED
-            elif remaining_time <= 5:
-                self.bossbar.color = BarColor.YELLOW
-            else:
-                self.bossbar.color = BarColor.GREEN
-            
-            remaining_time -= 1
-        
-        # 启动倒计时任务
-        self.wait_countdown_task = self.server.scheduler.run_task(
-            self,
+
+            bossbar = arena.bossbar
+            if bossbar:
+                # 更新BossBar
+                bossbar.title = f"§e游戏将在 §c{arena.wait_remaining} §e秒后开始！"
+                progress = max(arena.wait_remaining / total_time, 0.0)
+                bossbar.progress = progress
+
+                # 根据剩余时间改变颜色
+                if arena.wait_remaining <= 3:
+                    bossbar.color = BarColor.RED
+                elif arena.wait_remaining <= 5:
+                    bossbar.color = BarColor.YELLOW
+                else:
+                    bossbar.color = BarColor.GREEN
+
+            arena.wait_remaining -= 1
+
+        # 启动倒计时任务（归属于等待状态，同名任务会被替换）
+        arena.state_machine.run_task(
+            "wait_countdown",
             update_wait_bossbar,
             delay=0,
             period=20  # 每秒更新一次（20ticks）
         )
 
+    def refresh_rainbow_marquee(self, exclude: Optional[Player] = None):
+        """根据大厅是否有玩家可见，启动或停止彩虹跑马灯
+
+        Args:
+            exclude: 不计入的玩家（例如正在退出的玩家）
+        """
+        lobby_viewers = any(p != exclude for p in self.lobby_channel)
+        if lobby_viewers:
+            self.start_rainbow_marquee()
+        else:
+            self.stop_rainbow_marquee()
+
     def start_rainbow_marquee(self):
         """启动彩虹循环跑马灯效果"""
-        # 初始化跑马灯状态
-        self.marquee_text = "欢迎使用 EasyHotPotato 烫手山芋插件！ "
+        if self.marquee_task is not None or not self.bossbar:
+            return
+        if not self.watchdog.allows(DEGRADE_MARQUEE):
+            return
+
+        # 重置跑马灯状态
         self.marquee_position = 0
-        self.rainbow_colors = [
-            "§c",  # 红色
-            "§6",  # 金色
-            "§e",  # 黄色
-            "§a",  # 绿色
-            "§b",  # 青色
-            "§d",  # 紫色
-        ]
         self.rainbow_color_index = 0
-        self.marquee_active = True
-        
+
         # 启动跑马灯任务
-        self.marquee_task = self.server.scheduler.run_task(self, self.update_rainbow_marquee, delay=1, period=5)
-    
+        self.marquee_task = self.pipeline.schedule(self.update_rainbow_marquee, delay=1, period=5)
+
     def update_rainbow_marquee(self):
         """更新彩虹循环跑马灯效果"""
-        if not self.marquee_active or not self.bossbar:
+        if not self.bossbar:
             return
         
         try:
@@ -2250,14 +3418,35 @@ class EasyHotPotatoPlugin(Plugin):
             
         except Exception as e:
             plugin_print(f"更新彩虹跑马灯失败: {e}", "ERROR")
-    
+
     def stop_rainbow_marquee(self):
         """停止彩虹循环跑马灯效果"""
-        self.marquee_active = False
-        if self.marquee_task:
+        if self.marquee_task is not None:
             self.marquee_task.cancel()
             self.marquee_task = None
 
+    def format_timeline_summary(self, summary: Dict) -> str:
+        """格式化战局记录中的时间线汇总
+
+        Args:
+            summary: 时间线汇总
+
+        Returns:
+            str: 表单内容
+        """
+        players = {info["id"]: info for info in summary["players"]}
+        content = f"§e山芋传递: §f{summary['transfers']}次\n"
+        if summary["elimination_order"]:
+            order = [
+                f"§f{players[player_id]['name']}§7({TIMELINE_CAUSE_LABELS.get(players[player_id]['eliminated'], '淘汰')})"
+                for player_id in summary["elimination_order"] if player_id in players
+            ]
+            content += f"§e淘汰顺序: {' §7→ '.join(order)}\n"
+        for info in sorted(summary["players"], key=lambda i: i["survived"], reverse=True):
+            content += (f"§7- §f{info['name']} §7持有 §f{info['hold_time']}秒 §7| 传出 §f{info['transfers_made']} "
+                        f"§7| 接到 §f{info['transfers_received']} §7| 存活 §f{info['survived']}秒\n")
+        return content
+
     def show_game_history_form(self, player: Player):
         """显示战局记录表单
 
@@ -2281,6 +3470,8 @@ class EasyHotPotatoPlugin(Plugin):
             
             # 构建记录内容
             content += f"§6游戏ID: §f{record['game_id']}\n"
+            if record.get('arena'):
+                content += f"§e竞技场: §f{record['arena']}\n"
             content += f"§e开始时间: §f{start_time}\n"
             content += f"§e游戏时长: §f{duration_minutes}分{duration_seconds}秒\n"
             content += f"§e参与玩家: §f{len(record['players'])}人\n"
@@ -2293,6 +3484,8 @@ class EasyHotPotatoPlugin(Plugin):
                 content += f"§e参赛玩家: {players_str}\n"
             content += f"§e获胜者: §a{record['winner'] if record['winner'] else '无'}\n"
             content += f"§e结束原因: §f{record['reason']}\n"
+            if record.get('timeline'):
+                content += self.format_timeline_summary(record['timeline'])
             content += "§7-------------------\n\n"
         
         # 创建表单
@@ -0,0 +1,366 @@
+"""
+粒子效果
+
+每种效果形状在加载时预先生成若干组偏移表，发射时轮换使用，
+发射路径上不再调用 random；同一次发射的粒子坐标只计算一次，再发给所有观看者。
+效果质量控制器根据看门狗统计的 tick 耗时和观看人数调整粒子数量与发射周期，
+并按观看人数限制每次发射的 spawn_particle 调用总数。
+音效发射器把同一次音效发给剔除后的听众，同一玩家只播放一次。
+"""
+import copy
+import random
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Offset = Tuple[float, float, float]
+
+# 每种形状预生成的偏移表数量，轮换使用以避免画面重复
+DEFAULT_VARIANTS = 16
+
+
+class ParticleShape:
+    """一种粒子效果形状：粒子名称 + 轮换使用的偏移表"""
+
+    __slots__ = ("name", "particle", "count", "tables", "_cursor")
+
+    def __init__(self, name: str, particle: str, count: int,
+                 x_range: Tuple[float, float], y_range: Tuple[float, float], z_range: Tuple[float, float],
+                 variants: int = DEFAULT_VARIANTS, seed=None):
+        """
+        初始化效果形状
+
+        Args:
+            name: 形状名称
+            particle: 粒子ID
+            count: 每次发射的粒子数量
+            x_range: X 偏移范围
+            y_range: Y 偏移范围
+            z_range: Z 偏移范围
+            variants: 预生成的偏移表数量
+            seed: 随机种子，默认使用形状名称
+        """
+        rng = random.Random(name if seed is None else seed)
+        self.name = name
+        self.particle = particle
+        self.count = count
+        self.tables: List[Tuple[Offset, ...]] = [
+            tuple(
+                (rng.uniform(*x_range), rng.uniform(*y_range), rng.uniform(*z_range))
+                for _ in range(count)
+            )
+            for _ in range(max(variants, 1))
+        ]
+        self._cursor = 0
+
+    def next_table(self) -> Sequence[Offset]:
+        """取下一组偏移表"""
+        table = self.tables[self._cursor]
+        self._cursor = (self._cursor + 1) % len(self.tables)
+        return table
+
+
+# 山芋持有者身上的火焰
+FLAME_SHAPE = ParticleShape(
+    "flame", "minecraft:basic_flame_particle", 10,
+    (-1.0, 1.0), (0.5, 1.0), (-1.0, 1.0)
+)
+
+# 山芋爆炸
+EXPLOSION_SHAPE = ParticleShape(
+    "explosion", "minecraft:explosion_particle", 50,
+    (-2.5, 2.5), (0.0, 3.0), (-2.5, 2.5)
+)
+
+
+class ParticleEmitter:
+    """批量粒子发射器"""
+
+    def __init__(self):
+        self.emitted = 0  # 累计发送的粒子数量
+
+    @staticmethod
+    def points(shape: ParticleShape, x: float, y: float, z: float) -> List[Offset]:
+        """
+        计算一次发射的所有粒子坐标
+
+        Args:
+            shape: 效果形状
+            x: 中心X坐标
+            y: 中心Y坐标
+            z: 中心Z坐标
+
+        Returns:
+            List[Offset]: 粒子坐标列表
+        """
+        return [(x + dx, y + dy, z + dz) for dx, dy, dz in shape.next_table()]
+
+    def emit(self, shape: ParticleShape, viewers: Iterable, x: float, y: float, z: float,
+             count: Optional[int] = None) -> int:
+        """
+        在指定位置发射一次效果，发给所有观看者
+
+        Args:
+            shape: 效果形状
+            viewers: 观看者（玩家）集合
+            x: 中心X坐标
+            y: 中心Y坐标
+            z: 中心Z坐标
+            count: 粒子数量，默认使用形状的完整数量；偏移表是随机生成的，取前 count 个即为均匀抽样
+
+        Returns:
+            int: 发送的粒子数量
+        """
+        points = self.points(shape, x, y, z)
+        if count is not None and count < len(points):
+            if count <= 0:
+                return 0
+            points = points[:count]
+        particle = shape.particle
+        sent = 0
+        for viewer in viewers:
+            spawn = viewer.spawn_particle
+            for px, py, pz in points:
+                spawn(particle, px, py, pz)
+            sent += len(points)
+        self.emitted += sent
+        return sent
+
+
+class SoundEmitter:
+    """位置音效发射器
+
+    endstone 的 Dimension 没有在世界中播放音效的接口，只能通过 Player.play_sound 逐个玩家播放，
+    因此听众由调用方按距离剔除（观战者总是包含在内），这里只负责去重。
+    """
+
+    def __init__(self):
+        self.player_plays = 0  # 逐个玩家播放的次数
+        self.duplicates = 0  # 跳过的重复听众
+
+    def emit(self, location, sound: str, listeners: Iterable, volume: float = 1.0, pitch: float = 1.0) -> int:
+        """
+        在指定位置为每位听众播放一次音效，重复出现的听众只播放一次
+
+        Args:
+            location: 音效位置（Location 对象）
+            sound: 音效ID
+            listeners: 听众（玩家）集合
+            volume: 音量
+            pitch: 音调
+
+        Returns:
+            int: 播放音效的接口调用次数
+        """
+        played = set()
+        for listener in listeners:
+            if listener.id in played:
+                self.duplicates += 1
+                continue
+            played.add(listener.id)
+            listener.play_sound(location, sound, volume=volume, pitch=pitch)
+        self.player_plays += len(played)
+        return len(played)
+
+    def emit_to_each(self, sound: str, listeners: Iterable, locate: Callable, volume: float = 1.0,
+                     pitch: float = 1.0) -> int:
+        """
+        在每位听众自己的位置播放音效（提示音），重复出现的听众只播放一次
+
+        Args:
+            sound: 音效ID
+            listeners: 听众（玩家）集合
+            locate: 获取听众位置的函数，返回None时跳过该听众
+            volume: 音量
+            pitch: 音调
+
+        Returns:
+            int: 播放音效的接口调用次数
+        """
+        played = set()
+        for listener in listeners:
+            if listener.id in played:
+                self.duplicates += 1
+                continue
+            played.add(listener.id)
+            location = locate(listener)
+            if location is not None:
+                listener.play_sound(location, sound, volume=volume, pitch=pitch)
+                self.player_plays += 1
+        return len(played)
+
+
+# 效果质量等级，从高到低
+QUALITY_AUTO = "auto"
+QUALITY_LEVELS = ("full", "high", "medium", "low", "minimal")
+
+# 各等级的默认参数：
+#   particleScale  粒子数量比例
+#   particlePeriod 持有者粒子的发射周期（ticks）
+#   maxViewers     该等级允许的最大观看人数，超过时自动降到更低的等级
+DEFAULT_QUALITY_SETTINGS = {
+    "full": {"particleScale": 1.0, "particlePeriod": 10, "maxViewers": 16},
+    "high": {"particleScale": 0.6, "particlePeriod": 10, "maxViewers": 32},
+    "medium": {"particleScale": 0.4, "particlePeriod": 20, "maxViewers": 64},
+    "low": {"particleScale": 0.2, "particlePeriod": 20, "maxViewers": 128},
+    "minimal": {"particleScale": 0.1, "particlePeriod": 40, "maxViewers": 0},  # 0表示无上限
+}
+
+# tick 耗时低于预算的该比例时才会升级，避免在阈值附近反复切换
+QUALITY_RECOVER_RATIO = 0.5
+# 两次调整之间至少间隔的 ticks
+QUALITY_COOLDOWN_TICKS = 100
+
+# 音效和粒子的默认可见半径（方块）
+DEFAULT_VIEW_RADIUS = 48.0
+# 每次发射最多的 spawn_particle 调用次数（粒子数 x 观看人数），0表示不限制；
+# endstone 只能逐个玩家发送粒子，观看人数多时减少每人看到的粒子数量
+DEFAULT_PARTICLE_BUDGET = 200
+
+
+class EffectsQuality:
+    """效果质量控制器"""
+
+    def __init__(self):
+        self.mode = QUALITY_AUTO  # "auto" 或固定的等级名称
+        self.max_level = QUALITY_LEVELS[0]  # 自动模式下的最高等级
+        self.min_level = QUALITY_LEVELS[-1]  # 自动模式下的最低等级
+        self.view_radius = DEFAULT_VIEW_RADIUS  # 效果可见半径，0表示不剔除
+        self.particle_budget = DEFAULT_PARTICLE_BUDGET  # 每次发射最多的粒子发送次数，0表示不限制
+        self.levels: Dict[str, Dict] = copy.deepcopy(DEFAULT_QUALITY_SETTINGS)
+        self._index = 0  # 由 tick 耗时决定的等级下标
+        self._next_adjust_tick = 0
+
+    @property
+    def level(self) -> str:
+        """由 tick 耗时（或固定配置）决定的等级，不考虑观看人数"""
+        if self.mode != QUALITY_AUTO:
+            return self.mode
+        return QUALITY_LEVELS[self._index]
+
+    def load_config(self, config: Dict):
+        """
+        从配置字典加载参数
+
+        Args:
+            config: config.json 中的 effects 字段
+        """
+        mode = config.get("quality", QUALITY_AUTO)
+        self.mode = mode if mode == QUALITY_AUTO or mode in QUALITY_LEVELS else QUALITY_AUTO
+        max_level = config.get("maxQuality", QUALITY_LEVELS[0])
+        min_level = config.get("minQuality", QUALITY_LEVELS[-1])
+        self.max_level = max_level if max_level in QUALITY_LEVELS else QUALITY_LEVELS[0]
+        self.min_level = min_level if min_level in QUALITY_LEVELS else QUALITY_LEVELS[-1]
+        if QUALITY_LEVELS.index(self.min_level) < QUALITY_LEVELS.index(self.max_level):
+            self.min_level = self.max_level
+        self.view_radius = float(config.get("viewRadius", DEFAULT_VIEW_RADIUS))
+        self.particle_budget = max(0, int(config.get("particleBudget", DEFAULT_PARTICLE_BUDGET)))
+
+        self.levels = copy.deepcopy(DEFAULT_QUALITY_SETTINGS)
+        for name, settings in config.get("levels", {}).items():
+            if name in self.levels and isinstance(settings, dict):
+                self.levels[name].update(settings)
+
+        self._index = QUALITY_LEVELS.index(self.max_level)
+        self._next_adjust_tick = 0
+
+    def to_config(self) -> Dict:
+        """
+        导出配置
+
+        Returns:
+            Dict: 配置字典
+        """
+        return {
+            "quality": self.mode,
+            "maxQuality": self.max_level,
+            "minQuality": self.min_level,
+            "viewRadius": self.view_radius,
+            "particleBudget": self.particle_budget,
+            "levels": self.levels
+        }
+
+    def update(self, tick_cost: float, budget_ms: float, now_tick: int) -> bool:
+        """
+        根据看门狗统计的 tick 耗时与预算调整等级
+
+        Args:
+            tick_cost: 插件每 tick 的平均耗时（秒）
+            budget_ms: 插件每 tick 的预算（毫秒）
+            now_tick: 当前 tick 编号
+
+        Returns:
+            bool: 等级是否发生变化
+        """
+        if self.mode != QUALITY_AUTO or now_tick < self._next_adjust_tick:
+            return False
+
+        cost_ms = tick_cost * 1000
+        index = self._index
+        if cost_ms > budget_ms and index < QUALITY_LEVELS.index(self.min_level):
+            index += 1
+        elif cost_ms < budget_ms * QUALITY_RECOVER_RATIO and index > QUALITY_LEVELS.index(self.max_level):
+            index -= 1
+        if index == self._index:
+            return False
+
+        self._index = index
+        self._next_adjust_tick = now_tick + QUALITY_COOLDOWN_TICKS
+        return True
+
+    def suspend(self, now_tick: int):
+        """
+        看门狗关闭效果时调用：降到最低等级，恢复后从最低等级逐级回升
+
+        Args:
+            now_tick: 当前 tick 编号
+        """
+        self._index = QUALITY_LEVELS.index(self.min_level)
+        self._next_adjust_tick = now_tick + QUALITY_COOLDOWN_TICKS
+
+    def level_for(self, viewers: int) -> str:
+        """
+        获取考虑观看人数后的实际等级
+
+        Args:
+            viewers: 观看人数
+
+        Returns:
+            str: 等级名称
+        """
+        index = QUALITY_LEVELS.index(self.level)
+        while index < len(QUALITY_LEVELS) - 1:
+            max_viewers = self.levels[QUALITY_LEVELS[index]].get("maxViewers", 0)
+            if max_viewers <= 0 or viewers <= max_viewers:
+                break
+            index += 1
+        return QUALITY_LEVELS[index]
+
+    def particle_count(self, shape: ParticleShape, viewers: int) -> int:
+        """
+        获取一次发射中每位观看者的粒子数量
+
+        Args:
+            shape: 效果形状
+            viewers: 观看人数
+
+        Returns:
+            int: 粒子数量，粒子数量乘以观看人数不超过 particle_budget（每人至少1个）
+        """
+        scale = self.levels[self.level_for(viewers)].get("particleScale", 1.0)
+        if scale <= 0:
+            return 0
+        count = max(1, round(shape.count * scale))
+        if self.particle_budget > 0 and viewers > 0:
+            count = min(count, max(1, self.particle_budget // viewers))
+        return count
+
+    def particle_period(self, viewers: int) -> int:
+        """
+        获取持有者粒子的发射周期
+
+        Args:
+            viewers: 观看人数
+
+        Returns:
+            int: 周期（ticks）
+        """
+        return max(1, int(self.levels[self.level_for(viewers)].get("particlePeriod", 10)))
@@ -0,0 +1,135 @@
+"""
+游戏内部事件总线
+
+山芋转移、玩家淘汰和游戏结束以事件的形式发布，音效、粒子、消息、BossBar、
+战绩和日志等子系统各自订阅，游戏逻辑本身只负责修改状态。
+普通订阅者在发布时同步调用；日志、持久化等低优先级的订阅者延迟到下一个 tick，
+同一 tick 内发布的事件按发布顺序合并为一批统一处理。
+"""
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+# 山芋转移原因
+TRANSFER_HIT = "hit"  # 持有者击中其他玩家
+TRANSFER_REASSIGN = "reassign"  # 持有者被淘汰或离开后随机重新分配
+
+# 淘汰原因
+ELIMINATED_EXPLOSION = "explosion"  # 山芋爆炸
+ELIMINATED_OUT_OF_BOUNDS = "outOfBounds"  # 离开比赛区域
+
+
+class GameEvent:
+    """游戏事件基类"""
+
+    __slots__ = ("arena",)
+
+    def __init__(self, arena):
+        self.arena = arena
+
+
+class PotatoTransferred(GameEvent):
+    """山芋转移到了新的持有者"""
+
+    __slots__ = ("from_player", "to_player", "cause")
+
+    def __init__(self, arena, from_player, to_player, cause: str):
+        super().__init__(arena)
+        self.from_player = from_player
+        self.to_player = to_player
+        self.cause = cause
+
+
+class PlayerEliminated(GameEvent):
+    """玩家被淘汰（发布时玩家已移出仍在游戏中的玩家，但还没有被传送）"""
+
+    __slots__ = ("player", "cause")
+
+    def __init__(self, arena, player, cause: str):
+        super().__init__(arena)
+        self.player = player
+        self.cause = cause
+
+
+class GameEnded(GameEvent):
+    """一局游戏结束，散场传送之前发布"""
+
+    __slots__ = ("reason", "winner", "record")
+
+    def __init__(self, arena, reason: str, winner, record: Dict):
+        super().__init__(arena)
+        self.reason = reason
+        self.winner = winner
+        self.record = record  # 写入战局历史的记录
+
+
+Handler = Callable[[GameEvent], None]
+
+
+class EventBus:
+    """同步事件总线，支持延迟到下一个 tick 批量调用的订阅者"""
+
+    def __init__(self, schedule: Callable[[Callable], object],
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        初始化事件总线
+
+        Args:
+            schedule: 调度函数，签名为 schedule(callback)，在下一个 tick 执行回调并返回带 cancel() 的任务
+            on_error: 订阅者抛出异常时的回调，默认忽略
+        """
+        self._schedule = schedule
+        self._on_error = on_error
+        self._handlers: Dict[Type[GameEvent], List[Handler]] = {}
+        self._deferred_handlers: Dict[Type[GameEvent], List[Handler]] = {}
+        self._pending: List[Tuple[Handler, GameEvent]] = []
+        self._flush_task = None
+        self.published = 0  # 累计发布的事件数量
+        self.deferred = 0  # 累计延迟调用的订阅次数
+
+    def subscribe(self, event_type: Type[GameEvent], handler: Handler, deferred: bool = False):
+        """
+        订阅事件
+
+        Args:
+            event_type: 事件类型
+            handler: 订阅者，签名为 handler(event)
+            deferred: 是否为低优先级订阅者，延迟到下一个 tick 与同一 tick 内的其他事件一起调用
+        """
+        handlers = self._deferred_handlers if deferred else self._handlers
+        handlers.setdefault(event_type, []).append(handler)
+
+    def publish(self, event: GameEvent):
+        """
+        发布事件：立即调用普通订阅者，低优先级订阅者排队到下一个 tick
+
+        Args:
+            event: 事件
+        """
+        self.published += 1
+        event_type = type(event)
+        for handler in self._handlers.get(event_type, ()):
+            self._call(handler, event)
+
+        deferred = self._deferred_handlers.get(event_type)
+        if deferred:
+            self._pending.extend((handler, event) for handler in deferred)
+            if self._flush_task is None:
+                self._flush_task = self._schedule(self.flush)
+
+    def flush(self):
+        """立即调用所有排队中的低优先级订阅者（按发布顺序）"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        # 订阅者中发布的新事件排到下一批
+        pending, self._pending = self._pending, []
+        for handler, event in pending:
+            self._call(handler, event)
+        self.deferred += len(pending)
+
+    def _call(self, handler: Handler, event: GameEvent):
+        try:
+            handler(event)
+        except Exception as e:
+            if self._on_error is not None:
+                self._on_error(e)
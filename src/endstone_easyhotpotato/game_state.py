@@ -0,0 +1,163 @@
+"""
+烫手山芋游戏状态机
+"""
+from typing import Callable, Dict, FrozenSet
+
+# 游戏状态常量
+GAME_STATE_IDLE = 0      # 游戏空闲
+GAME_STATE_WAITING = 1   # 等待玩家
+GAME_STATE_PREPARING = 2 # 准备阶段
+GAME_STATE_RUNNING = 3   # 游戏进行中
+GAME_STATE_ENDING = 4    # 游戏结束
+
+# 状态名称（用于日志输出）
+GAME_STATE_NAMES = {
+    GAME_STATE_IDLE: "IDLE",
+    GAME_STATE_WAITING: "WAITING",
+    GAME_STATE_PREPARING: "PREPARING",
+    GAME_STATE_RUNNING: "RUNNING",
+    GAME_STATE_ENDING: "ENDING",
+}
+
+# 状态转移表：当前状态 -> 允许进入的下一个状态集合
+GAME_STATE_TRANSITIONS: Dict[int, FrozenSet[int]] = {
+    GAME_STATE_IDLE: frozenset({GAME_STATE_WAITING}),
+    GAME_STATE_WAITING: frozenset({GAME_STATE_IDLE, GAME_STATE_PREPARING}),
+    GAME_STATE_PREPARING: frozenset({GAME_STATE_IDLE, GAME_STATE_WAITING, GAME_STATE_RUNNING}),
+    GAME_STATE_RUNNING: frozenset({GAME_STATE_ENDING}),
+    GAME_STATE_ENDING: frozenset({GAME_STATE_IDLE, GAME_STATE_WAITING}),
+}
+
+
+class GameStateMachine:
+    """游戏状态机
+
+    每个状态拥有自己的周期任务：通过 run_task 启动的任务归属于当前状态，
+    离开该状态时会被自动取消，因此空闲状态下不会残留任何定时任务。
+    """
+
+    def __init__(self, run_task: Callable, initial_state: int = GAME_STATE_IDLE):
+        """
+        初始化状态机
+
+        Args:
+            run_task: 调度函数，签名为 run_task(callback, delay, period)，返回带 cancel() 的任务对象
+            initial_state: 初始状态
+        """
+        self._run_task = run_task
+        self._state = initial_state
+        self._tasks: Dict[str, object] = {}
+        self._on_enter: Dict[int, Callable[[int], None]] = {}
+        self._on_exit: Dict[int, Callable[[int], None]] = {}
+
+    @property
+    def state(self) -> int:
+        """当前状态"""
+        return self._state
+
+    @property
+    def state_name(self) -> str:
+        """当前状态名称"""
+        return GAME_STATE_NAMES.get(self._state, str(self._state))
+
+    def is_in(self, *states: int) -> bool:
+        """判断当前是否处于给定状态之一"""
+        return self._state in states
+
+    def can_transition(self, target: int) -> bool:
+        """判断能否转移到目标状态"""
+        return target in GAME_STATE_TRANSITIONS[self._state]
+
+    def on_enter(self, state: int, callback: Callable[[int], None]):
+        """
+        注册进入状态时的回调
+
+        Args:
+            state: 状态
+            callback: 回调函数，参数为上一个状态
+        """
+        self._on_enter[state] = callback
+
+    def on_exit(self, state: int, callback: Callable[[int], None]):
+        """
+        注册离开状态时的回调
+
+        Args:
+            state: 状态
+            callback: 回调函数，参数为下一个状态
+        """
+        self._on_exit[state] = callback
+
+    def transition(self, target: int) -> bool:
+        """
+        转移到目标状态
+
+        Args:
+            target: 目标状态
+
+        Returns:
+            bool: 转移是否合法并已执行
+        """
+        if target not in GAME_STATE_TRANSITIONS[self._state]:
+            return False
+
+        previous = self._state
+        self.cancel_all_tasks()
+        exit_callback = self._on_exit.get(previous)
+        if exit_callback:
+            exit_callback(target)
+
+        self._state = target
+        enter_callback = self._on_enter.get(target)
+        if enter_callback:
+            enter_callback(previous)
+        return True
+
+    def run_task(self, name: str, callback: Callable, delay: int = 0, period: int = 0):
+        """
+        启动一个归属于当前状态的任务，同名任务会被替换
+
+        Args:
+            name: 任务名称
+            callback: 任务回调
+            delay: 延迟（ticks）
+            period: 周期（ticks），0 表示只执行一次
+        """
+        self.cancel_task(name)
+
+        if period <= 0:
+            # 一次性任务执行后自动从任务表中移除
+            def run_once():
+                self._tasks.pop(name, None)
+                callback()
+            task = self._run_task(run_once, delay, period)
+        else:
+            task = self._run_task(callback, delay, period)
+
+        self._tasks[name] = task
+        return task
+
+    def get_task(self, name: str):
+        """获取当前状态拥有的指定任务，不存在时返回None"""
+        return self._tasks.get(name)
+
+    def has_task(self, name: str) -> bool:
+        """判断当前状态是否拥有指定任务"""
+        return name in self._tasks
+
+    def cancel_task(self, name: str):
+        """取消指定任务"""
+        task = self._tasks.pop(name, None)
+        if task is not None:
+            task.cancel()
+
+    def cancel_all_tasks(self):
+        """取消当前状态拥有的所有任务"""
+        tasks, self._tasks = self._tasks, {}
+        for task in tasks.values():
+            task.cancel()
+
+    @property
+    def task_count(self) -> int:
+        """当前正在运行的任务数量"""
+        return len(self._tasks)
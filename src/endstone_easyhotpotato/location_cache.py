@@ -0,0 +1,123 @@
+"""
+每 tick 的玩家位置快照
+
+player.location 每次调用都会跨越绑定层构造一个新的 Location 对象。
+同一个 tick 内越界检测、粒子、音效和 BossBar 都需要玩家位置，
+统一从这里读取，每位玩家每 tick 只读取一次；传送后快照立即失效。
+"""
+from typing import Callable, Dict, Hashable, Optional
+
+
+def get_dimension_id(dimension) -> int:
+    """获取维度ID（主世界0、下界1、末地2），无法识别时视为主世界"""
+    try:
+        # Dimension.Type 是普通枚举，不能直接转换为整数
+        return int(dimension.type.value)
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+def find_dimension(level, dim_id: int, default=None):
+    """
+    按维度ID查找维度对象
+
+    Args:
+        level: 世界（Level 对象）
+        dim_id: 维度ID
+        default: 找不到时的返回值
+
+    Returns:
+        维度对象，找不到时返回 default
+    """
+    for dimension in level.dimensions:
+        if get_dimension_id(dimension) == dim_id:
+            return dimension
+    return default
+
+
+class LocationSnapshot:
+    """玩家在某个 tick 的位置"""
+
+    __slots__ = ("location", "dim", "x", "y", "z")
+
+    def __init__(self, location):
+        self.location = location  # 原始 Location 对象，可直接用于 play_sound 等接口
+        self.dim = get_dimension_id(location.dimension)
+        self.x = location.x
+        self.y = location.y
+        self.z = location.z
+
+
+class LocationCache:
+    """按 tick 失效的玩家位置缓存"""
+
+    def __init__(self, clock: Callable[[], Optional[int]]):
+        """
+        初始化位置缓存
+
+        Args:
+            clock: 返回当前 tick 编号的函数，编号变化时缓存整体失效；
+                   返回None表示当前没有可靠的 tick 编号，此时不缓存
+        """
+        self._clock = clock
+        self._tick = None
+        self._snapshots: Dict[Hashable, Optional[LocationSnapshot]] = {}
+        self.reads = 0  # 实际读取 player.location 的次数
+        self.hits = 0  # 命中缓存的次数
+
+    def get(self, player) -> Optional[LocationSnapshot]:
+        """
+        获取玩家本 tick 的位置快照
+
+        Args:
+            player: 玩家对象
+
+        Returns:
+            Optional[LocationSnapshot]: 位置快照，无法获取位置时返回None
+        """
+        tick = self._clock()
+        if tick is None:
+            self.reads += 1
+            location = player.location
+            return LocationSnapshot(location) if location is not None else None
+
+        if tick != self._tick:
+            self._snapshots.clear()
+            self._tick = tick
+
+        key = player.id
+        if key in self._snapshots:
+            self.hits += 1
+            return self._snapshots[key]
+
+        self.reads += 1
+        location = player.location
+        snapshot = LocationSnapshot(location) if location is not None else None
+        self._snapshots[key] = snapshot
+        return snapshot
+
+    def location(self, player):
+        """
+        获取玩家本 tick 的 Location 对象
+
+        Args:
+            player: 玩家对象
+
+        Returns:
+            Location: 位置对象，无法获取位置时返回None
+        """
+        snapshot = self.get(player)
+        return snapshot.location if snapshot is not None else None
+
+    def invalidate(self, player):
+        """
+        使玩家的快照失效（传送、切换维度后调用）
+
+        Args:
+            player: 玩家对象
+        """
+        self._snapshots.pop(player.id, None)
+
+    def clear(self):
+        """清空所有快照"""
+        self._snapshots.clear()
@@ -0,0 +1,112 @@
+"""
+每 tick 合并发送的聊天消息
+
+同一 tick 内发给同一玩家的所有消息合并为一次 send_message，在下一个 tick 发出。
+带 key 的消息采用"后者优先"策略：同一玩家的同 key 消息在缓冲区中只保留最新的一条
+（优先级更低的新消息不会覆盖优先级更高的旧消息），例如一个 tick 内多次转移山芋时
+只保留最终持有者的通知。
+"""
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+# 消息优先级
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+
+
+class Outbox:
+    """按玩家缓冲、每 tick 发送一次的消息队列"""
+
+    def __init__(self, schedule: Callable[[Callable], object],
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        初始化消息队列
+
+        Args:
+            schedule: 调度函数，签名为 schedule(callback)，在下一个 tick 执行回调并返回带 cancel() 的任务
+            on_error: 发送失败时的回调，默认忽略
+        """
+        self._schedule = schedule
+        self._on_error = on_error
+        self._pending: Dict[Hashable, Tuple[object, Dict[Hashable, Tuple[int, str]]]] = {}
+        self._seq = 0
+        self._flush_task = None
+        self.sent = 0  # 实际调用 send_message 的次数
+        self.merged = 0  # 被合并到同一次发送中的消息数量
+        self.dropped = 0  # 被更新的同 key 消息取代的消息数量
+
+    @property
+    def pending_count(self) -> int:
+        """缓冲区中等待发送的玩家数量"""
+        return len(self._pending)
+
+    def send(self, player, message: str, key: Optional[Hashable] = None, priority: int = PRIORITY_NORMAL):
+        """
+        缓冲一条发给玩家的消息
+
+        Args:
+            player: 玩家对象
+            message: 消息内容
+            key: 合并键，同一玩家的同 key 消息只保留最新一条；None表示不合并
+            priority: 优先级，同 key 时低优先级的新消息不会取代高优先级的旧消息
+        """
+        entry = self._pending.get(player.id)
+        if entry is None:
+            entry = (player, {})
+            self._pending[player.id] = entry
+        lines = entry[1]
+
+        self._seq += 1
+        if key is None:
+            key = (Outbox, self._seq)
+        else:
+            previous = lines.get(key)
+            if previous is not None:
+                self.dropped += 1
+                if priority < previous[0]:
+                    return
+                # 删除后重新插入，保证合并后的顺序以最新消息为准
+                del lines[key]
+        lines[key] = (priority, message)
+
+        if self._flush_task is None:
+            self._flush_task = self._schedule(self.flush)
+
+    def send_many(self, players: Iterable, message: str, key: Optional[Hashable] = None,
+                  priority: int = PRIORITY_NORMAL):
+        """
+        缓冲一条发给多个玩家的消息
+
+        Args:
+            players: 玩家集合
+            message: 消息内容
+            key: 合并键
+            priority: 优先级
+        """
+        for player in players:
+            self.send(player, message, key, priority)
+
+    def discard(self, player):
+        """
+        丢弃发给玩家的所有待发送消息（例如玩家已退出）
+
+        Args:
+            player: 玩家对象
+        """
+        self._pending.pop(player.id, None)
+
+    def flush(self):
+        """立即发送缓冲区中的所有消息"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        pending, self._pending = self._pending, {}
+        for player, lines in pending.values():
+            try:
+                player.send_message("\n".join(message for _, message in lines.values()))
+                self.sent += 1
+                self.merged += len(lines) - 1
+            except Exception as e:
+                if self._on_error is not None:
+                    self._on_error(e)
@@ -0,0 +1,164 @@
+"""
+竞技场参与者
+
+按玩家ID索引参与者，增删、按ID判断成员与等概率随机抽取均为 O(1)，
+不再为了抽取新的山芋持有者而把整个集合复制成列表。
+参与者分为仍在游戏中的玩家与本局已被淘汰的玩家两部分。
+"""
+import random
+from itertools import chain
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+class PlayerIndex:
+    """按玩家ID索引的玩家集合（列表 + ID到下标的映射）"""
+
+    __slots__ = ("_players", "_index")
+
+    def __init__(self):
+        self._players: List = []
+        self._index: Dict[Hashable, int] = {}  # 玩家ID -> 在列表中的下标
+
+    def add(self, player) -> bool:
+        """
+        加入玩家
+
+        Args:
+            player: 玩家对象
+
+        Returns:
+            bool: 玩家原本不在集合中时返回True
+        """
+        if player.id in self._index:
+            # 同一玩家重新进入服务器后包装对象会变化，保留最新的对象
+            self._players[self._index[player.id]] = player
+            return False
+        self._index[player.id] = len(self._players)
+        self._players.append(player)
+        return True
+
+    def discard(self, player) -> bool:
+        """
+        移除玩家（与末尾元素交换后弹出）
+
+        Args:
+            player: 玩家对象
+
+        Returns:
+            bool: 玩家原本在集合中时返回True
+        """
+        i = self._index.pop(player.id, None)
+        if i is None:
+            return False
+        last = self._players.pop()
+        if i < len(self._players):
+            self._players[i] = last
+            self._index[last.id] = i
+        return True
+
+    def get(self, player_id: Hashable):
+        """按玩家ID获取玩家对象，不存在时返回None"""
+        i = self._index.get(player_id)
+        return None if i is None else self._players[i]
+
+    def contains_id(self, player_id: Hashable) -> bool:
+        """按玩家ID判断是否在集合中"""
+        return player_id in self._index
+
+    def random_choice(self, rng: Optional[random.Random] = None):
+        """
+        等概率随机抽取一名玩家
+
+        Args:
+            rng: 随机数生成器，默认使用 random 模块
+
+        Returns:
+            玩家对象，集合为空时返回None
+        """
+        if not self._players:
+            return None
+        return self._players[(rng or random).randrange(len(self._players))]
+
+    def snapshot(self) -> Tuple:
+        """当前成员的元组副本（遍历期间需要修改集合时使用）"""
+        return tuple(self._players)
+
+    def clear(self):
+        """清空集合"""
+        self._players.clear()
+        self._index.clear()
+
+    def __contains__(self, player) -> bool:
+        return player.id in self._index
+
+    def __iter__(self) -> Iterator:
+        # 直接遍历内部列表，遍历期间不要增删成员
+        return iter(self._players)
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+
+class ParticipantSet:
+    """一个竞技场的参与者：仍在游戏中的玩家与本局已被淘汰的玩家"""
+
+    __slots__ = ("alive", "eliminated")
+
+    def __init__(self):
+        self.alive = PlayerIndex()  # 仍在游戏中的玩家
+        self.eliminated = PlayerIndex()  # 本局已被淘汰、散场前仍属于竞技场的玩家
+
+    def add(self, player):
+        """加入游戏（作为仍在游戏中的玩家）"""
+        self.eliminated.discard(player)
+        self.alive.add(player)
+
+    def eliminate(self, player) -> bool:
+        """
+        淘汰玩家
+
+        Args:
+            player: 玩家对象
+
+        Returns:
+            bool: 玩家原本仍在游戏中时返回True
+        """
+        if not self.alive.discard(player):
+            return False
+        self.eliminated.add(player)
+        return True
+
+    def remove(self, player):
+        """玩家离开竞技场"""
+        self.alive.discard(player)
+        self.eliminated.discard(player)
+
+    def clear_eliminated(self) -> Tuple:
+        """
+        清空被淘汰的玩家（散场时调用）
+
+        Returns:
+            Tuple: 被清空的玩家
+        """
+        players = self.eliminated.snapshot()
+        self.eliminated.clear()
+        return players
+
+    def clear(self):
+        """清空所有参与者"""
+        self.alive.clear()
+        self.eliminated.clear()
+
+    def contains_id(self, player_id: Hashable) -> bool:
+        """按玩家ID判断是否为参与者（包括被淘汰的玩家）"""
+        return self.alive.contains_id(player_id) or self.eliminated.contains_id(player_id)
+
+    def __contains__(self, player) -> bool:
+        return self.contains_id(player.id)
+
+    def __iter__(self) -> Iterator:
+        """遍历所有参与者（包括被淘汰的玩家）"""
+        return chain(self.alive, self.eliminated)
+
+    def __len__(self) -> int:
+        return len(self.alive) + len(self.eliminated)
@@ -0,0 +1,126 @@
+"""
+山芋物品与快捷栏同步
+
+山芋物品堆只构建一次，之后重复使用同一个原型。
+每位持有者记录快捷栏中哪些槽位已确认是山芋，只重写缺失或被改动的槽位；
+平时只检查手持槽位，每隔一段时间再完整核对一次快捷栏。
+"""
+from typing import Dict, Hashable
+
+# 快捷栏槽位数量
+HOTBAR_SIZE = 9
+HOTBAR_MASK = (1 << HOTBAR_SIZE) - 1
+
+# 每隔多少次填充完整核对一次快捷栏
+FULL_CHECK_INTERVAL = 10
+
+
+class PotatoHotbar:
+    """持有者快捷栏中的山芋"""
+
+    def __init__(self, item_id: str, display_name: str, amount: int = 64):
+        """
+        初始化
+
+        Args:
+            item_id: 物品ID
+            display_name: 物品显示名称
+            amount: 每个槽位的数量
+        """
+        self.item_id = item_id
+        self.display_name = display_name
+        self.amount = amount
+        self._prototype = None
+        self._clean: Dict[Hashable, int] = {}  # 玩家ID -> 已确认正确的槽位位掩码
+        self._fills: Dict[Hashable, int] = {}  # 玩家ID -> 上次完整核对后的填充次数
+        self.slots_written = 0  # 累计写入的槽位数量
+
+    @property
+    def prototype(self):
+        """山芋物品堆原型（首次使用时构建）"""
+        if self._prototype is None:
+            from endstone.inventory import ItemStack
+            potato = ItemStack(self.item_id, self.amount)
+
+            # 设置物品元数据
+            item_meta = potato.item_meta
+            if item_meta is not None:
+                item_meta.display_name = self.display_name
+                potato.set_item_meta(item_meta)
+            self._prototype = potato
+        return self._prototype
+
+    def is_potato(self, item) -> bool:
+        """判断物品堆是否为完整的山芋"""
+        return item is not None and item.type == self.item_id and item.amount == self.amount
+
+    def mark_dirty(self, player, slot: int = None):
+        """
+        标记玩家的快捷栏可能被改动
+
+        Args:
+            player: 玩家对象
+            slot: 被改动的槽位，None表示整个快捷栏
+        """
+        key = player.id
+        if key not in self._clean:
+            return
+        if slot is None:
+            self._clean[key] = 0
+        elif 0 <= slot < HOTBAR_SIZE:
+            self._clean[key] &= ~(1 << slot)
+
+    def forget(self, player):
+        """
+        停止跟踪玩家（移除山芋或离开游戏后调用）
+
+        Args:
+            player: 玩家对象
+        """
+        self._clean.pop(player.id, None)
+        self._fills.pop(player.id, None)
+
+    def fill(self, player) -> int:
+        """
+        把玩家的快捷栏填满山芋，只写入缺失或被改动的槽位
+
+        Args:
+            player: 玩家对象
+
+        Returns:
+            int: 本次写入的槽位数量
+        """
+        inventory = player.inventory
+        if inventory is None:
+            return 0
+
+        key = player.id
+        clean = self._clean.get(key, 0)
+        fills = self._fills.get(key, 0) + 1
+
+        if clean == HOTBAR_MASK:
+            if fills >= FULL_CHECK_INTERVAL:
+                # 定期完整核对
+                fills = 0
+                for slot in range(HOTBAR_SIZE):
+                    if not self.is_potato(inventory.get_item(slot)):
+                        clean &= ~(1 << slot)
+            else:
+                # 平时只检查手持槽位
+                held = inventory.held_item_slot
+                if not self.is_potato(inventory.get_item(held)):
+                    clean &= ~(1 << held)
+        self._fills[key] = fills
+
+        written = 0
+        if clean != HOTBAR_MASK:
+            potato = self.prototype
+            for slot in range(HOTBAR_SIZE):
+                if not clean & (1 << slot):
+                    inventory.set_item(slot, potato)
+                    written += 1
+            clean = HOTBAR_MASK
+
+        self._clean[key] = clean
+        self.slots_written += written
+        return written
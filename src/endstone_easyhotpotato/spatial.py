@@ -0,0 +1,123 @@
+"""
+按区块划分的空间索引
+
+竞技区域登记在 16x16 的区块网格中，"某点位于哪些区域" 只需查询一个网格，平均 O(1)。
+"""
+import math
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# 网格边长（与区块大小一致）
+CELL_SHIFT = 4
+CELL_SIZE = 1 << CELL_SHIFT
+
+# 区域类型
+REGION_ARENA = "arena"
+
+CellKey = Tuple[int, int, int]
+
+
+def cell_of(dim: int, x: float, z: float) -> CellKey:
+    """
+    计算坐标所在的网格
+
+    Args:
+        dim: 维度ID
+        x: X坐标
+        z: Z坐标
+
+    Returns:
+        CellKey: (维度ID, 网格X, 网格Z)
+    """
+    return (dim, math.floor(x) >> CELL_SHIFT, math.floor(z) >> CELL_SHIFT)
+
+
+class Region:
+    """轴对齐的矩形区域（只考虑 X/Z 平面）"""
+
+    __slots__ = ("key", "kind", "dim", "min_x", "min_z", "max_x", "max_z", "owner")
+
+    def __init__(self, key: Hashable, kind: str, dim: int,
+                 min_x: float, min_z: float, max_x: float, max_z: float, owner=None):
+        self.key = key
+        self.kind = kind
+        self.dim = dim
+        self.min_x = min_x
+        self.min_z = min_z
+        self.max_x = max_x
+        self.max_z = max_z
+        self.owner = owner
+
+    def contains(self, dim: int, x: float, z: float) -> bool:
+        """判断点是否在区域内"""
+        return (dim == self.dim
+                and self.min_x <= x <= self.max_x
+                and self.min_z <= z <= self.max_z)
+
+    def cells(self) -> List[CellKey]:
+        """区域覆盖的所有网格"""
+        _, min_cx, min_cz = cell_of(self.dim, self.min_x, self.min_z)
+        _, max_cx, max_cz = cell_of(self.dim, self.max_x, self.max_z)
+        return [
+            (self.dim, cx, cz)
+            for cx in range(min_cx, max_cx + 1)
+            for cz in range(min_cz, max_cz + 1)
+        ]
+
+
+class SpatialGrid:
+    """区域的网格索引"""
+
+    def __init__(self):
+        self._regions: Dict[Hashable, Region] = {}
+        self._region_cells: Dict[CellKey, List[Region]] = {}
+
+    def set_region(self, region: Region):
+        """
+        登记（或替换）一个区域
+
+        Args:
+            region: 区域
+        """
+        self.remove_region(region.key)
+        self._regions[region.key] = region
+        for cell in region.cells():
+            self._region_cells.setdefault(cell, []).append(region)
+
+    def remove_region(self, key: Hashable):
+        """
+        移除一个区域
+
+        Args:
+            key: 区域键
+        """
+        region = self._regions.pop(key, None)
+        if region is None:
+            return
+        for cell in region.cells():
+            bucket = self._region_cells.get(cell)
+            if not bucket:
+                continue
+            bucket.remove(region)
+            if not bucket:
+                del self._region_cells[cell]
+
+    def get_region(self, key: Hashable) -> Optional[Region]:
+        """按键获取区域"""
+        return self._regions.get(key)
+
+    def regions_at(self, dim: int, x: float, z: float) -> List[Region]:
+        """
+        获取包含该点的所有区域
+
+        Args:
+            dim: 维度ID
+            x: X坐标
+            z: Z坐标
+
+        Returns:
+            List[Region]: 包含该点的区域列表
+        """
+        bucket = self._region_cells.get(cell_of(dim, x, z))
+        if not bucket:
+            return []
+        return [region for region in bucket if region.contains(dim, x, z)]
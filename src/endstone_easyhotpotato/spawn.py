@@ -0,0 +1,151 @@
+"""
+出生点
+
+用 Poisson-disk 采样（Bridson 算法）在竞技区域内生成间距均匀的出生点，
+按竞技场与活动半径缓存；开局时从随机位置起轮流分配，每位玩家 O(1)。
+出生点数量只按参赛人数的若干倍生成（放大间距使其分布到整个区域），
+生成耗时与参赛人数成正比，不随区域面积增长。
+"""
+import math
+import random
+from typing import List, Optional, Tuple
+
+# 出生点之间的最小间距（方块）
+DEFAULT_SPAWN_SPACING = 3.0
+# 出生点与区域边缘的距离
+SPAWN_MARGIN = 0.5
+# 每个活跃点尝试生成新点的次数
+SAMPLE_ATTEMPTS = 30
+# 出生点数量约为参赛人数的该倍数，且不少于 MIN_SPAWN_SLOTS 个
+SLOTS_PER_PLAYER = 2
+MIN_SPAWN_SLOTS = 16
+# 采样填满区域后的点密度约为 0.64 / 间距²
+POISSON_DENSITY = 0.64
+
+Offset = Tuple[float, float]
+
+
+def poisson_disk_offsets(half_x: float, half_z: float, spacing: float,
+                         rng: Optional[random.Random] = None) -> List[Offset]:
+    """
+    在 [-half_x, half_x] x [-half_z, half_z] 内生成间距不小于 spacing 的点
+
+    Args:
+        half_x: X 方向半宽
+        half_z: Z 方向半宽
+        spacing: 最小间距
+        rng: 随机数生成器
+
+    Returns:
+        List[Offset]: 相对区域中心的偏移列表，至少包含一个点
+    """
+    rng = rng or random.Random()
+    if half_x <= 0 or half_z <= 0 or spacing <= 0:
+        return [(0.0, 0.0)]
+
+    width = half_x * 2
+    depth = half_z * 2
+    cell = spacing / math.sqrt(2)
+    cols = int(width / cell) + 1
+    rows = int(depth / cell) + 1
+    grid: List[Optional[Offset]] = [None] * (cols * rows)
+
+    def grid_index(x: float, z: float) -> int:
+        return int(z / cell) * cols + int(x / cell)
+
+    def fits(x: float, z: float) -> bool:
+        cx = int(x / cell)
+        cz = int(z / cell)
+        for gz in range(max(cz - 2, 0), min(cz + 3, rows)):
+            for gx in range(max(cx - 2, 0), min(cx + 3, cols)):
+                point = grid[gz * cols + gx]
+                if point is not None:
+                    dx = point[0] - x
+                    dz = point[1] - z
+                    if dx * dx + dz * dz < spacing * spacing:
+                        return False
+        return True
+
+    first = (rng.uniform(0, width), rng.uniform(0, depth))
+    points = [first]
+    grid[grid_index(*first)] = first
+    active = [first]
+
+    while active:
+        i = rng.randrange(len(active))
+        px, pz = active[i]
+        for _ in range(SAMPLE_ATTEMPTS):
+            angle = rng.uniform(0, 2 * math.pi)
+            radius = rng.uniform(spacing, 2 * spacing)
+            x = px + math.cos(angle) * radius
+            z = pz + math.sin(angle) * radius
+            if 0 <= x < width and 0 <= z < depth and fits(x, z):
+                point = (x, z)
+                points.append(point)
+                grid[grid_index(x, z)] = point
+                active.append(point)
+                break
+        else:
+            # 该点周围已经放不下新点
+            active[i] = active[-1]
+            active.pop()
+
+    return [(x - half_x, z - half_z) for x, z in points]
+
+
+def spacing_for_count(half_x: float, half_z: float, spacing: float, count: int) -> float:
+    """
+    放大间距，使区域内只生成约 count 个点
+
+    Args:
+        half_x: X 方向半宽
+        half_z: Z 方向半宽
+        spacing: 最小间距
+        count: 期望的点数
+
+    Returns:
+        float: 不小于 spacing 的采样间距
+    """
+    if count <= 0 or half_x <= 0 or half_z <= 0:
+        return spacing
+    return max(spacing, math.sqrt(POISSON_DENSITY * (half_x * 2) * (half_z * 2) / count))
+
+
+class SpawnSlots:
+    """一个竞技场缓存的出生点"""
+
+    __slots__ = ("offsets", "players", "_cursor")
+
+    def __init__(self, area_x: float, area_z: float, spacing: float = DEFAULT_SPAWN_SPACING,
+                 players: int = 0, rng: Optional[random.Random] = None):
+        """
+        生成出生点
+
+        Args:
+            area_x: 活动半径 X
+            area_z: 活动半径 Z
+            spacing: 最小间距
+            players: 参赛人数，决定生成的出生点数量
+            rng: 随机数生成器
+        """
+        rng = rng or random.Random()
+        self.players = max(players, MIN_SPAWN_SLOTS // SLOTS_PER_PLAYER)  # 足够分配的参赛人数
+        half_x = area_x - SPAWN_MARGIN
+        half_z = area_z - SPAWN_MARGIN
+        spacing = spacing_for_count(half_x, half_z, spacing, self.players * SLOTS_PER_PLAYER)
+        self.offsets = poisson_disk_offsets(half_x, half_z, spacing, rng)
+        rng.shuffle(self.offsets)
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def begin(self):
+        """开始新的一局，从随机位置开始分配"""
+        self._cursor = random.randrange(len(self.offsets))
+
+    def next(self) -> Offset:
+        """分配下一个出生点（出生点用完后循环使用）"""
+        offset = self.offsets[self._cursor % len(self.offsets)]
+        self._cursor += 1
+        return offset
@@ -0,0 +1,131 @@
+"""
+分批传送队列
+
+开赛与散场时不再在同一个 tick 里传送所有玩家，而是按提交顺序排队，
+每个 tick 最多执行固定数量的传送。每批传送全部完成后才调用完成回调，
+批次之间按提交顺序完成。
+"""
+from collections import deque
+from typing import Callable, Deque, Iterable, Optional, Tuple
+
+# 默认每个 tick 最多传送的玩家数量
+DEFAULT_TELEPORTS_PER_TICK = 4
+
+
+class TeleportBatch:
+    """一批按顺序执行的传送"""
+
+    __slots__ = ("jobs", "on_complete", "should_run", "cancelled", "done", "_queue")
+
+    def __init__(self, queue: "TeleportQueue", jobs: Iterable[Tuple],
+                 on_complete: Optional[Callable[[], None]], should_run: Optional[Callable[[object], bool]]):
+        self._queue = queue
+        self.jobs: Deque[Tuple] = deque(jobs)  # (玩家, 目标位置, 传送后回调)
+        self.on_complete = on_complete
+        self.should_run = should_run
+        self.cancelled = False
+        self.done = False
+
+    def cancel(self):
+        """取消批次中尚未执行的传送，完成回调不再调用"""
+        if self.cancelled or self.done:
+            return
+        self.cancelled = True
+        self.jobs.clear()
+        self._queue._discard(self)
+
+
+class TeleportQueue:
+    """由 tick 管线驱动的分批传送队列"""
+
+    def __init__(self, schedule: Callable, teleport: Callable,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        初始化传送队列
+
+        Args:
+            schedule: 调度函数，签名为 schedule(callback, delay, period)，返回带 cancel() 的任务
+            teleport: 传送函数，签名为 teleport(player, location)
+            on_error: 单个传送失败时的回调，默认忽略
+        """
+        self._schedule = schedule
+        self._teleport = teleport
+        self._on_error = on_error
+        self._batches: Deque[TeleportBatch] = deque()
+        self._task = None
+        self.per_tick = DEFAULT_TELEPORTS_PER_TICK
+        self.teleported = 0  # 累计完成的传送数量
+
+    @property
+    def pending_count(self) -> int:
+        """等待执行的传送数量"""
+        return sum(len(batch.jobs) for batch in self._batches)
+
+    def submit(self, jobs: Iterable[Tuple], on_complete: Optional[Callable[[], None]] = None,
+               should_run: Optional[Callable[[object], bool]] = None) -> TeleportBatch:
+        """
+        提交一批传送
+
+        Args:
+            jobs: 传送列表，每项为 (玩家, 目标位置, 传送后回调或None)
+            on_complete: 整批完成后的回调
+            should_run: 执行前的检查，返回False时跳过该玩家（例如玩家已离开竞技场）
+
+        Returns:
+            TeleportBatch: 批次句柄
+        """
+        batch = TeleportBatch(self, jobs, on_complete, should_run)
+        self._batches.append(batch)
+        if self._task is None:
+            self._task = self._schedule(self.tick, 0, 1)
+        return batch
+
+    def tick(self):
+        """执行本 tick 的传送"""
+        self._run(max(self.per_tick, 1))
+
+    def drain(self):
+        """立即执行所有剩余的传送（插件禁用时使用）"""
+        self._run(None)
+
+    def _run(self, budget: Optional[int]):
+        batches = self._batches
+        while batches and (budget is None or budget > 0):
+            batch = batches[0]
+            if batch.jobs:
+                player, location, after = batch.jobs.popleft()
+                if batch.should_run is None or batch.should_run(player):
+                    try:
+                        self._teleport(player, location)
+                        if after is not None:
+                            after(player)
+                        self.teleported += 1
+                    except Exception as e:
+                        if self._on_error is not None:
+                            self._on_error(e)
+                    if budget is not None:
+                        budget -= 1
+
+            if not batch.jobs:
+                # 整批完成，按提交顺序调用完成回调
+                batches.popleft()
+                batch.done = True
+                if batch.on_complete is not None:
+                    try:
+                        batch.on_complete()
+                    except Exception as e:
+                        if self._on_error is not None:
+                            self._on_error(e)
+        self._stop_if_empty()
+
+    def _discard(self, batch: TeleportBatch):
+        try:
+            self._batches.remove(batch)
+        except ValueError:
+            pass
+        self._stop_if_empty()
+
+    def _stop_if_empty(self):
+        if not self._batches and self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,140 @@
+"""
+共享的 tick 调度管线
+
+所有竞技场的周期任务都注册到同一条管线上，由一个调度器任务统一驱动；
+没有任何任务时驱动任务会被取消，空闲服务器上不会产生插件 tick。
+"""
+import heapq
+import time
+from typing import Callable, List, Optional, Tuple
+
+# tick 耗时指数移动平均的平滑系数
+TICK_COST_ALPHA = 0.1
+
+
+class PipelineTask:
+    """管线中的任务句柄，接口与 endstone 的 Task 保持一致（cancel）"""
+
+    __slots__ = ("callback", "period", "cancelled", "_pipeline")
+
+    def __init__(self, pipeline: "TickPipeline", callback: Callable, period: int):
+        self._pipeline = pipeline
+        self.callback = callback
+        self.period = period
+        self.cancelled = False
+
+    def cancel(self):
+        """取消任务"""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self._pipeline._release()
+
+
+class TickPipeline:
+    """由单个调度器任务驱动的 tick 管线"""
+
+    def __init__(self, run_task: Callable, on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        初始化 tick 管线
+
+        Args:
+            run_task: 调度函数，签名为 run_task(callback, delay, period)，返回带 cancel() 的任务对象
+            on_error: 任务抛出异常时的回调，默认继续抛出
+        """
+        self._run_task = run_task
+        self._on_error = on_error
+        self._heap: List[Tuple[int, int, PipelineTask]] = []
+        self._seq = 0
+        self._active = 0
+        self._driver = None
+        self.current_tick = 0
+        self.last_tick_cost = 0.0  # 上一个 tick 的耗时（秒）
+        self.tick_cost_ema = 0.0  # tick 耗时的指数移动平均（秒）
+        self.on_tick_end: Optional[Callable[[float], None]] = None  # 每个 tick 结束时以本 tick 耗时调用
+
+    @property
+    def running(self) -> bool:
+        """驱动任务是否正在运行"""
+        return self._driver is not None
+
+    @property
+    def task_count(self) -> int:
+        """未取消的任务数量"""
+        return self._active
+
+    def schedule(self, callback: Callable, delay: int = 0, period: int = 0) -> PipelineTask:
+        """
+        注册一个任务
+
+        Args:
+            callback: 任务回调
+            delay: 延迟（ticks），0 表示下一个 tick 执行
+            period: 周期（ticks），0 表示只执行一次
+
+        Returns:
+            PipelineTask: 任务句柄
+        """
+        task = PipelineTask(self, callback, period)
+        self._push(task, self.current_tick + max(delay, 1))
+        self._active += 1
+
+        if self._driver is None:
+            self._driver = self._run_task(self.tick, 0, 1)
+        return task
+
+    def tick(self):
+        """执行一个 tick 内到期的所有任务"""
+        self.current_tick += 1
+        now = self.current_tick
+        heap = self._heap
+        started = time.perf_counter()
+
+        while heap and heap[0][0] <= now:
+            _, _, task = heapq.heappop(heap)
+            if task.cancelled:
+                continue
+
+            if task.period > 0:
+                self._push(task, now + task.period)
+            else:
+                # 一次性任务执行前即视为完成
+                task.cancelled = True
+                self._active -= 1
+
+            try:
+                task.callback()
+            except Exception as e:
+                if self._on_error is None:
+                    raise
+                self._on_error(e)
+
+        cost = time.perf_counter() - started
+        self.last_tick_cost = cost
+        self.tick_cost_ema += (cost - self.tick_cost_ema) * TICK_COST_ALPHA
+        if self.on_tick_end is not None:
+            self.on_tick_end(cost)
+        self._stop_if_empty()
+
+    def shutdown(self):
+        """取消所有任务并停止驱动任务"""
+        for _, _, task in self._heap:
+            task.cancelled = True
+        self._heap.clear()
+        self._active = 0
+        self._stop_if_empty()
+
+    def _push(self, task: PipelineTask, next_tick: int):
+        self._seq += 1
+        heapq.heappush(self._heap, (next_tick, self._seq, task))
+
+    def _release(self):
+        self._active -= 1
+        self._stop_if_empty()
+
+    def _stop_if_empty(self):
+        if self._active > 0 or self._driver is None:
+            return
+        self._driver.cancel()
+        self._driver = None
+        self._heap.clear()
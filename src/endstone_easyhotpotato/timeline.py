@@ -0,0 +1,182 @@
+"""
+每局游戏的时间线
+
+开赛时为每位参赛玩家分配一个编号，对局中的持有者变化、传递和淘汰
+以 (类型, 时间, 玩家编号, 目标) 的形式追加到预先分配的数组中，每次追加为 O(1)；
+游戏结束时再统一汇总为每位玩家的持有时间、传出/接到次数、淘汰顺序和存活时间。
+"""
+from array import array
+from typing import Dict, Hashable, Iterable, List, Optional
+
+from .events import ELIMINATED_EXPLOSION, ELIMINATED_OUT_OF_BOUNDS
+
+# 中途离开游戏（退出服务器、被踢出或主动离开）
+CAUSE_DEPARTED = "departed"
+# 淘汰原因在数组中按下标保存
+CAUSES = (ELIMINATED_EXPLOSION, ELIMINATED_OUT_OF_BOUNDS, CAUSE_DEPARTED)
+
+# 时间线记录类型
+ENTRY_HOLD = 0  # 山芋交给某位玩家（开局、重新分配），目标为 -1 表示无人持有
+ENTRY_TRANSFER = 1  # 持有者击中其他玩家
+ENTRY_ELIMINATED = 2  # 玩家被淘汰，目标为淘汰原因下标
+
+# 预先分配的记录数量：每位玩家的预计记录数与最小容量
+ENTRIES_PER_PLAYER = 16
+MIN_CAPACITY = 64
+
+
+class GameTimeline:
+    """一局游戏的时间线"""
+
+    def __init__(self):
+        self._slots: Dict[Hashable, int] = {}  # 玩家ID -> 编号
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._start = 0.0
+        self._capacity = 0
+        self._kinds = array("B")
+        self._times = array("d")  # 相对开局的秒数
+        self._actors = array("i")
+        self._targets = array("i")
+        self.length = 0  # 本局已记录的条数
+
+    def begin(self, players: Iterable, now: float):
+        """
+        开始记录新的一局，复用已分配的数组
+
+        Args:
+            players: 参赛玩家
+            now: 开局时间戳
+        """
+        self._slots.clear()
+        self._ids.clear()
+        self._names.clear()
+        for player in players:
+            self._slots[player.id] = len(self._ids)
+            self._ids.append(str(player.id))
+            self._names.append(player.name)
+        self._start = now
+        self.length = 0
+        self._reserve(max(MIN_CAPACITY, len(self._ids) * ENTRIES_PER_PLAYER))
+
+    def hold(self, player, now: float):
+        """
+        记录山芋交给某位玩家（不是击中传递）
+
+        Args:
+            player: 新的持有者，None表示无人持有
+            now: 时间戳
+        """
+        target = -1 if player is None else self._slots.get(player.id, -1)
+        self._append(ENTRY_HOLD, now, -1, target)
+
+    def transfer(self, from_player, to_player, now: float):
+        """
+        记录一次击中传递
+
+        Args:
+            from_player: 原持有者
+            to_player: 新持有者
+            now: 时间戳
+        """
+        self._append(ENTRY_TRANSFER, now, self._slots.get(from_player.id, -1), self._slots.get(to_player.id, -1))
+
+    def eliminate(self, player, now: float, cause: str):
+        """
+        记录玩家被淘汰或中途离开
+
+        Args:
+            player: 玩家
+            now: 时间戳
+            cause: 淘汰原因（ELIMINATED_* 或 CAUSE_DEPARTED）
+        """
+        slot = self._slots.get(player.id)
+        if slot is None:
+            return
+        self._append(ENTRY_ELIMINATED, now, slot, CAUSES.index(cause) if cause in CAUSES else -1)
+
+    def summarize(self, now: float) -> Dict:
+        """
+        汇总本局时间线
+
+        Args:
+            now: 结束时间戳
+
+        Returns:
+            Dict: 包含以下字段:
+                - transfers: 击中传递总次数
+                - elimination_order: 按淘汰先后排列的玩家ID
+                - players: 每位玩家的 id、name、hold_time、transfers_made、
+                  transfers_received、survived（秒）和 eliminated（淘汰原因，未淘汰为None）
+        """
+        count = len(self._ids)
+        hold_time = [0.0] * count
+        made = [0] * count
+        received = [0] * count
+        survived: List[Optional[float]] = [None] * count
+        causes: List[Optional[str]] = [None] * count
+        order = []
+        holder, since = -1, 0.0
+
+        def release(at: float):
+            if holder >= 0:
+                hold_time[holder] += at - since
+
+        for i in range(self.length):
+            kind, at, actor, target = self._kinds[i], self._times[i], self._actors[i], self._targets[i]
+            if kind == ENTRY_ELIMINATED:
+                if survived[actor] is not None:
+                    continue
+                survived[actor] = at
+                causes[actor] = CAUSES[target] if target >= 0 else CAUSE_DEPARTED
+                order.append(self._ids[actor])
+                if actor == holder:
+                    release(at)
+                    holder = -1
+                continue
+            if kind == ENTRY_TRANSFER:
+                if actor >= 0:
+                    made[actor] += 1
+                if target >= 0:
+                    received[target] += 1
+            release(at)
+            holder, since = target, at
+
+        end = now - self._start
+        release(end)
+        return {
+            "transfers": sum(made),
+            "elimination_order": order,
+            "players": [
+                {
+                    "id": self._ids[i],
+                    "name": self._names[i],
+                    "hold_time": round(hold_time[i], 1),
+                    "transfers_made": made[i],
+                    "transfers_received": received[i],
+                    "survived": round(end if survived[i] is None else survived[i], 1),
+                    "eliminated": causes[i],
+                }
+                for i in range(count)
+            ],
+        }
+
+    def _append(self, kind: int, now: float, actor: int, target: int):
+        i = self.length
+        if i == self._capacity:
+            self._reserve(self._capacity * 2)
+        self._kinds[i] = kind
+        self._times[i] = now - self._start
+        self._actors[i] = actor
+        self._targets[i] = target
+        self.length = i + 1
+
+    def _reserve(self, capacity: int):
+        extra = capacity - self._capacity
+        if extra <= 0:
+            return
+        self._kinds.extend(bytes(extra))
+        self._times.extend(array("d", [0.0]) * extra)
+        self._actors.extend(array("i", [0]) * extra)
+        self._targets.extend(array("i", [0]) * extra)
+        self._capacity = capacity
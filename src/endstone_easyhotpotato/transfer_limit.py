@@ -0,0 +1,107 @@
+"""
+山芋传递限流
+
+持有者连续点击或两名玩家来回互打时，每次命中都会触发背包重写、广播、嘲讽和音效。
+这里为每位持有者设置接手后的传递冷却，并限制每个 tick 全服最多传递的次数；
+被限流的受伤事件在做任何背包或网络操作之前就被拒绝。
+"""
+from typing import Callable, Dict, Hashable, Optional
+
+# 接手山芋后多少 tick 内不能再传出
+DEFAULT_TRANSFER_COOLDOWN_TICKS = 10
+# 每个 tick 全服最多传递的次数
+DEFAULT_MAX_TRANSFERS_PER_TICK = 4
+
+
+class TransferLimiter:
+    """按持有者冷却、按 tick 限量的传递限流器"""
+
+    def __init__(self, clock: Callable[[], Optional[int]]):
+        """
+        初始化限流器
+
+        Args:
+            clock: 返回当前 tick 的函数，返回None时不限流（tick 管线未运行）
+        """
+        self._clock = clock
+        self.cooldown_ticks = DEFAULT_TRANSFER_COOLDOWN_TICKS
+        self.max_per_tick = DEFAULT_MAX_TRANSFERS_PER_TICK
+        self._ready_at: Dict[Hashable, int] = {}  # 持有者ID -> 可以再次传出的 tick
+        self._tick = None
+        self._count = 0  # 本 tick 已传递的次数
+        self.allowed = 0  # 累计放行的传递次数
+        self.throttled_cooldown = 0  # 因持有者冷却被拒绝的次数
+        self.throttled_cap = 0  # 因超过每 tick 上限被拒绝的次数
+
+    def allow(self, holder_id: Hashable) -> bool:
+        """
+        判断持有者现在能否传出山芋（只读检查，不计入本 tick 次数）
+
+        Args:
+            holder_id: 持有者ID
+
+        Returns:
+            bool: 是否允许传递
+        """
+        now = self._clock()
+        if now is None:
+            return True
+
+        ready_at = self._ready_at.get(holder_id)
+        if ready_at is not None and now < ready_at:
+            self.throttled_cooldown += 1
+            return False
+
+        if self.max_per_tick > 0 and self._tick == now and self._count >= self.max_per_tick:
+            self.throttled_cap += 1
+            return False
+        return True
+
+    def record(self, from_id: Hashable, to_id: Hashable):
+        """
+        记录一次传递：原持有者的冷却作废，新持有者开始冷却
+
+        Args:
+            from_id: 原持有者ID
+            to_id: 新持有者ID
+        """
+        self.allowed += 1
+        self._ready_at.pop(from_id, None)
+        now = self._clock()
+        if now is None:
+            return
+
+        if self._tick != now:
+            self._tick = now
+            self._count = 0
+        self._count += 1
+        if self.cooldown_ticks > 0:
+            self._ready_at[to_id] = now + self.cooldown_ticks
+
+    def forget(self, player_id: Hashable):
+        """
+        清除玩家的冷却（淘汰、离开或对局结束后调用）
+
+        Args:
+            player_id: 玩家ID
+        """
+        self._ready_at.pop(player_id, None)
+
+    def load_config(self, config: Dict):
+        """
+        读取 config.json 中的 transferLimit 字段
+
+        Args:
+            config: 配置字典
+        """
+        self.cooldown_ticks = max(0, int(config.get("cooldownTicks", DEFAULT_TRANSFER_COOLDOWN_TICKS)))
+        self.max_per_tick = max(0, int(config.get("maxPerTick", DEFAULT_MAX_TRANSFERS_PER_TICK)))
+
+    def to_config(self) -> Dict:
+        """
+        导出配置
+
+        Returns:
+            Dict: transferLimit 字段
+        """
+        return {"cooldownTicks": self.cooldown_ticks, "maxPerTick": self.max_per_tick}
@@ -0,0 +1,160 @@
+"""
+tick 预算看门狗
+
+每个 tick 统计插件占用的时间：tick 管线中的所有任务（game_tick、particle_tick、
+越界检测、跑马灯、消息与事件发送等）加上两次管线 tick 之间事件处理函数的耗时。
+连续超出预算时逐级关闭可选的工作，最后拒绝新的加入和新的竞技场；
+耗时持续回落后再逐级恢复。
+"""
+import functools
+import time
+from typing import Callable, Dict, Optional
+
+# 降级等级，每一级都包含之前所有等级的限制
+DEGRADE_NONE = 0
+DEGRADE_EFFECTS = 1  # 停止粒子与音效
+DEGRADE_MARQUEE = 2  # 停止大厅彩虹跑马灯
+DEGRADE_TAUNTS = 3  # 不再发送传递时的嘲讽消息
+DEGRADE_ADMISSION = 4  # 拒绝新的加入与新的竞技场
+
+DEGRADE_LABELS = {
+    DEGRADE_NONE: "正常",
+    DEGRADE_EFFECTS: "关闭效果",
+    DEGRADE_MARQUEE: "关闭跑马灯",
+    DEGRADE_TAUNTS: "关闭嘲讽",
+    DEGRADE_ADMISSION: "拒绝加入",
+}
+
+# 插件每个 tick 的默认预算（毫秒），服务器一个 tick 为 50ms
+DEFAULT_TICK_BUDGET_MS = 15.0
+# 超出预算的 tick 累计到这个数量时降一级（未超出的 tick 抵消一次）
+TRIP_TICKS = 20
+# 平均耗时低于预算的这个比例并持续这么多 tick 后恢复一级
+RECOVER_RATIO = 0.5
+RECOVER_TICKS = 200
+# 平均耗时的平滑系数
+COST_ALPHA = 0.1
+
+
+class Watchdog:
+    """按 tick 预算逐级降级的看门狗"""
+
+    def __init__(self, on_level_change: Optional[Callable[[int, int], None]] = None):
+        """
+        初始化看门狗
+
+        Args:
+            on_level_change: 等级变化时的回调，签名为 on_level_change(旧等级, 新等级)
+        """
+        self.enabled = True
+        self.tick_budget_ms = DEFAULT_TICK_BUDGET_MS
+        self.level = DEGRADE_NONE
+        self._on_level_change = on_level_change
+        self._event_cost = 0.0  # 上一次管线 tick 之后事件处理函数的累计耗时（秒）
+        self._overruns = 0
+        self._calm_ticks = 0
+        self.cost_ema = 0.0  # 插件每 tick 总耗时的指数移动平均（秒）
+        self.handler_costs: Dict[str, float] = {}  # 事件处理函数名称 -> 累计耗时（秒）
+        self.overrun_ticks = 0  # 累计超出预算的 tick 数量
+
+    def allows(self, level: int) -> bool:
+        """
+        判断某一级的可选工作当前是否允许执行
+
+        Args:
+            level: 降级等级（DEGRADE_*）
+
+        Returns:
+            bool: 当前降级等级低于该等级时返回True
+        """
+        return self.level < level
+
+    def charge(self, name: str, seconds: float):
+        """
+        记录一次事件处理函数的耗时，计入下一次管线 tick
+
+        Args:
+            name: 处理函数名称
+            seconds: 耗时（秒）
+        """
+        self._event_cost += seconds
+        self.handler_costs[name] = self.handler_costs.get(name, 0.0) + seconds
+
+    def observe(self, pipeline_cost: float):
+        """
+        管线每个 tick 结束时调用，判断是否降级或恢复
+
+        Args:
+            pipeline_cost: 本 tick 管线任务的耗时（秒）
+        """
+        cost = pipeline_cost + self._event_cost
+        self._event_cost = 0.0
+        self.cost_ema += (cost - self.cost_ema) * COST_ALPHA
+        if not self.enabled:
+            if self.level != DEGRADE_NONE:
+                self._set_level(DEGRADE_NONE)
+            return
+
+        budget = self.tick_budget_ms / 1000
+        if cost > budget:
+            self.overrun_ticks += 1
+            self._overruns += 1
+            self._calm_ticks = 0
+            if self._overruns >= TRIP_TICKS and self.level < DEGRADE_ADMISSION:
+                self._overruns = 0
+                self._set_level(self.level + 1)
+            return
+
+        self._overruns = max(self._overruns - 1, 0)
+        if self.level == DEGRADE_NONE:
+            return
+        if self.cost_ema < budget * RECOVER_RATIO:
+            self._calm_ticks += 1
+            if self._calm_ticks >= RECOVER_TICKS:
+                self._calm_ticks = 0
+                self._set_level(self.level - 1)
+        else:
+            self._calm_ticks = 0
+
+    def load_config(self, config: Dict):
+        """
+        读取 config.json 中的 watchdog 字段
+
+        Args:
+            config: 配置字典
+        """
+        self.enabled = bool(config.get("enabled", True))
+        self.tick_budget_ms = float(config.get("tickBudgetMs", DEFAULT_TICK_BUDGET_MS))
+
+    def to_config(self) -> Dict:
+        """
+        导出配置
+
+        Returns:
+            Dict: watchdog 字段
+        """
+        return {"enabled": self.enabled, "tickBudgetMs": self.tick_budget_ms}
+
+    def _set_level(self, level: int):
+        previous, self.level = self.level, level
+        if self._on_level_change is not None:
+            self._on_level_change(previous, level)
+
+
+def timed(method):
+    """
+    统计插件方法耗时的装饰器，耗时计入所属对象的 watchdog
+
+    放在 @event_handler 之下使用，保留原方法的签名与事件类型注解。
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.watchdog.charge(name, time.perf_counter() - started)
+
+    return wrapper